@@ -0,0 +1,191 @@
+#------------------------------------------------------------------
+# Benchmarks of CConic, corigin and ctol.
+#
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Callable
+from pyConics import CPoint, CLine, CConic, corigin, ctol, cconst
+from common import benchmark
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+SIZES = ( 1, 10, 100, 1000 )
+
+#------------------------------------------------------------------
+# Input data.
+#
+def _conic() -> CConic:
+    return CConic( 2.0, 1.0, 30.0 / 180 * cconst.pi, CPoint( ( 0.5, -0.5 ) ) )
+
+def _five_points( n: int ) -> np.ndarray:
+    # A ( n, 5, 3 )-stack of random points.
+    P = np.ones( ( n, 5, 3 ) )
+    P[ ..., 0 : 2 ] = np.random.default_rng( 1 ).uniform( -10.0, 10.0, ( n, 5, 2 ) )
+    return P
+
+#------------------------------------------------------------------
+# CConic.__mul__.
+#
+@benchmark( 'CConic.__mul__[point]', SIZES )
+def bench_conic_polar( n: int ) -> Callable[ [], Any ]:
+    C = _conic()
+    xy = np.random.default_rng( 1 ).uniform( -10.0, 10.0, ( n, 2 ) )
+    P = [ CPoint( ( x, y ) ) for x, y in xy ]
+    return lambda: [ C * p for p in P ]
+
+@benchmark( 'CConic.__mul__[line]', SIZES )
+def bench_conic_pole( n: int ) -> Callable[ [], Any ]:
+    C = _conic()
+    abc = np.random.default_rng( 1 ).uniform( -10.0, 10.0, ( n, 3 ) )
+    L = [ CLine( ( a, b, c ) ) for a, b, c in abc ]
+    return lambda: [ C * l for l in L ]
+
+@benchmark( 'CConic.center+axes+area', SIZES )
+def bench_conic_center_axes_area( n: int ) -> Callable[ [], Any ]:
+    C = _conic()
+    return lambda: [ ( C.center(), C.axes(), C.area() ) for _ in range( n ) ]
+
+@benchmark( 'CConic.canonical', SIZES )
+def bench_canonical( n: int ) -> Callable[ [], Any ]:
+    C = [ CConic( 2.0, 1.0, a, CPoint( ( 0.5, -0.5 ) ) ) for a in np.linspace( 0.0, cconst.pi, n ) ]
+    return lambda: [ C.canonical() for C in C ]
+
+@benchmark( 'CConicArray.canonical', SIZES + ( 10000, 100000 ) )
+def bench_canonical_many( n: int ) -> Callable[ [], Any ]:
+    from pyConics import CConicArray
+
+    CC = CConicArray( [ CConic( 2.0, 1.0, a, CPoint( ( 0.5, -0.5 ) ) ) for a in np.linspace( 0.0, cconst.pi, min( n, 100 ) ) ] )
+    CC = CConicArray( np.resize( CC.gform, ( n, 3, 3 ) ), shift_origin = False )
+    return lambda: CC.canonical()
+
+@benchmark( 'CConic.intersect_lines', SIZES + ( 10000, 100000 ) )
+def bench_intersect_lines( n: int ) -> Callable[ [], Any ]:
+    from pyConics import CLineArray
+
+    C = _conic()
+    L = CLineArray( np.random.default_rng( 1 ).uniform( -1.0, 1.0, ( n, 3 ) ) )
+    return lambda: C.intersect_lines( L )
+
+@benchmark( 'CConic.tangents_from', SIZES + ( 10000, 100000 ) )
+def bench_tangents_from( n: int ) -> Callable[ [], Any ]:
+    from pyConics import CPointArray
+
+    C = _conic()
+    P = CPointArray( np.random.default_rng( 1 ).uniform( -10.0, 10.0, ( n, 2 ) ) )
+    return lambda: C.tangents_from( P )
+
+@benchmark( 'CConic.intersect', SIZES )
+def bench_intersect( n: int ) -> Callable[ [], Any ]:
+    C1 = _conic()
+    C2 = [ CConic( 1.0, 2.0, a, CPoint( ( 0.0, 0.0 ) ) ) for a in np.linspace( 0.0, cconst.pi, n ) ]
+    return lambda: [ C1.intersect( C ) for C in C2 ]
+
+@benchmark( 'CConicArray.intersect', SIZES + ( 10000, 100000 ) )
+def bench_intersect_many( n: int ) -> Callable[ [], Any ]:
+    from pyConics import CConicArray
+
+    C1 = _conic()
+    CC = CConicArray( [ CConic( 1.0, 2.0, a, CPoint( ( 0.0, 0.0 ) ) ) for a in np.linspace( 0.0, cconst.pi, min( n, 100 ) ) ] )
+    CC = CConicArray( np.resize( CC.gform, ( n, 3, 3 ) ), shift_origin = False )
+    return lambda: CC.intersect( C1 )
+
+@benchmark( 'CConic.from_points', SIZES )
+def bench_from_points( n: int ) -> Callable[ [], Any ]:
+    P = _five_points( n )
+    return lambda: [ CConic.from_points( p ) for p in P ]
+
+@benchmark( 'CConicArray.from_points', SIZES + ( 10000, 100000 ) )
+def bench_from_points_many( n: int ) -> Callable[ [], Any ]:
+    from pyConics import CConicArray
+
+    P = _five_points( n )
+    return lambda: CConicArray.from_points( P )
+
+#------------------------------------------------------------------
+# fit_conic. n is the number of points.
+#
+@benchmark( 'fit_conic[algebraic]', ( 1000, 10000, 100000, 1000000 ), 'macro' )
+def bench_fit_conic( n: int ) -> Callable[ [], Any ]:
+    from pyConics import fit_conic
+
+    t = np.random.default_rng( 1 ).uniform( 0.0, 2.0 * cconst.pi, n )
+    xy = np.stack( [ 2.0 * np.cos( t ) + 0.5, np.sin( t ) - 0.5 ], axis = 1 )
+    return lambda: fit_conic( xy )
+
+@benchmark( 'fit_conic[ellipse]', ( 1000, 10000, 100000, 1000000 ), 'macro' )
+def bench_fit_ellipse( n: int ) -> Callable[ [], Any ]:
+    from pyConics import fit_conic
+
+    t = np.random.default_rng( 1 ).uniform( 0.0, 2.0 * cconst.pi, n )
+    xy = np.stack( [ 2.0 * np.cos( t ) + 0.5, np.sin( t ) - 0.5 ], axis = 1 )
+    return lambda: fit_conic( xy, method = 'ellipse' )
+
+@benchmark( 'CConicFitter.update+conic', ( 10, 100, 1000, 10000 ), 'macro' )
+def bench_fitter( n: int ) -> Callable[ [], Any ]:
+    from pyConics import CConicFitter
+
+    # One chunk of n points after a history of 100 chunks.
+    t = np.random.default_rng( 1 ).uniform( 0.0, 2.0 * cconst.pi, n )
+    xy = np.stack( [ 2.0 * np.cos( t ) + 0.5, np.sin( t ) - 0.5 ], axis = 1 )
+    F = CConicFitter( forget = 0.999 )
+    for _ in range( 100 ):
+        F.update( xy )
+    def update() -> CConic:
+        F.update( xy )
+        return F.conic()
+    return update
+
+#------------------------------------------------------------------
+# CConic.sequence. n is the number of samples per axis.
+#
+@benchmark( 'CConic.sequence[ellipse]', ( 11, 51, 101, 201 ), 'macro' )
+def bench_sequence_ellipse( n: int ) -> Callable[ [], Any ]:
+    C = _conic()
+    x = np.linspace( -3.0, 3.0, n )
+    return lambda: C.sequence( x )
+
+@benchmark( 'CConic.sequence[hyperbola]', ( 11, 51, 101, 201 ), 'macro' )
+def bench_sequence_hyperbola( n: int ) -> Callable[ [], Any ]:
+    C = CConic( 1.0, 2.0, 0.0, CPoint( ( 0.0, 0.0 ) ) )
+    x = np.linspace( -5.0, 5.0, n )
+    return lambda: C.sequence( x )
+
+@benchmark( 'CConic.sequence[contour]', ( 11, 51, 101, 201 ), 'macro' )
+def bench_sequence_contour( n: int ) -> Callable[ [], Any ]:
+    C = _conic()
+    x = np.linspace( -3.0, 3.0, n )
+    return lambda: C.sequence( x, method = 'contour' )
+
+@benchmark( 'CConic.sequence[degenerate]', ( 11, 51, 101, 201 ), 'macro' )
+def bench_sequence_degenerate( n: int ) -> Callable[ [], Any ]:
+    C = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, 0.0 ) ) ) )
+    x = np.linspace( -3.0, 3.0, n )
+    return lambda: C.sequence( x )
+
+#------------------------------------------------------------------
+# corigin.change_conic. The origin is restored by the runner.
+#
+@benchmark( 'corigin.change_conic', SIZES )
+def bench_change_conic( n: int ) -> Callable[ [], Any ]:
+    M = [ _conic().gform for _ in range( n ) ]
+    corigin.x = 1.5
+    corigin.y = -0.5
+    return lambda: [ corigin.change_conic( m ) for m in M ]
+
+#------------------------------------------------------------------
+# ctol.adjust2relzeros.
+#
+@benchmark( 'ctol.adjust2relzeros', SIZES )
+def bench_adjust2relzeros( n: int ) -> Callable[ [], Any ]:
+    X = list( np.random.default_rng( 1 ).uniform( -1.0, 1.0, ( n, 3 ) ) * [ 1e-7, 1.0, 1e3 ] )
+    return lambda: [ ctol.adjust2relzeros( x ) for x in X ]
+
+@benchmark( 'ctol.adjust2relzeros_many', SIZES + ( 10000, 100000 ) )
+def bench_adjust2relzeros_many( n: int ) -> Callable[ [], Any ]:
+    X = np.random.default_rng( 1 ).uniform( -1.0, 1.0, ( n, 3 ) ) * [ 1e-7, 1.0, 1e3 ]
+    return lambda: ctol.adjust2relzeros_many( X )
@@ -0,0 +1,113 @@
+#------------------------------------------------------------------
+# Benchmarks of the multilateration ( MLAT ) functions.
+#
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Callable
+from pyConics import CPoint, CConic, tdoa_hyperbolae, station_pairs, solve_tdoa, CMlatPipeline, CMlatPool, CStations
+from common import benchmark
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+SIZES = ( 1, 10, 100, 1000 )
+
+#------------------------------------------------------------------
+# Input data.
+#
+STATIONS = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+
+def _rdiff( n: int ) -> np.ndarray:
+    # Range differences of n emitters for all pairs of stations.
+    X = np.random.default_rng( 1 ).uniform( 0.0, 10.0, ( n, 2 ) )
+    D = np.linalg.norm( X[ :, np.newaxis ] - STATIONS, axis = 2 )
+    pairs = station_pairs( len( STATIONS ) )
+    return D[ :, pairs[ :, 0 ] ] - D[ :, pairs[ :, 1 ] ]
+
+def _rho( n: int ) -> np.ndarray:
+    # Noisy pseudo-ranges of n emitters at all stations.
+    rng = np.random.default_rng( 1 )
+    X = rng.uniform( 0.0, 10.0, ( n, 2 ) )
+    D = np.linalg.norm( X[ :, np.newaxis ] - STATIONS, axis = 2 )
+    return D + rng.uniform( 0.0, 100.0, ( n, 1 ) ) + rng.normal( 0.0, 0.01, D.shape )
+
+#------------------------------------------------------------------
+# TDOA hyperbolae. n is the number of emitters ( 6 pairs each ).
+#
+@benchmark( 'CConic[foci] per pair', SIZES )
+def bench_foci_constructor( n: int ) -> Callable[ [], Any ]:
+    R = _rdiff( n )
+    pairs = station_pairs( len( STATIONS ) )
+    F = [ ( CPoint( tuple( STATIONS[ i ] ) ), CPoint( tuple( STATIONS[ j ] ) ) ) for i, j in pairs ]
+    return lambda: [ CConic( abs( r ) / 2, foci = F[ p ] ) for rr in R for p, r in enumerate( rr ) ]
+
+@benchmark( 'CStations.hyperbola per pair', SIZES )
+def bench_stations_hyperbola( n: int ) -> Callable[ [], Any ]:
+    R = _rdiff( n )
+    stations = CStations( STATIONS )
+    return lambda: [ stations.hyperbola( p, r ) for rr in R for p, r in enumerate( rr ) ]
+
+@benchmark( 'mlat.tdoa_hyperbolae', SIZES + ( 10000, 100000 ) )
+def bench_tdoa_hyperbolae( n: int ) -> Callable[ [], Any ]:
+    R = _rdiff( n )
+    return lambda: tdoa_hyperbolae( STATIONS, R )
+
+@benchmark( 'mlat.tdoa_hyperbolae[CStations]', SIZES + ( 10000, 100000 ) )
+def bench_tdoa_hyperbolae_stations( n: int ) -> Callable[ [], Any ]:
+    R = _rdiff( n )
+    stations = CStations( STATIONS )
+    return lambda: tdoa_hyperbolae( stations, R )
+
+#------------------------------------------------------------------
+# MLAT solver. n is the number of emitters.
+#
+@benchmark( 'mlat.solve_tdoa per emitter', SIZES )
+def bench_solve_tdoa_loop( n: int ) -> Callable[ [], Any ]:
+    R = _rho( n )
+    return lambda: [ solve_tdoa( STATIONS, r[ np.newaxis ], sigma = 0.01 ) for r in R ]
+
+@benchmark( 'mlat.solve_tdoa', SIZES + ( 10000, 100000 ) )
+def bench_solve_tdoa( n: int ) -> Callable[ [], Any ]:
+    R = _rho( n )
+    return lambda: solve_tdoa( STATIONS, R, sigma = 0.01 )
+
+#------------------------------------------------------------------
+# MLAT solver on a process pool. n is the number of emitters. The pools
+# are started once and kept by the module, so the times do not include
+# the start of the workers. Compare them with 'mlat.solve_tdoa' to see
+# the scaling.
+#
+_pools: dict[ int, CMlatPool ] = {}
+
+def _pool_benchmark( workers: int ) -> None:
+    @benchmark( f'mlat.CMlatPool.solve_tdoa[workers={workers}]', ( 10000, 100000, 1000000 ), 'macro' )
+    def bench_pool( n: int ) -> Callable[ [], Any ]:
+        if ( workers not in _pools ):
+            _pools[ workers ] = CMlatPool( STATIONS, workers )
+        R = _rho( n )
+        return lambda: _pools[ workers ].solve_tdoa( R, sigma = 0.01 )
+
+for workers in ( 1, 2, 4 ):
+    _pool_benchmark( workers )
+
+#------------------------------------------------------------------
+# Streaming pipeline. n is the number of events ( 4 records each ).
+#
+def _pipeline_benchmark( hyperbolae: bool ) -> None:
+    name = 'mlat.CMlatPipeline.run' + ( '[hyperbolae]' if ( hyperbolae ) else '' )
+    @benchmark( name, ( 1000, 10000, 100000 ), 'macro' )
+    def bench_pipeline( n: int ) -> Callable[ [], Any ]:
+        R = _rho( n )
+        records = np.stack( [ np.repeat( np.arange( n ), len( STATIONS ) ),
+                              np.tile( np.arange( len( STATIONS ) ), n ), R.reshape( -1 ) ], axis = 1 )
+        def run() -> int:
+            pipeline = CMlatPipeline( STATIONS, sigma = 0.01, hyperbolae = hyperbolae )
+            return sum( len( ids ) for ids, *_ in pipeline.run( [ records ] ) )
+        return run
+
+for hyperbolae in ( False, True ):
+    _pipeline_benchmark( hyperbolae )
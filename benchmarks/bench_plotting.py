@@ -0,0 +1,60 @@
+#------------------------------------------------------------------
+# Benchmarks of CAxes.plot.
+#
+# The Agg backend is used, so nothing is shown on screen. Each
+# callable plots n objects and clears the axes afterwards.
+#
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Callable
+from pyConics import CPoint, CLine, CConic
+from common import benchmark
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+SIZES = ( 1, 10, 50 )
+
+#------------------------------------------------------------------
+# Input data.
+#
+def _axes() -> Any:
+    import matplotlib
+    matplotlib.use( 'Agg' )
+    from pyConics import CFigure
+
+    f = CFigure()
+    f.create_axes()
+    return f.axes[ 0 ]
+
+def _plot( ax: Any, objs: list[ Any ] ) -> None:
+    ax.plot( *objs )
+    ax.get_pyplot_axes().cla()
+
+#------------------------------------------------------------------
+# CAxes.plot.
+#
+@benchmark( 'CAxes.plot[points]', SIZES, 'macro' )
+def bench_plot_points( n: int ) -> Callable[ [], Any ]:
+    ax = _axes()
+    xy = np.random.default_rng( 1 ).uniform( 0.0, 1.0, ( n, 2 ) )
+    P = [ CPoint( ( x, y ) ) for x, y in xy ]
+    return lambda: _plot( ax, P )
+
+@benchmark( 'CAxes.plot[lines]', SIZES, 'macro' )
+def bench_plot_lines( n: int ) -> Callable[ [], Any ]:
+    ax = _axes()
+    abc = np.random.default_rng( 1 ).uniform( -1.0, 1.0, ( n, 3 ) )
+    L = [ CLine( ( a, b, c ) ) for a, b, c in abc ]
+    return lambda: _plot( ax, L )
+
+@benchmark( 'CAxes.plot[conics]', SIZES, 'macro' )
+def bench_plot_conics( n: int ) -> Callable[ [], Any ]:
+    ax = _axes()
+    a = np.random.default_rng( 1 ).uniform( 0.2, 0.4, n )
+    C = [ CConic( ai, ai / 2, 0.3, CPoint( ( 0.5, 0.5 ) ) ) for ai in a ]
+    return lambda: _plot( ax, C )
@@ -0,0 +1,111 @@
+#------------------------------------------------------------------
+# Benchmarks of pyConics.utils functions.
+#
+# Scalar functions are timed over n pairs of objects, so their
+# numbers are comparable with the array kernels over n rows.
+#
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Callable
+from pyConics import CPoint, CLine, CPointArray, CLineArray
+from pyConics.utils import cross, dot, distance, are_parallel, distance_matrix
+from common import benchmark
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+SIZES = ( 1, 10, 100, 1000 )
+
+#------------------------------------------------------------------
+# Input data.
+#
+def _points( n: int, seed: int ) -> list[ CPoint ]:
+    xy = np.random.default_rng( seed ).uniform( -10.0, 10.0, ( n, 2 ) )
+    return [ CPoint( ( x, y ) ) for x, y in xy ]
+
+def _lines( n: int, seed: int ) -> list[ CLine ]:
+    abc = np.random.default_rng( seed ).uniform( -10.0, 10.0, ( n, 3 ) )
+    return [ CLine( ( a, b, c ) ) for a, b, c in abc ]
+
+def _parallel_lines( n: int, seed: int ) -> list[ CLine ]:
+    c = np.random.default_rng( seed ).uniform( -10.0, 10.0, n )
+    return [ CLine( ( 1.0, -2.0, ci ) ) for ci in c ]
+
+#------------------------------------------------------------------
+# cross.
+#
+@benchmark( 'utils.cross[point,point]', SIZES )
+def bench_cross_points( n: int ) -> Callable[ [], Any ]:
+    P1, P2 = _points( n, 1 ), _points( n, 2 )
+    return lambda: [ cross( p1, p2 ) for p1, p2 in zip( P1, P2 ) ]
+
+@benchmark( 'utils.cross[line,line]', SIZES )
+def bench_cross_lines( n: int ) -> Callable[ [], Any ]:
+    L1, L2 = _lines( n, 1 ), _lines( n, 2 )
+    return lambda: [ cross( l1, l2 ) for l1, l2 in zip( L1, L2 ) ]
+
+@benchmark( 'utils.cross[line,line|parallel]', SIZES )
+def bench_cross_parallel_lines( n: int ) -> Callable[ [], Any ]:
+    L1, L2 = _parallel_lines( n, 1 ), _parallel_lines( n, 2 )
+    return lambda: [ cross( l1, l2 ) for l1, l2 in zip( L1, L2 ) ]
+
+@benchmark( 'utils.cross[array,array]', SIZES + ( 10000, 100000 ) )
+def bench_cross_arrays( n: int ) -> Callable[ [], Any ]:
+    P1 = CPointArray( np.random.default_rng( 1 ).uniform( -10.0, 10.0, ( n, 2 ) ) )
+    P2 = CPointArray( np.random.default_rng( 2 ).uniform( -10.0, 10.0, ( n, 2 ) ) )
+    return lambda: cross( P1, P2 )
+
+#------------------------------------------------------------------
+# dot.
+#
+@benchmark( 'utils.dot[point,line]', SIZES )
+def bench_dot( n: int ) -> Callable[ [], Any ]:
+    P, L = _points( n, 1 ), _lines( n, 2 )
+    return lambda: [ dot( p, l ) for p, l in zip( P, L ) ]
+
+#------------------------------------------------------------------
+# distance.
+#
+@benchmark( 'utils.distance[point,point]', SIZES )
+def bench_distance_points( n: int ) -> Callable[ [], Any ]:
+    P1, P2 = _points( n, 1 ), _points( n, 2 )
+    return lambda: [ distance( p1, p2 ) for p1, p2 in zip( P1, P2 ) ]
+
+@benchmark( 'utils.distance[point,line]', SIZES )
+def bench_distance_point_line( n: int ) -> Callable[ [], Any ]:
+    P, L = _points( n, 1 ), _lines( n, 2 )
+    return lambda: [ distance( p, l ) for p, l in zip( P, L ) ]
+
+@benchmark( 'utils.distance[line,line|parallel]', SIZES )
+def bench_distance_lines( n: int ) -> Callable[ [], Any ]:
+    L1, L2 = _parallel_lines( n, 1 ), _parallel_lines( n, 2 )
+    return lambda: [ distance( l1, l2 ) for l1, l2 in zip( L1, L2 ) ]
+
+@benchmark( 'utils.distance_matrix[array,array]', ( 10, 100, 1000 ) )
+def bench_distance_matrix( n: int ) -> Callable[ [], Any ]:
+    P = CPointArray( np.random.default_rng( 1 ).uniform( -10.0, 10.0, ( n, 2 ) ) )
+    L = CLineArray( np.random.default_rng( 2 ).uniform( -10.0, 10.0, ( n, 3 ) ) )
+    return lambda: distance_matrix( P, L )
+
+#------------------------------------------------------------------
+# are_parallel.
+#
+@benchmark( 'utils.are_parallel', SIZES )
+def bench_are_parallel( n: int ) -> Callable[ [], Any ]:
+    L1, L2 = _lines( n, 1 ), _lines( n, 2 )
+    return lambda: [ are_parallel( l1, l2 ) for l1, l2 in zip( L1, L2 ) ]
+
+#------------------------------------------------------------------
+# Import of the package without the plotting stack. Each call starts a
+# new interpreter, so its start-up time is included.
+#
+@benchmark( 'import pyConics', ( 1, ), 'macro' )
+def bench_import( n: int ) -> Callable[ [], Any ]:
+    import subprocess
+    import sys
+
+    return lambda: subprocess.run( [ sys.executable, '-c', 'import numpy, pyConics' ], check = True )
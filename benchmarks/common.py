@@ -0,0 +1,50 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'CBenchmark', 'benchmark', 'registry' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from dataclasses import dataclass
+from typing import Any, Callable
+
+#------------------------------------------------------------------
+# Data Class CBenchmark.
+#
+@dataclass
+class CBenchmark:
+    name: str                                   # e.g. 'utils.cross[point,point]'.
+    setup: Callable[ [ int ], Callable[ [], Any ] ] # setup( n ) returns the timed callable.
+    sizes: tuple[ int, ... ]                    # Input sizes ( number of objects, samples... ).
+    group: str = 'micro'                        # 'micro' or 'macro'.
+
+#------------------------------------------------------------------
+# Registry of benchmarks. Each bench_*.py module fills it in
+# by means of the benchmark decorator.
+#
+registry: list[ CBenchmark ] = []
+
+def benchmark( name: str, sizes: tuple[ int, ... ], group: str = 'micro' ) -> Callable:
+    def decorator( setup: Callable[ [ int ], Callable[ [], Any ] ] ) -> Callable:
+        registry.append( CBenchmark( name, setup, sizes, group ) )
+        return setup
+    return decorator
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    @benchmark( 'dummy', ( 1, 10 ) )
+    def bench_dummy( n: int ) -> Callable[ [], Any ]:
+        data = list( range( n ) )
+        return lambda: sum( data )
+
+    for b in registry:
+        print( b )
+        print( b.setup( 10 )() )
@@ -0,0 +1,152 @@
+#------------------------------------------------------------------
+# Runner of the pyConics benchmark suite.
+#
+# Usage ( from the repository root ):
+#   python benchmarks/run.py                          # run all benchmarks.
+#   python benchmarks/run.py -k cross --max-size 100  # run a subset.
+#   python benchmarks/run.py --save base.json         # store the results.
+#   python benchmarks/run.py --compare base.json      # compare against a baseline.
+#
+# The exit code is 1 when a comparison finds a regression.
+#
+
+#------------------------------------------------------------------
+# Import from...
+#
+from __future__ import annotations
+from datetime import datetime
+from typing import Any
+
+#------------------------------------------------------------------
+# Import as...
+#
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import timeit
+
+import numpy as np
+
+#------------------------------------------------------------------
+# Modules of the suite. Each one registers its benchmarks when it
+# is imported.
+#
+MODULES = ( 'bench_utils', 'bench_conics', 'bench_mlat', 'bench_plotting' )
+
+#------------------------------------------------------------------
+# Run.
+#
+def run_benchmark( fn: Any, repeat: int, min_time: float ) -> float:
+    # Return the best time of one call, in seconds.
+    timer = timeit.Timer( fn )
+    number, t = timer.autorange()
+    number = max( 1, int( number * min_time / max( t, 1e-9 ) ) )
+    return min( timer.repeat( repeat = repeat, number = number ) ) / number
+
+def run( args: argparse.Namespace ) -> dict[ str, Any ]:
+    from pyConics import corigin
+    from common import registry
+
+    # matplotlib is not loaded when only micro benchmarks are run.
+    for module in MODULES:
+        if ( ( args.group == 'micro' ) and ( module == 'bench_plotting' ) ):
+            continue
+        importlib.import_module( module )
+
+    results: dict[ str, dict[ str, float ] ] = {}
+    for b in registry:
+        if ( ( args.group != 'all' ) and ( b.group != args.group ) ):
+            continue
+        if ( ( args.k is not None ) and ( args.k not in b.name ) ):
+            continue
+
+        results[ b.name ] = {}
+        for n in b.sizes:
+            if ( ( args.max_size is not None ) and ( n > args.max_size ) ):
+                continue
+            fn = b.setup( n )
+            t = run_benchmark( fn, args.repeat, args.min_time )
+            corigin.reset()
+            results[ b.name ][ str( n ) ] = t
+            print( f'{b.name:<40} n = {n:>7}  {_fmt( t ):>10}  {_fmt( t / n ):>10}/item' )
+
+    return { 'meta': _meta(), 'results': results }
+
+#------------------------------------------------------------------
+# Compare.
+#
+def compare( new: dict[ str, Any ], base: dict[ str, Any ], threshold: float ) -> bool:
+    # Return True when some benchmark is slower than threshold times its baseline.
+    regression = False
+    print()
+    print( f'{"benchmark":<40} {"n":>9}  {"baseline":>10}  {"current":>10}  {"ratio":>6}' )
+    for name, sizes in new[ 'results' ].items():
+        for n, t in sizes.items():
+            t0 = base[ 'results' ].get( name, {} ).get( n )
+            if ( t0 is None ):
+                print( f'{name:<40} {n:>9}  {"-":>10}  {_fmt( t ):>10}  {"new":>6}' )
+                continue
+
+            ratio = t / t0
+            flag = ''
+            if ( ratio > threshold ):
+                flag = '  <- regression'
+                regression = True
+            print( f'{name:<40} {n:>9}  {_fmt( t0 ):>10}  {_fmt( t ):>10}  {ratio:>6.2f}{flag}' )
+    return regression
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _fmt( t: float ) -> str:
+    for unit, scale in ( ( 's', 1.0 ), ( 'ms', 1e-3 ), ( 'us', 1e-6 ) ):
+        if ( t >= scale ):
+            return f'{t / scale:.3f} {unit}'
+    return f'{t / 1e-9:.1f} ns'
+
+def _meta() -> dict[ str, str ]:
+    return { 'date': datetime.now().isoformat( timespec = 'seconds' ),
+             'python': platform.python_version(),
+             'numpy': np.__version__,
+             'machine': platform.machine(),
+             'system': platform.platform() }
+
+def _parse( argv: list[ str ] ) -> argparse.Namespace:
+    parser = argparse.ArgumentParser( description = 'Run the pyConics benchmark suite.' )
+    parser.add_argument( '-k', default = None, help = 'run only benchmarks whose name contains K.' )
+    parser.add_argument( '--group', choices = ( 'all', 'micro', 'macro' ), default = 'all' )
+    parser.add_argument( '--max-size', type = int, default = None, help = 'skip larger input sizes.' )
+    parser.add_argument( '--repeat', type = int, default = 5 )
+    parser.add_argument( '--min-time', type = float, default = 0.05,
+                         help = 'minimum time of each repetition, in seconds.' )
+    parser.add_argument( '--save', default = None, help = 'store the results in a JSON file.' )
+    parser.add_argument( '--compare', default = None, help = 'JSON file with baseline results.' )
+    parser.add_argument( '--threshold', type = float, default = 1.25,
+                         help = 'slowdown ratio that is reported as a regression.' )
+    return parser.parse_args( argv )
+
+#------------------------------------------------------------------
+# Main.
+#
+def main( argv: list[ str ] | None = None ) -> int:
+    args = _parse( sys.argv[ 1 : ] if ( argv is None ) else argv )
+
+    # bench_*.py modules import common from this directory.
+    sys.path.insert( 0, os.path.dirname( os.path.abspath( __file__ ) ) )
+
+    new = run( args )
+    if ( args.save is not None ):
+        with open( args.save, 'w' ) as f:
+            json.dump( new, f, indent = 2 )
+
+    if ( args.compare is not None ):
+        with open( args.compare ) as f:
+            base = json.load( f )
+        return 1 if ( compare( new, base, args.threshold ) ) else 0
+    return 0
+
+if __name__ == '__main__':
+    sys.exit( main() )
@@ -4,20 +4,45 @@
 # It defines a package in Python.
 #
 
-#------------------------------------------------------------------
-# read version from installed package
-#
-from importlib.metadata import version
-__version__ = version( 'pyConics' )
-
 #------------------------------------------------------------------
 # Modules that belong to pyConics package.
 #
+from types import ModuleType as _ModuleType
 from pyConics.origin import *
 from pyConics.tolerance import *
 from pyConics.constants import *
 from pyConics.point import *
+from pyConics.pointarray import *
 from pyConics.line import *
-
-from pyConics.plotting import *
+from pyConics.linearray import *
 from pyConics.conics import *
+from pyConics.mlat import *
+
+#------------------------------------------------------------------
+# The plotting stack (matplotlib and pyautogui) is only loaded when
+# CFigure, CAxes or the plotting module are used for the first time.
+# The version is read from the installed package metadata on first
+# access as well. They are listed in __all__, so "from pyConics import *"
+# still exports them.
+#
+_lazy_plotting = ( 'CFigure', 'CAxes' )
+
+__all__ = [ name for name, obj in globals().items()
+            if ( ( not name.startswith( '_' ) ) and ( not isinstance( obj, _ModuleType ) ) ) ] + \
+          list( _lazy_plotting )
+
+def __getattr__( name: str ):
+    if ( ( name in _lazy_plotting ) or ( name == 'plotting' ) ):
+        import importlib
+        plotting = importlib.import_module( 'pyConics.plotting' )
+        return plotting if ( name == 'plotting' ) else getattr( plotting, name )
+
+    # read version from installed package.
+    if ( name == '__version__' ):
+        from importlib.metadata import version
+        globals()[ '__version__' ] = version( 'pyConics' )
+        return globals()[ '__version__' ]
+    raise AttributeError( f'module {__name__!r} has no attribute {name!r}' )
+
+def __dir__() -> list[ str ]:
+    return sorted( set( globals() ) | set( _lazy_plotting ) | { 'plotting', '__version__' } )
@@ -32,6 +32,9 @@ import numpy as np
 # Abstract Base Class AGObj.
 #  
 class CAGObj( ABC ):
+    # Instances do not carry a __dict__.
+    __slots__ = ( '_name', '_gform', '_from_origin' )
+
     @abstractmethod
     def __init__( self, name: str = '' ) -> None:
         # Set the name of the AGObject.
@@ -8,3 +8,5 @@
 # Modules that belong to pyConics.conics package.
 #
 from pyConics.conics.conic import *
+from pyConics.conics.conicarray import *
+from pyConics.conics.fitting import *
@@ -11,9 +11,7 @@ __all__ = [ 'CConic' ]
 #------------------------------------------------------------------
 # Import from...
 #
-from typing import Any
-from matplotlib import pyplot as plt
-from matplotlib.path import Path
+from typing import Any, Sequence
 from numpy import linalg as LA
 
 #------------------------------------------------------------------
@@ -28,13 +26,17 @@ if TYPE_CHECKING:
 
 from pyConics.constants import cconst
 from pyConics.agobj import CAGObj
-from pyConics.errors import CTypeError, CConicTypeError
+from pyConics.errors import CTypeError, CValueError, CConicTypeError
 from pyConics.origin import corigin
 from pyConics.tolerance import ctol
 from pyConics.conics.utils import create_conic_from_lines, create_conic
-from pyConics.conics.utils import rank
+from pyConics.conics.utils import rank, sample_conic, contour_conic
+from pyConics.conics.utils import intersect_lines_many, intersect_conics_many, adjugate
+from pyConics.conics.utils import CONIC_TYPES, canonical_many, conic_from_points_many, tangents_from_many
 from pyConics.point import CPoint
 from pyConics.line import CLine
+from pyConics.pointarray import CPointArray
+from pyConics.linearray import CLineArray
 
 #------------------------------------------------------------------
 # Import as...
@@ -46,8 +48,7 @@ np.set_printoptions( formatter = { 'float': lambda x: "{0:0.4e}".format( x ) } )
 # Class CConic.
 #  
 class CConic( CAGObj ):
-    # from pyConics.point import CPoint
-    # from pyConics.line import CLine
+    __slots__ = ( '_rank', '_lines4deg', '_cache' )
 
     def __init__( self,
                   a: float = 1.0, # by default, it is created a circle with
@@ -68,6 +69,10 @@ class CConic( CAGObj ):
         # 4) Fourth: if no parameter was defined, then a circle is created.
         super().__init__( name )
 
+        # Derived quantities of _gform ( inverse, determinant... ) are
+        # computed on demand and kept until _gform changes.
+        self._cache: dict[ str, Any ] = {}
+
         # We need to keep the main parameters saved, so that it is possible
         # to recover them.
         # Each precedence will be analyzed.
@@ -80,7 +85,7 @@ class CConic( CAGObj ):
             else:
                 self._lines4deg = ( degenerate[ 0 ].copy(), degenerate[ 1 ].copy() )
                 self._gform = create_conic_from_lines( self._lines4deg )
-                self._from_origin = self._gform.copy()
+                self._from_origin = self._gform
         # 2) the parameter foci, and a were defined.
         #    the parameters c, center, and angle will be find out through foci.
         #    the parameter degenerate is not used.
@@ -116,11 +121,50 @@ class CConic( CAGObj ):
         # Create the nondegenerate conic.
         if ( self._lines4deg is None ):
             self._gform = create_conic( a, c, center, angle )
-            self._from_origin = self._gform.copy()
+            self._from_origin = self._gform
 
         # Get the matrix rank.
         self._rank = rank( self._gform )
 
+    @classmethod
+    def from_matrix( cls, M: np.ndarray, name: str = '', *, rank: int | None = None,
+                     shift_origin: bool = False ) -> CConic:
+        # Trusted constructor. M must be a symmetric float ( 3, 3 )-matrix
+        # that has already been adjusted to relative zeros. It is neither
+        # validated nor copied. The rank of M is only computed when it is
+        # not given. When shift_origin is True, M is related to the origin
+        # ( 0, 0 ) and it is translated to the current origin.
+        from pyConics.conics.utils import rank as get_rank
+
+        C = cls.__new__( cls )
+        C.name = name
+        C._gform = corigin.change_conics( M[ np.newaxis ] )[ 0 ] if ( shift_origin ) else M
+        C._from_origin = M
+        C._lines4deg = None
+        C._cache = {}
+        C._rank = get_rank( M ) if ( rank is None ) else rank
+        return C
+
+    @classmethod
+    def from_points( cls, points: CPointArray | Sequence[ CPoint ] | np.ndarray, name: str = '' ) -> CConic:
+        # Build the conic through five points. They are given by a
+        # CPointArray, a sequence of CPoints or a ( 5, 3 )-matrix of
+        # homogeneous coords related to the origin ( 0, 0 ).
+        if ( isinstance( points, CPointArray ) ):
+            P = points.from_origin
+        elif ( isinstance( points, np.ndarray ) ):
+            P = points
+        else:
+            P = [ p.from_origin if ( isinstance( p, CPoint ) ) else p for p in points ]
+        P = np.asarray( P, dtype = float )
+        if ( P.shape != ( 5, 3 ) ):
+            raise CValueError( CConic.__name__, 'five points are needed to build a conic.' )
+
+        M = conic_from_points_many( P[ np.newaxis ] )[ 0 ]
+        if ( not M.any() ):
+            raise CValueError( CConic.__name__, 'the points do not define a unique conic.' )
+        return cls.from_matrix( M, name, shift_origin = True )
+
     def __repr__( self ) -> str:
         # # return an info messsage for this class.
         info = f'{self.name}: ( x, y ) | [ x y 1 ] *\n{self.gform} * [ x y 1 ].T = 0'
@@ -137,6 +181,94 @@ class CConic( CAGObj ):
         # The point lies in the line.
         return other in l
 
+    def contains_many( self, points: CPointArray | np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+        # Test N points at once. It returns a mask of the points that lie
+        # in the conic and their classification, where -1 means inside,
+        # +1 means outside and 0 means that the point is on the conic.
+        # An ndarray holds the coords of one or N points in the current
+        # frame, as the gform of a CPointArray does. It is not read as
+        # related to the origin ( 0, 0 ), unlike in fit_conic, from_points
+        # and CStations.
+        if ( isinstance( points, CPointArray ) ):
+            P = points.gform
+        elif ( isinstance( points, np.ndarray ) ):
+            P = np.asarray( points, dtype = float )
+            P = P.reshape( -1, P.shape[ -1 ] )
+            if ( P.shape[ -1 ] != 3 ):
+                P = np.block( [ [ P, np.ones( ( P.shape[ 0 ], 1 ) ) ] ] )
+            w = P[ :, 2 ][np.newaxis].T
+            P = np.divide( P, w, out = P.copy(), where = ( w != 0.0 ) )
+        else:
+            raise CTypeError( points.__class__.__name__ )
+
+        # Get the quadratic form x.T * C * x for all the points.
+        q = np.einsum( 'ni,ij,nj->n', P, self._gform, P )
+        on_conic = np.abs( q ) <= ctol.eps_iszero_fordotfn
+
+        # The inside of an ellipse, a hyperbole or a parabola is the region
+        # where its foci are. There, the signs of q and det( C ) are the
+        # same, whatever the scale of C is. Degenerate conics have no inside
+        # and only the sign of q is returned.
+        if ( self.is_fullrank() ):
+            side = -np.sign( q * LA.det( self._gform ) )
+        else:
+            side = np.sign( q )
+        side[ on_conic ] = 0.0
+        return on_conic, side.astype( np.int8 )
+
+    def intersect_lines( self, lines: CLine | CLineArray | np.ndarray ) -> tuple[ CPointArray, CPointArray, np.ndarray ]:
+        # Intersect N lines with the conic at once. It returns two arrays
+        # of points and a ( N, 2 )-mask of the valid ones. A tangent line
+        # has only its first point valid. A line that is parallel to an
+        # asymptote ( or to the axis of a parabola ) gets the point at the
+        # infinity as its second point. An ndarray holds one or N lines in
+        # the current frame, as the gform of a CLineArray does.
+        if ( isinstance( lines, CLine ) ):
+            L = lines.gform[ np.newaxis ]
+        elif ( isinstance( lines, CLineArray ) ):
+            L = lines.gform
+        elif ( isinstance( lines, np.ndarray ) ):
+            L = lines.reshape( -1, 3 )
+        else:
+            raise CTypeError( lines.__class__.__name__ )
+
+        P1, P2, valid = intersect_lines_many( self._gform, L )
+        return CPointArray( P1, shift_origin = False ), CPointArray( P2, shift_origin = False ), valid
+
+    def tangents_from( self, points: CPoint | CPointArray | np.ndarray ) -> tuple[ CLineArray, CLineArray, np.ndarray ]:
+        # Get the tangent lines through N points at once. It returns two
+        # arrays of lines and a ( N, 2 )-mask of the valid ones. A point
+        # on the conic has only its first line valid ( the tangent at the
+        # point ). Interior points and degenerate conics have none.
+        # An ndarray holds one or N points in the current frame, as the
+        # gform of a CPointArray does. It is not read as related to the
+        # origin ( 0, 0 ), unlike in fit_conic, from_points and CStations.
+        if ( isinstance( points, CPoint ) ):
+            P = points.gform[ np.newaxis ]
+        elif ( isinstance( points, CPointArray ) ):
+            P = points.gform
+        elif ( isinstance( points, np.ndarray ) ):
+            P = points.reshape( -1, 3 )
+        else:
+            raise CTypeError( points.__class__.__name__ )
+
+        L1, L2, valid = tangents_from_many( self._gform, P )
+        if ( not self.is_fullrank() ):
+            L1[ : ] = 0.0
+            L2[ : ] = 0.0
+            valid[ : ] = False
+        return CLineArray( L1, shift_origin = False ), CLineArray( L2, shift_origin = False ), valid
+
+    def intersect( self, other: CConic ) -> CPointArray:
+        # Return the ( up to 4 ) distinct real points where the conics meet.
+        # A degenerate member of the pencil self + lambda * other is split
+        # into two lines, which are intersected with one of the conics.
+        if ( not isinstance( other, CConic ) ):
+            raise CTypeError( other.__class__.__name__ )
+
+        P, valid = intersect_conics_many( self._gform[ np.newaxis ], other._gform[ np.newaxis ] )
+        return CPointArray( P[ 0 ][ valid[ 0 ] ], shift_origin = False )
+
     def __mul__( self, other: CPoint | CLine ) -> Any[ CPoint | CLine ]:
         # from pyConics import CPoint, CLine
         if ( not isinstance( other, ( CPoint, CLine ) ) ):
@@ -144,17 +276,17 @@ class CConic( CAGObj ):
     
         # Multiply the Conic by the point. A line is returned.
         if ( isinstance( other, CPoint ) ):
-            v = self._gform @ other._gform
-            l = CLine( ( v[ 0 ], v[ 1 ], v[ 2 ] ), shift_origin = False )
-            return l
+            v = ctol.adjust2relzeros( self._gform @ other._gform )
+            return CLine.from_array( v )
 
         # Multiply the Conic by the line. A point is returned.
         if ( self.is_fullrank() == False ):
-            return CPoint(( 0.0, 0.0, 0.0 ), shift_origin = False )
+            return CPoint.from_array( np.zeros( 3 ) )
 
-        v = LA.inv( self._gform ) @ other._gform
-        p = CPoint( ( v[ 0 ], v[ 1 ], v[ 2 ] ), shift_origin = False )
-        return p
+        v = ctol.adjust2relzeros( self._inv() @ other._gform )
+        if ( v[ 2 ] != 0.0 ):
+            v = v / v[ 2 ]
+        return CPoint.from_array( v )
     
     @property
     def is_degenerate( self ) -> bool:
@@ -175,26 +307,30 @@ class CConic( CAGObj ):
             self._lines4deg[ 1 ].update_origin()
             self._gform = create_conic_from_lines( self._lines4deg )
         else:
-            self._gform = corigin.change_conic( self._gform )
+            # The matrix related to ( 0, 0 ) is translated, so parabolas and
+            # conics that were not built by the constructor ( from_matrix,
+            # from_points, fit_conic... ) are moved exactly.
+            self._gform = corigin.change_conics( self._from_origin[ np.newaxis ] )[ 0 ]
+            self._rank = rank( self._gform )
 
-    def copy( self ) -> CConic:
-        C = CConic()
-        C._rank = self._rank
-        C.name = self.name
+        # The derived quantities must be computed again.
+        self._cache = {}
 
+    def copy( self ) -> CConic:
         if ( self._lines4deg is not None ):
-            C._lines4deg = ( self._lines4deg[ 0 ].copy(), self._lines4deg[ 1 ].copy() )
-            C._gform = create_conic_from_lines( C._lines4deg )
+            lines4deg = ( self._lines4deg[ 0 ].copy(), self._lines4deg[ 1 ].copy() )
+            C = CConic.from_matrix( create_conic_from_lines( lines4deg ), self.name, rank = self._rank )
+            C._lines4deg = lines4deg
         else:
-            C._gform = self._gform.copy()
-        C._from_origin = C._gform.copy()        
+            C = CConic.from_matrix( self._gform.copy(), self.name, rank = self._rank )
+            C._from_origin = self._from_origin.copy()
         return C
 
     def sequence( self, x: list[ float ], /,
-                  y: list[ float ] | None = None
+                  y: list[ float ] | None = None,
+                  *,
+                  method: str = 'analytic'
                 ) -> tuple[ tuple[ CPoint, ... ], ... ]:
-        # from pyConics.point import CPoint
-        
         # Degenerate conic.
         if ( self._lines4deg is not None ):
             lop1 = self._lines4deg[ 0 ].sequence( x )
@@ -205,47 +341,25 @@ class CConic( CAGObj ):
         if ( y is None ):
             y = x
 
-        nrows = len( y )
-        ncols = len( x )
-        Vx = np.empty( shape = ( nrows, ncols ) )
-        for i in range( 0, nrows):
-            for j in range( 0, ncols ):
-                _x = np.array( [ x[ j ], y[ i ], 1.0 ] )[np.newaxis].T
-                Vx[ i ][ j ] = np.squeeze( _x.T @ self._gform @ _x )
-
-        X, Y = np.meshgrid( x, y )
-
-        _fig = plt.figure( figsize = ( 0, 0 ) )
-        _ax = _fig.add_subplot( 111 )
-        cs = _ax.contour( X, Y, Vx, levels = [ 0.0 ] )
-        plt.close( _fig )
-
-        # Get vertices and codes of the path.
-        p = cs.get_paths()[ 0 ]
-        v = np.array( p.vertices )
-        c = np.array( p.codes )
-
-        # Get the codes equal to Path.MOVETO.
-        idx = np.where( c == Path.MOVETO )
-        idx = idx[ 0 ]
-        if ( idx.size == 0 ):
+        if ( method not in ( 'analytic', 'contour' ) ):
+            raise CValueError( CConic.__name__, 'method must be either \'analytic\' or \'contour\'.' )
+
+        # Ellipses and hyperbolas are sampled parametrically inside the box
+        # spanned by x and y. Parabolas fall back to the contour method.
+        runs = None
+        if ( method == 'analytic' ):
+            runs = sample_conic( self._gform, ( min( x ), max( x ) ), ( min( y ), max( y ) ),
+                                 2 * max( len( x ), len( y ) ), self._eigh() )
+        if ( runs is None ):
+            runs = contour_conic( self._gform, np.asarray( x ), np.asarray( y ) )
+        if ( len( runs ) == 0 ):
             return tuple( [] ),
 
         # Build the lists.
         res = []
-        xy = []
-        p = CPoint( ( v[ 0 ][ 0 ], v[ 0 ][ 1 ] ), shift_origin = False )
-        xy.append( p )
-        for i in range( 1, c.size ):
-            p = CPoint( ( v[ i ][ 0 ], v[ i ][ 1 ] ), shift_origin = False )
-
-            if ( c[ i ] == Path.MOVETO ):
-                res.append( tuple( xy ) )
-                xy = []            
-
-            xy.append( p )
-        res.append( tuple( xy ) )
-
+        for P in runs:
+            v = np.block( [ [ P, np.ones( ( P.shape[ 0 ], 1 ) ) ] ] )
+            res.append( tuple( CPoint.from_array( vi ) for vi in v ) )
         return tuple( res )
     
     def pole( self, l: CLine ) -> CPoint:
@@ -256,6 +370,33 @@ class CConic( CAGObj ):
         l: CLine = self * p
         return l
 
+    def center( self ) -> CPoint:
+        # The center is the pole of the line at infinity. It is at the
+        # infinity for a parabola. For a pair of lines, it is the point
+        # where they meet.
+        return CPoint.from_array( self._center().copy() )
+
+    def classify( self ) -> str:
+        # Return the type of the conic. See CONIC_TYPES.
+        return CONIC_TYPES[ self._canonical()[ 'type' ] ]
+
+    def canonical( self ) -> dict[ str, Any ]:
+        # Return the type, center, semi-axes, angle and foci of the conic.
+        # See canonical_many.
+        params = dict( self._canonical() )
+        params[ 'type' ] = CONIC_TYPES[ params[ 'type' ] ]
+        for key in ( 'center', 'axes', 'foci' ):
+            params[ key ] = params[ key ].copy()
+        return params
+
+    def axes( self ) -> tuple[ float, float ]:
+        # Return the semi-axes ( a, b ) of an ellipse, where a >= b, or the
+        # transverse and the conjugate semi-axes ( a, b ) of a hyperbole.
+        ab = self._axes()
+        if ( ab is None ):
+            raise CValueError( CConic.__name__, 'axes are only defined for real ellipses and hyperboles.' )
+        return ab
+
     def area( self ) -> float:
         if ( self._rank == 1 ):
             return 0.0
@@ -263,11 +404,59 @@ class CConic( CAGObj ):
         if ( self._rank == 2 ):
             return cconst.inf
         
-        A = LA.det( self._gform )
+        A = self._det()
         if ( A < 0.0 ):
             return cconst.pi / np.sqrt( -A )
         return cconst.inf
     
+    #------------------------------------------------------------------
+    # Cached derived quantities. They are dropped by update_origin().
+    #
+    def _cached( self, key: str, fn: Any ) -> Any:
+        if ( key not in self._cache ):
+            self._cache[ key ] = fn()
+        return self._cache[ key ]
+
+    def _inv( self ) -> np.ndarray:
+        return self._cached( 'inv', lambda: LA.inv( self._gform ) )
+
+    def _adj( self ) -> np.ndarray:
+        return self._cached( 'adj', lambda: adjugate( self._gform ) )
+
+    def _det( self ) -> float:
+        return self._cached( 'det', lambda: float( LA.det( self._gform ) ) )
+
+    def _eigh( self ) -> tuple[ np.ndarray, np.ndarray ]:
+        # Eigenvalues ( ascending ) and eigenvectors of the quadratic part.
+        return self._cached( 'eigh', lambda: LA.eigh( self._gform[ 0 : 2, 0 : 2 ] ) )
+
+    def _center( self ) -> np.ndarray:
+        def center() -> np.ndarray:
+            v = ctol.adjust2relzeros( self._adj()[ :, 2 ] )
+            if ( v[ 2 ] != 0.0 ):
+                v = v / v[ 2 ]
+            return v
+        return self._cached( 'center', center )
+
+    def _canonical( self ) -> dict[ str, Any ]:
+        # The canonical parameters share the eigen-decomposition.
+        def canonical() -> dict[ str, Any ]:
+            lambdas, V = self._eigh()
+            params = canonical_many( self._gform[ np.newaxis ], np.array( [ self._rank ] ),
+                                     ( lambdas[ np.newaxis ], V[ np.newaxis ] ) )
+            return { key: ( int( v[ 0 ] ) if ( key == 'type' ) else
+                            float( v[ 0 ] ) if ( key == 'angle' ) else v[ 0 ] )
+                     for key, v in params.items() }
+        return self._cached( 'canonical', canonical )
+
+    def _axes( self ) -> tuple[ float, float ] | None:
+        def axes() -> tuple[ float, float ] | None:
+            params = self._canonical()
+            if ( CONIC_TYPES[ params[ 'type' ] ] not in ( 'ellipse', 'hyperbole' ) ):
+                return None
+            return float( params[ 'axes' ][ 0 ] ), float( params[ 'axes' ][ 1 ] )
+        return self._cached( 'axes', axes )
+
 #------------------------------------------------------------------
 # Internal functions.
 #  
@@ -309,6 +498,18 @@ if __name__ == '__main__':
     C5.name = 'C1.cp'
     print( C5, '\n' )
 
+    # Center and semi-axes ( they are computed only once ).
+    print( C1.center(), C1.axes(), C1.area() )
+    print( C3.center() )
+    print( C1.classify(), C3.classify() )
+    print( C2.canonical() )
+    print()
+
+    # The conic through five points of C0.
+    P1, P2, _ = C0.intersect_lines( np.array( [ [ 1, 0, 0 ], [ 0, 1, 0 ], [ 1, -1, 0 ] ] ) )
+    print( CConic.from_points( [ P1[ 0 ], P2[ 0 ], P1[ 1 ], P2[ 1 ], P1[ 2 ] ], 'C0.5p' ) )
+    print()
+
     x = np.linspace( -1.2, 1.2, 7 )
     lp1, lp2 = C3.sequence( list( x ) )
     for p in lp1:
@@ -318,13 +519,6 @@ if __name__ == '__main__':
         print( p.gform )
     print()
 
-    print( 'Path codes:' )
-    print( f'Path.MOVETO: {Path.MOVETO}' )
-    print( f'Path.LINETO: {Path.LINETO}' )
-    print( f'Path.CLOSEPOLY: {Path.CLOSEPOLY}' )
-    print( f'Path.STOP: {Path.STOP}' )
-    print()
-
     lp = C0.sequence( list( x ) )
     for p in lp[ 0 ]:
         print( p.gform )
@@ -366,6 +560,25 @@ if __name__ == '__main__':
     print( p3 in C6 )
     print()
 
+    P = CPointArray( [ ( 0, 0 ), ( 1, 1 ), ( 1, 0 ), ( 0, 1 ), ( np.sqrt(2) / 2, np.sqrt(2) / 2 ) ] )
+    on_conic, side = C6.contains_many( P )
+    print( on_conic )
+    print( side )
+    print()
+
+    L = CLineArray( [ ( 0, 1, 0 ), ( 1, 0, -1 ), ( 1, 0, -2 ) ] )
+    P1, P2, valid = C6.intersect_lines( L )
+    print( P1, P2, valid, sep = '\n' )
+    print()
+
+    L1, L2, valid = C6.tangents_from( P )
+    print( L1, L2, valid, sep = '\n' )
+    print()
+
+    print( C1.intersect( C2 ) )
+    print( C6.intersect( C3 ) )
+    print()
+
     print( f'The area of {C0.name} is {C0.area()}' )
     print( f'The area of {C1.name} is {C1.area()}' )
     print( f'The area of {C2.name} is {C2.area()}' )
@@ -0,0 +1,282 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'CConicArray' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Sequence
+from numpy import linalg as LA
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.constants import cconst
+from pyConics.agobj import CAGObj
+from pyConics.errors import CTypeError, CValueError
+from pyConics.origin import corigin
+from pyConics.tolerance import ctol
+from pyConics.conics.utils import rank_many, intersect_conics_many, CONIC_TYPES, canonical_many
+from pyConics.conics.utils import conic_from_points_many
+from pyConics.point import CPoint
+from pyConics.line import CLine
+from pyConics.pointarray import CPointArray
+from pyConics.linearray import CLineArray
+from pyConics.conics.conic import CConic
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+np.set_printoptions( formatter = { 'float': lambda x: "{0:0.4e}".format( x ) } )
+
+#------------------------------------------------------------------
+# Class CConicArray.
+#
+class CConicArray( CAGObj ):
+    __slots__ = ( '_rank', )
+
+    def __init__( self,
+                  conics: np.ndarray | Sequence[ Any ] = np.zeros( ( 0, 3, 3 ) ),
+                  /,
+                  name: str = '',
+                  *,
+                  shift_origin: bool = True ) -> None:
+        super().__init__( name )
+
+        # Redim the geometric form. It is a ( K, 3, 3 )-stack where
+        # each matrix is a conic.
+        self._gform = _validate_conics( conics )
+
+        # Test for epsilon number condition.
+        self._gform = ctol.adjust2relzeros_many( self._gform, 2 )
+
+        # Store this value to be possible restore it to the origin.
+        # Both forms share the same array while the origin is not shifted.
+        self._from_origin = self._gform
+
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        if ( shift_origin == True ):
+            self.update_origin()
+
+        # Get the matrix ranks.
+        self._rank = rank_many( self._gform )
+
+    @classmethod
+    def from_matrices( cls, M: np.ndarray, name: str = '', *, rank: np.ndarray | None = None,
+                       shift_origin: bool = False ) -> CConicArray:
+        # Trusted constructor. M must be a ( K, 3, 3 )-stack of symmetric
+        # float matrices. It is neither validated, adjusted to relative
+        # zeros nor copied. The ranks are only computed when they are not
+        # given. When shift_origin is True, M is related to the origin
+        # ( 0, 0 ) and it is translated to the current origin.
+        CC = cls.__new__( cls )
+        CC.name = name
+        CC._from_origin = M
+        CC._gform = corigin.change_conics( M ) if ( shift_origin ) else M
+        CC._rank = rank_many( M ) if ( rank is None ) else rank
+        return CC
+
+    @classmethod
+    def from_points( cls, points: CPointArray | np.ndarray, name: str = '' ) -> CConicArray:
+        # Build the conics through groups of five points. They are given by
+        # a ( K, 5, 3 )-stack of homogeneous coords related to the origin
+        # ( 0, 0 ) or by a CPointArray whose rows 5 * k to 5 * k + 4 are the
+        # points of the k-th conic. Groups that do not define a unique conic
+        # give a null matrix.
+        if ( isinstance( points, CPointArray ) ):
+            P = points.from_origin.reshape( ( -1, 5, 3 ) ) if ( len( points ) % 5 == 0 ) else None
+        elif ( isinstance( points, np.ndarray ) ):
+            P = np.asarray( points, dtype = float )
+        else:
+            raise CTypeError( points.__class__.__name__ )
+        if ( ( P is None ) or ( P.ndim != 3 ) or ( P.shape[ 1 : ] != ( 5, 3 ) ) ):
+            raise CValueError( CConicArray.__name__, 'points must be a ( K, 5, 3 )-stack of points.' )
+        return cls( conic_from_points_many( P ), name )
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        info = f'{self.name}: {len( self )} conics ( x, y ) | [ x y 1 ] * C * [ x y 1 ].T = 0'
+        return info
+
+    def __len__( self ) -> int:
+        return self._gform.shape[ 0 ]
+
+    def __getitem__( self, key: int | slice | np.ndarray ) -> Any[ CConic | CConicArray ]:
+        # An integer returns a CConic. Otherwise, a new CConicArray is returned.
+        if ( isinstance( key, ( int, np.integer ) ) ):
+            name = f'{self.name}[{key}]' if ( self.name != '' ) else ''
+            C = CConic.from_matrix( self._gform[ key ].copy(), name, rank = int( self._rank[ key ] ) )
+            C._from_origin = self._from_origin[ key ].copy()
+            return C
+
+        CC = CConicArray( name = self.name )
+        CC._from_origin = self._from_origin[ key ]
+        CC._gform = self._gform[ key ]
+        CC._rank = self._rank[ key ]
+        return CC
+
+    def __mul__( self, other: CPoint | CLine | CPointArray | CLineArray ) -> Any[ CPointArray | CLineArray ]:
+        # Multiply the Conics by the points. Lines are returned.
+        if ( isinstance( other, ( CPoint, CPointArray ) ) ):
+            return self.polar( other )
+
+        # Multiply the Conics by the lines. Points are returned.
+        return self.pole( other )
+
+    @property
+    def rank( self ) -> np.ndarray:
+        return self._rank
+
+    def is_fullrank( self ) -> np.ndarray:
+        return self._rank == 3
+
+    def update_origin( self ) -> None:
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        self._gform = corigin.change_conics( self._from_origin )
+
+    def copy( self ) -> CConicArray:
+        # The matrices are copied as they are, with their ranks and their
+        # form related to the origin ( 0, 0 ).
+        CC = CConicArray.from_matrices( self._gform.copy(), self.name, rank = self._rank.copy() )
+        CC._from_origin = self._from_origin.copy()
+        return CC
+
+    def pole( self, l: CLine | CLineArray ) -> CPointArray:
+        # The lines are paired up with the conics, row by row. Conics that
+        # are not full rank return a null point.
+        L = _as_vectors( l, CLine, CLineArray, len( self ) )
+        full = self.is_fullrank()
+        M = self._gform.copy()
+        M[ ~full ] = np.eye( 3 )
+        v = LA.solve( M, L[ ..., np.newaxis ] )[ ..., 0 ]
+        v[ ~full ] = 0.0
+        return CPointArray( v, shift_origin = False )
+
+    def polar( self, p: CPoint | CPointArray ) -> CLineArray:
+        # The points are paired up with the conics, row by row.
+        P = _as_vectors( p, CPoint, CPointArray, len( self ) )
+        v = np.einsum( 'kij,kj->ki', self._gform, P )
+        return CLineArray( v, shift_origin = False )
+
+    def intersect( self, other: CConic | CConicArray ) -> tuple[ CPointArray, np.ndarray ]:
+        # The conics of other are paired up with these conics, row by row.
+        # It returns 4 points per pair, where the row 4 * k + j is the
+        # j-th point of the k-th pair, and a ( K, 4 )-mask of the valid ones.
+        if ( isinstance( other, CConic ) ):
+            M = np.broadcast_to( other.gform, self._gform.shape )
+        elif ( isinstance( other, CConicArray ) ):
+            if ( len( other ) not in ( 1, len( self ) ) ):
+                raise CValueError( CConicArray.__name__, 'the arrays must have the same number of rows.' )
+            M = np.broadcast_to( other.gform, self._gform.shape )
+        else:
+            raise CTypeError( other.__class__.__name__ )
+
+        P, valid = intersect_conics_many( self._gform, M )
+        return CPointArray( P.reshape( -1, 3 ), shift_origin = False ), valid
+
+    def classify( self ) -> np.ndarray:
+        # Return the types of the conics. See CONIC_TYPES.
+        return np.array( CONIC_TYPES )[ canonical_many( self._gform, self._rank )[ 'type' ] ]
+
+    def canonical( self ) -> dict[ str, np.ndarray ]:
+        # Return the types, centers, semi-axes, angles and foci of the
+        # conics. See canonical_many.
+        params = canonical_many( self._gform, self._rank )
+        params[ 'type' ] = np.array( CONIC_TYPES )[ params[ 'type' ] ]
+        return params
+
+    def area( self ) -> np.ndarray:
+        A = LA.det( self._gform )
+        area = np.full( len( self ), cconst.inf )
+        ellipse = ( self._rank == 3 ) & ( A < 0.0 )
+        area[ ellipse ] = cconst.pi / np.sqrt( -A[ ellipse ] )
+        area[ self._rank == 1 ] = 0.0
+        return area
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _validate_conics( conics: np.ndarray | Sequence[ Any ] ) -> np.ndarray:
+    # A sequence of CConics is stacked by using their original forms.
+    if ( ( not isinstance( conics, np.ndarray ) ) and ( len( conics ) > 0 ) and
+         ( isinstance( conics[ 0 ], CConic ) ) ):
+        return np.array( [ C.from_origin for C in conics ], dtype = float )
+
+    M = np.array( conics, dtype = float )
+    if ( M.size == 0 ):
+        return np.zeros( ( 0, 3, 3 ) )
+    if ( ( M.ndim != 3 ) or ( M.shape[ 1 : ] != ( 3, 3 ) ) ):
+        raise CValueError( CConicArray.__name__, 'conics must be a ( K, 3, 3 )-stack of matrices.' )
+    return M
+
+def _as_vectors( gf: Any, cls: type, cls_array: type, n: int ) -> np.ndarray:
+    # Get a ( n, 3 )-matrix from a point/line or from an array of them.
+    if ( isinstance( gf, cls ) ):
+        return np.broadcast_to( gf.gform, ( n, 3 ) )
+    if ( isinstance( gf, cls_array ) ):
+        if ( len( gf ) not in ( 1, n ) ):
+            raise CValueError( CConicArray.__name__, 'the arrays must have the same number of rows.' )
+        return np.broadcast_to( gf.gform, ( n, 3 ) )
+    raise CTypeError( gf.__class__.__name__ )
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    # Create a stack of conics.
+    C0 = CConic( name = 'C0' )
+    C1 = CConic( 0.3, 0.5, 30.0 / 180 * cconst.pi, CPoint( ( 0, 0 ) ), 'C1' )
+    C2 = CConic( 0.2, name = 'C2', foci = ( CPoint( ( 0, 0.4 ) ), CPoint( ( 0, -0.4 ) ) ) )
+    C3 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, 0.0 ) ) ), name = 'C3' )
+    CC = CConicArray( [ C0, C1, C2, C3 ], 'CC' )
+    print( CC )
+    print( CC.rank )
+    print( CC.is_fullrank() )
+    print( CC.area() )
+    print()
+
+    # Poles and polars.
+    p = CPoint( ( 1, 0 ) )
+    L = CC * p
+    print( L )
+    print( CC * L )
+    print()
+
+    # Intersections with C1.
+    P, valid = CC.intersect( C1 )
+    print( P )
+    print( valid )
+    print()
+
+    # Conics through five points.
+    P = np.array( [ [ [ 1, 0, 1 ], [ -1, 0, 1 ], [ 0, 1, 1 ], [ 0, -1, 1 ], [ 0.6, 0.8, 1 ] ],
+                    [ [ 1, 0, 1 ], [ 2, 0, 1 ], [ 3, 0, 1 ], [ 4, 0, 1 ], [ 0, 1, 1 ] ] ] )
+    print( CConicArray.from_points( P ).gform )
+    print()
+
+    # Types and canonical parameters.
+    print( CC.classify() )
+    for key, value in CC.canonical().items():
+        print( key, value )
+    print()
+
+    # Indexing.
+    print( CC[ 1 ] )
+    print( CC[ 1 : ] )
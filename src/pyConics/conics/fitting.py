@@ -0,0 +1,298 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'fit_conic', 'CConicFitter' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from collections import deque
+from numpy import linalg as LA
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.errors import CTypeError, CValueError
+from pyConics.tolerance import ctol
+from pyConics.pointarray import CPointArray
+from pyConics.conics.conic import CConic
+from pyConics.conics.utils import normalize_many
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+# Number of rows of the design matrix that are built at once.
+CHUNK_SIZE = 65536
+
+#------------------------------------------------------------------
+# Fit a conic.
+#
+def fit_conic( points: CPointArray | np.ndarray, name: str = '', *,
+               method: str = 'algebraic' ) -> CConic:
+    # Fit a conic to the points by least squares. points is a CPointArray
+    # or a ( N, 3 )-matrix of homogeneous coords ( a ( N, 2 )-matrix is
+    # also accepted ). Points at the infinity are ignored.
+    # method = 'algebraic': any conic, with || theta || = 1 in the
+    #                       normalized coords.
+    # method = 'ellipse':   an ellipse, by the direct least squares
+    #                       method ( Fitzgibbon et al., Halir and Flusser ).
+    if ( method not in ( 'algebraic', 'ellipse' ) ):
+        raise CValueError( fit_conic.__name__, 'method must be either \'algebraic\' or \'ellipse\'.' )
+
+    xy = _finite_points( points )
+    if ( xy.shape[ 0 ] < 5 ):
+        raise CValueError( fit_conic.__name__, 'at least 5 points are needed to fit a conic.' )
+
+    T = _normalization( xy )
+    S = _scatter( xy, T )
+    return CConic.from_matrix( _solve( S, T, method ), name, shift_origin = True )
+
+#------------------------------------------------------------------
+# Class CConicFitter.
+#
+class CConicFitter:
+    __slots__ = ( 'name', '_method', '_forget', '_window', '_T', '_S', '_chunks', '_M' )
+
+    def __init__( self, name: str = '', *, method: str = 'algebraic',
+                  forget: float = 1.0, window: int | None = None ) -> None:
+        # Fit a conic to a stream of points. Each call to update() adds a
+        # chunk of points to the scatter matrix, so the current fit costs
+        # the same whatever the length of the history is.
+        # forget: each point weighs forget^m, where m is the number of
+        #         points that came after it ( 0 < forget <= 1 ).
+        # window: only the last window chunks are kept.
+        if ( method not in ( 'algebraic', 'ellipse' ) ):
+            raise CValueError( CConicFitter.__name__, 'method must be either \'algebraic\' or \'ellipse\'.' )
+        if ( not ( 0.0 < forget <= 1.0 ) ):
+            raise CValueError( CConicFitter.__name__, 'forget must be in ( 0, 1 ].' )
+        if ( window is not None ):
+            if ( window < 1 ):
+                raise CValueError( CConicFitter.__name__, 'window must be a positive integer.' )
+            if ( forget != 1.0 ):
+                raise CValueError( CConicFitter.__name__, 'forget and window cannot be used together.' )
+
+        self.name = name
+        self._method = method
+        self._forget = forget
+        self._window = window
+        self.reset()
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        info = f'{self.name}: conic fitter ( {self._method} ) over {self.count:.6g} points'
+        return info
+
+    @property
+    def count( self ) -> float:
+        # Number of points in the fit. It is a weighted sum when there is
+        # forgetting. The last entry of the scatter matrix is the sum of
+        # the point weights.
+        return float( self._S[ 5, 5 ] )
+
+    def reset( self ) -> None:
+        # Forget all points. The normalization is taken from the next chunk.
+        self._T: np.ndarray | None = None
+        self._S = np.zeros( ( 6, 6 ) )
+        self._chunks: deque[ np.ndarray ] = deque( maxlen = self._window )
+        self._M: np.ndarray | None = None
+
+    def update( self, points: CPointArray | np.ndarray ) -> None:
+        # Add a chunk of points. See fit_conic for the accepted inputs.
+        xy = _finite_points( points )
+        if ( xy.shape[ 0 ] == 0 ):
+            return
+
+        # The scatter matrices of all chunks are added up in the same
+        # normalized coords. The normalization is taken from the first
+        # chunk, and it is moved when the points that are kept drift away
+        # from it.
+        if ( self._T is None ):
+            self._T = _normalization( xy )
+        else:
+            self._renormalize( xy )
+
+        n = xy.shape[ 0 ]
+        if ( self._window is not None ):
+            self._chunks.append( _scatter( xy, self._T ) )
+            self._S = sum( self._chunks, np.zeros( ( 6, 6 ) ) )
+        elif ( self._forget < 1.0 ):
+            w = self._forget ** np.arange( n - 1, -1, -1, dtype = float )
+            self._S = self._forget ** n * self._S + _scatter( xy, self._T, w )
+        else:
+            self._S += _scatter( xy, self._T )
+        self._M = None
+
+    def conic( self ) -> CConic:
+        # Return the current fit. It is computed once per update.
+        if ( self._M is None ):
+            if ( ( self._T is None ) or ( self.count < 5.0 - ctol.eps_relzero ) ):
+                raise CValueError( CConicFitter.__name__, 'at least 5 points are needed to fit a conic.' )
+            self._M = _solve( self._S, self._T, self._method )
+        return CConic.from_matrix( self._M.copy(), self.name, shift_origin = True )
+
+    def _renormalize( self, xy: np.ndarray ) -> None:
+        # Move the normalization to the points that will be kept after xy
+        # is added, when their centroid or their spread are far from the
+        # ones of the normalized coords. The kept scatter matrices are
+        # rewritten in the new coords.
+        if ( self._window is not None ):
+            kept = list( self._chunks )[ 1 : ] if ( len( self._chunks ) == self._window ) else list( self._chunks )
+            S = sum( kept, np.zeros( ( 6, 6 ) ) )
+        else:
+            S = self._S
+
+        u = xy * np.diag( self._T )[ 0 : 2 ] + self._T[ 0 : 2, 2 ]
+        n = S[ 5, 5 ] + u.shape[ 0 ]
+        c = ( S[ 3 : 5, 5 ] + u.sum( axis = 0 ) ) / n
+        d2 = ( S[ 3, 3 ] + S[ 4, 4 ] + float( np.sum( u * u ) ) ) / n - float( c @ c )
+        s = np.sqrt( 2.0 / d2 ) if ( d2 > 0.0 ) else 1.0
+        if ( ( LA.norm( c ) <= 1.0 ) and ( 0.5 <= s <= 2.0 ) ):
+            return
+
+        N = np.array( [ [ s, 0.0, -s * c[ 0 ] ], [ 0.0, s, -s * c[ 1 ] ], [ 0.0, 0.0, 1.0 ] ] )
+        L = _design_transform( N )
+        self._S = L @ self._S @ L.T
+        for k in range( len( self._chunks ) ):
+            self._chunks[ k ] = L @ self._chunks[ k ] @ L.T
+        self._T = N @ self._T
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _finite_points( points: CPointArray | np.ndarray ) -> np.ndarray:
+    # Get the ( N, 2 )-matrix of the finite points, as they are
+    # related to the origin ( 0, 0 ).
+    if ( isinstance( points, CPointArray ) ):
+        P = points.from_origin
+    elif ( isinstance( points, np.ndarray ) ):
+        P = np.asarray( points, dtype = float )
+        if ( ( P.ndim != 2 ) or ( P.shape[ 1 ] not in ( 2, 3 ) ) ):
+            raise CValueError( fit_conic.__name__, 'points must be a ( N, 2 ) or a ( N, 3 )-matrix.' )
+        if ( P.shape[ 1 ] == 2 ):
+            return P
+    else:
+        raise CTypeError( points.__class__.__name__ )
+
+    w = P[ :, 2 ]
+    finite = w != 0.0
+    return P[ finite, 0 : 2 ] / w[ finite ][ :, np.newaxis ]
+
+def _normalization( xy: np.ndarray ) -> np.ndarray:
+    # Hartley's normalization. T moves the centroid to ( 0, 0 ) and
+    # scales the points so that their mean distance to it is sqrt( 2 ).
+    c = xy.mean( axis = 0 )
+    d = float( np.mean( LA.norm( xy - c, axis = 1 ) ) )
+    s = np.sqrt( 2.0 ) / d if ( d > 0.0 ) else 1.0
+    return np.array( [ [ s, 0.0, -s * c[ 0 ] ], [ 0.0, s, -s * c[ 1 ] ], [ 0.0, 0.0, 1.0 ] ] )
+
+def _scatter( xy: np.ndarray, T: np.ndarray, w: np.ndarray | None = None ) -> np.ndarray:
+    # Scatter matrix D.T * W * D of the design matrix D, whose rows are
+    # [ x^2 x*y y^2 x y 1 ] for the normalized points, and of the point
+    # weights W. D is built in chunks, so its memory is bounded for large
+    # point sets.
+    S = np.zeros( ( 6, 6 ) )
+    for k in range( 0, xy.shape[ 0 ], CHUNK_SIZE ):
+        D = _design( xy[ k : k + CHUNK_SIZE ], T )
+        S += D.T @ ( D if ( w is None ) else D * w[ k : k + CHUNK_SIZE, np.newaxis ] )
+    return S
+
+def _design( xy: np.ndarray, T: np.ndarray ) -> np.ndarray:
+    x = T[ 0, 0 ] * xy[ :, 0 ] + T[ 0, 2 ]
+    y = T[ 1, 1 ] * xy[ :, 1 ] + T[ 1, 2 ]
+    D = np.empty( ( xy.shape[ 0 ], 6 ) )
+    D[ :, 0 ] = x * x
+    D[ :, 1 ] = x * y
+    D[ :, 2 ] = y * y
+    D[ :, 3 ] = x
+    D[ :, 4 ] = y
+    D[ :, 5 ] = 1.0
+    return D
+
+def _design_transform( N: np.ndarray ) -> np.ndarray:
+    # Matrix L such that L * d is the row of the design matrix of the point
+    # N * p, where d is the row of p and N scales and translates the coords.
+    s, p, q = N[ 0, 0 ], N[ 0, 2 ], N[ 1, 2 ]
+    return np.array( [ [ s * s, 0.0, 0.0, 2.0 * s * p, 0.0, p * p ],
+                       [ 0.0, s * s, 0.0, s * q, s * p, p * q ],
+                       [ 0.0, 0.0, s * s, 0.0, 2.0 * s * q, q * q ],
+                       [ 0.0, 0.0, 0.0, s, 0.0, p ],
+                       [ 0.0, 0.0, 0.0, 0.0, s, q ],
+                       [ 0.0, 0.0, 0.0, 0.0, 0.0, 1.0 ] ] )
+
+def _solve( S: np.ndarray, T: np.ndarray, method: str ) -> np.ndarray:
+    # Get the conic that minimizes theta.T * S * theta and bring it back
+    # from the normalized coords.
+    if ( method == 'algebraic' ):
+        _, V = LA.eigh( S )
+        theta = V[ :, 0 ]
+    else:
+        theta = _solve_ellipse( S )
+
+    a, b, c, d, e, f = theta
+    M = np.array( [ [ a, b / 2, d / 2 ], [ b / 2, c, e / 2 ], [ d / 2, e / 2, f ] ] )
+    return normalize_many( ( T.T @ M @ T )[ np.newaxis ] )[ 0 ]
+
+def _solve_ellipse( S: np.ndarray ) -> np.ndarray:
+    # Direct least squares fitting of an ellipse, where the constraint
+    # 4 * a * c - b^2 = 1 is imposed. The scatter matrix is split into
+    # its quadratic and linear blocks ( Halir and Flusser ).
+    S1, S2, S3 = S[ 0 : 3, 0 : 3 ], S[ 0 : 3, 3 : 6 ], S[ 3 : 6, 3 : 6 ]
+    try:
+        K = -LA.solve( S3, S2.T )
+    except LA.LinAlgError:
+        raise CValueError( fit_conic.__name__, 'the points do not define an ellipse.' )
+    R = S1 + S2 @ K
+    R = np.array( [ R[ 2 ] / 2, -R[ 1 ], R[ 0 ] / 2 ] )
+    _, V = LA.eig( R )
+    V = np.real( V )
+    cond = 4.0 * V[ 0 ] * V[ 2 ] - V[ 1 ] ** 2
+    if ( not np.any( cond > 0.0 ) ):
+        raise CValueError( fit_conic.__name__, 'the points do not define an ellipse.' )
+    a1 = V[ :, int( np.argmax( cond ) ) ]
+    return np.concatenate( [ a1, K @ a1 ] )
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    from pyConics.constants import cconst
+    from pyConics.point import CPoint
+
+    # Noisy samples of an ellipse.
+    C0 = CConic( 2.0, 1.0, 30.0 / 180 * cconst.pi, CPoint( ( 0.5, -0.5 ) ), 'C0' )
+    print( C0, '\n' )
+    x = np.linspace( -3.0, 4.0, 500 )
+    P = np.array( [ p.gform for p in C0.sequence( x )[ 0 ] ] )
+    P[ :, 0 : 2 ] += np.random.default_rng( 1 ).normal( 0.0, 0.01, ( P.shape[ 0 ], 2 ) )
+
+    C1 = fit_conic( CPointArray( P ), 'C1' )
+    print( C1, '\n' )
+    print( C1.canonical(), '\n' )
+
+    C2 = fit_conic( P, 'C2', method = 'ellipse' )
+    print( C2, '\n' )
+    print( C2.canonical(), '\n' )
+
+    # The same points in chunks of 50.
+    F = CConicFitter( 'C3', forget = 0.999 )
+    for k in range( 0, P.shape[ 0 ], 50 ):
+        F.update( P[ k : k + 50 ] )
+    print( F )
+    print( F.conic(), '\n' )
@@ -6,12 +6,15 @@ from __future__ import annotations
 # #------------------------------------------------------------------
 # # Everything that can be visible to the world.
  
-__all__ = [ 'create_conic_from_lines', 'create_conic', 'rank' ]
+__all__ = [ 'create_conic_from_lines', 'create_conic', 'rank', 'rank_many', 'sample_conic',
+            'contour_conic', 'intersect_lines_many', 'intersect_conics_many', 'CONIC_TYPES',
+            'canonical_many', 'conic_from_points_many', 'tangents_from_many', 'adjugate',
+            'normalize_many' ]
 
 # #------------------------------------------------------------------
 # # Import from...
 # #
-# from typing import Any
+from typing import Callable
 from numpy import linalg as LA
 
 # #------------------------------------------------------------------
@@ -35,6 +38,13 @@ from pyConics.line import CLine
 # #
 import numpy as np
 
+#------------------------------------------------------------------
+# Types of conics returned by canonical_many. The code of a type is
+# its index in this tuple.
+#
+CONIC_TYPES = ( 'null', 'ellipse', 'imaginary ellipse', 'hyperbole', 'parabola', 'point',
+                'crossing lines', 'parallel lines', 'imaginary parallel lines', 'double line' )
+
 def create_conic_from_lines( lines: tuple[ CLine, CLine ] ) -> np.ndarray:
     l1 = lines[ 0 ].gform[np.newaxis]
     l2 = lines[ 1 ].gform[np.newaxis].T
@@ -93,6 +103,628 @@ def rank( M: np.ndarray ) -> int:
             rk += 1
     return rk
 
+def rank_many( M: np.ndarray ) -> np.ndarray:
+    # It is the rank function applied to a ( K, n, n )-stack of matrices.
+    K, nrows, ncols = M.shape
+    if ( nrows != ncols ):
+        return np.zeros( K, dtype = int )
+
+    # Calc rank by using the eigenvalues.
+    eigs = LA.eigvalsh( M )
+    eigs = ctol.adjust2relzeros_many( eigs )
+    rk = np.count_nonzero( eigs, axis = 1 )
+
+    # Full rank matrices and null matrices.
+    rk[ np.abs( LA.det( M ) ) > ctol.eps_iszero ] = nrows
+    rk[ LA.norm( M, axis = ( 1, 2 ) ) <= ctol.eps_iszero ] = 0
+    return rk
+
+def sample_conic( M: np.ndarray, xlim: tuple[ float, float ], ylim: tuple[ float, float ],
+                  n: int, eigh: tuple[ np.ndarray, np.ndarray ] | None = None ) -> list[ np.ndarray ] | None:
+    # Sample a central conic ( ellipse or hyperbola ) parametrically and
+    # return the ( k, 2 )-matrices of the pieces that lie in the box
+    # xlim x ylim. None is returned for other conics ( e.g. parabolas ).
+    # The eigen-decomposition of the quadratic part may be passed in.
+    A = M[ 0 : 2, 0 : 2 ]
+    b = M[ 0 : 2, 2 ]
+    scale = float( np.max( np.abs( M ) ) )
+    if ( abs( LA.det( A ) ) <= ctol.eps_relzero * scale * scale ):
+        return None
+
+    # Center and constant term of the translated conic u.T * A * u + f = 0.
+    xy_c = -LA.solve( A, b )
+    f = M[ 2, 2 ] + b @ xy_c
+    if ( abs( f ) <= ctol.eps_relzero * scale ):
+        return None
+
+    # Axes and rotation. k holds the signed squared semi-axes.
+    lambdas, V = LA.eigh( A ) if ( eigh is None ) else eigh
+    k = -f / lambdas
+    if ( np.all( k < 0.0 ) ):
+        # There is no real point.
+        return []
+
+    if ( np.all( k > 0.0 ) ):
+        # Ellipse by angle. The range of angles starts at a point out of
+        # the box, so no piece wraps around.
+        ab = np.sqrt( k )
+        def ellipse( t: np.ndarray ) -> np.ndarray:
+            uv = np.stack( [ ab[ 0 ] * np.cos( t ), ab[ 1 ] * np.sin( t ) ], axis = 1 )
+            return uv @ V.T + xy_c
+
+        t = np.linspace( 0.0, 2.0 * cconst.pi, n )
+        out = np.flatnonzero( ~_inside_box( ellipse( t ), xlim, ylim ) )
+        if ( out.size == 0 ):
+            return [ ellipse( t ) ]
+        t0 = t[ out[ 0 ] ]
+        return _sample_runs( ellipse, t0, t0 + 2.0 * cconst.pi, n, xlim, ylim )
+
+    # Hyperbola branches by hyperbolic parameter. At t = +-t_max each
+    # branch is farther from the center than any corner of the box.
+    i = int( np.argmax( k ) )
+    a = np.sqrt( k[ i ] )
+    b = np.sqrt( -k[ 1 - i ] )
+    corners = np.array( [ [ xlim[ 0 ], ylim[ 0 ] ], [ xlim[ 0 ], ylim[ 1 ] ],
+                          [ xlim[ 1 ], ylim[ 0 ] ], [ xlim[ 1 ], ylim[ 1 ] ] ] )
+    t_max = float( np.arcsinh( np.max( LA.norm( corners - xy_c, axis = 1 ) ) / b ) )
+
+    runs = []
+    for sign in ( 1.0, -1.0 ):
+        def branch( t: np.ndarray, sign: float = sign ) -> np.ndarray:
+            return ( np.outer( sign * a * np.cosh( t ), V[ :, i ] ) +
+                     np.outer( b * np.sinh( t ), V[ :, 1 - i ] ) + xy_c )
+        runs += _sample_runs( branch, -t_max, t_max, n, xlim, ylim )
+    return runs
+
+def contour_conic( M: np.ndarray, x: np.ndarray, y: np.ndarray ) -> list[ np.ndarray ]:
+    # Extract the zero level curve of [ x y 1 ] * M * [ x y 1 ].T on the
+    # grid x by y through marching squares. It returns a ( k, 2 )-matrix
+    # for each polyline. Closed polylines repeat their first point.
+    x = np.asarray( x, dtype = float )
+    y = np.asarray( y, dtype = float )
+    nx = x.size
+    ny = y.size
+    if ( ( nx < 2 ) or ( ny < 2 ) ):
+        return []
+
+    # Quadratic form over the whole grid. V[ i, j ] is the value at ( x[ j ], y[ i ] ).
+    X = x[ np.newaxis, : ]
+    Y = y[ :, np.newaxis ]
+    V = ( M[ 0, 0 ] * X * X + 2.0 * M[ 0, 1 ] * X * Y + M[ 1, 1 ] * Y * Y +
+          2.0 * M[ 0, 2 ] * X + 2.0 * M[ 1, 2 ] * Y + M[ 2, 2 ] )
+    S = V > 0.0
+
+    # Edges are numbered as horizontal edges first, ( i, j )-( i, j + 1 ),
+    # and then vertical edges, ( i, j )-( i + 1, j ).
+    nh = ny * ( nx - 1 )
+    h_cut = S[ :, : -1 ] != S[ :, 1 : ]
+    v_cut = S[ : -1, : ] != S[ 1 :, : ]
+
+    # Crossing point on each edge by linear interpolation.
+    E = np.full( ( nh + ( ny - 1 ) * nx, 2 ), np.nan )
+    i, j = np.nonzero( h_cut )
+    t = V[ i, j ] / ( V[ i, j ] - V[ i, j + 1 ] )
+    E[ i * ( nx - 1 ) + j ] = np.stack( [ x[ j ] + t * ( x[ j + 1 ] - x[ j ] ), y[ i ] ], axis = 1 )
+    i, j = np.nonzero( v_cut )
+    t = V[ i, j ] / ( V[ i, j ] - V[ i + 1, j ] )
+    E[ nh + i * nx + j ] = np.stack( [ x[ j ], y[ i ] + t * ( y[ i + 1 ] - y[ i ] ) ], axis = 1 )
+
+    # Edges of each cell in the order bottom, right, top, and left.
+    i, j = np.meshgrid( np.arange( ny - 1 ), np.arange( nx - 1 ), indexing = 'ij' )
+    ids = np.stack( [ i * ( nx - 1 ) + j, nh + i * nx + j + 1,
+                      ( i + 1 ) * ( nx - 1 ) + j, nh + i * nx + j ], axis = -1 ).reshape( -1, 4 )
+    cut = np.stack( [ h_cut[ : -1, : ], v_cut[ :, 1 : ],
+                      h_cut[ 1 :, : ], v_cut[ :, : -1 ] ], axis = -1 ).reshape( -1, 4 )
+    ncut = np.count_nonzero( cut, axis = 1 )
+
+    # Cells cut twice give one segment.
+    segs = [ ids[ ncut == 2 ][ cut[ ncut == 2 ] ].reshape( -1, 2 ) ]
+
+    # Saddle cells are cut four times. The value at the center of the
+    # cell tells which corners are joined.
+    saddle = np.flatnonzero( ncut == 4 )
+    if ( saddle.size > 0 ):
+        ii = saddle // ( nx - 1 )
+        jj = saddle % ( nx - 1 )
+        center = ( V[ ii, jj ] + V[ ii, jj + 1 ] + V[ ii + 1, jj ] + V[ ii + 1, jj + 1 ] ) > 0.0
+        same = center == S[ ii, jj ]
+        b, r, t, l = ids[ saddle ].T
+        segs.append( np.where( same[ :, np.newaxis ], np.stack( [ b, r ], axis = 1 ), np.stack( [ l, b ], axis = 1 ) ) )
+        segs.append( np.where( same[ :, np.newaxis ], np.stack( [ t, l ], axis = 1 ), np.stack( [ r, t ], axis = 1 ) ) )
+    segs = np.concatenate( segs )
+    if ( segs.size == 0 ):
+        return []
+
+    return [ E[ chain ] for chain in _stitch( segs ) ]
+
+def intersect_lines_many( M: np.ndarray, L: np.ndarray ) -> tuple[ np.ndarray, np.ndarray, np.ndarray ]:
+    # Intersect the conics M ( ..., 3, 3 ) with the lines L ( ..., 3 ).
+    # The stacks are broadcast against each other. It returns the points
+    # p1 and p2 ( ..., 3 ) and a ( ..., 2 )-mask of the valid ones. A
+    # tangent line has p1 == p2 and only p1 is valid. Invalid points are
+    # null vectors.
+    M = np.asarray( M, dtype = float )
+    L = np.asarray( L, dtype = float )
+    a = L[ ..., 0 ]
+    b = L[ ..., 1 ]
+    n2 = a * a + b * b
+    finite = n2 > 0.0
+    n2 = np.where( finite, n2, 1.0 )
+    n = np.sqrt( n2 )
+
+    # Each line is p0 + t * d, where p0 is the foot of the perpendicular
+    # from the origin and d is the unit direction. So, t is a distance.
+    p0 = np.stack( [ -a * L[ ..., 2 ] / n2, -b * L[ ..., 2 ] / n2, np.ones_like( a ) ], axis = -1 )
+    d = np.stack( [ b / n, -a / n, np.zeros_like( a ) ], axis = -1 )
+
+    # ( d.T * M * d ) * t^2 + 2 * ( p0.T * M * d ) * t + p0.T * M * p0 = 0.
+    Md = ( M @ d[ ..., np.newaxis ] )[ ..., 0 ]
+    A = np.sum( d * Md, axis = -1 )
+    B = np.sum( p0 * Md, axis = -1 )
+    C = np.sum( p0 * ( M @ p0[ ..., np.newaxis ] )[ ..., 0 ], axis = -1 )
+    p0 = np.broadcast_to( p0, A.shape + ( 3, ) )
+    d = np.broadcast_to( d, A.shape + ( 3, ) )
+    finite = np.broadcast_to( finite, A.shape )
+
+    # Relative tolerances of the quadratic and linear cases.
+    scale = np.maximum( np.maximum( np.abs( A ), np.abs( B ) ), np.abs( C ) )
+    scale = np.where( scale > 0.0, scale, 1.0 )
+    quad = np.abs( A ) > ctol.eps_relzero * scale
+    disc = B * B - A * C
+    tangent = quad & ( np.abs( disc ) <= ctol.eps_relzero * scale * scale )
+    secant = quad & ( disc > 0.0 ) & ~tangent
+    linear = ~quad & ( np.abs( B ) > ctol.eps_relzero * scale )
+
+    # Roots of the quadratic case. The stable form avoids cancellation.
+    root = np.sqrt( np.where( secant, disc, 0.0 ) )
+    q = -( B + np.where( B >= 0.0, root, -root ) )
+    A_ = np.where( quad, A, 1.0 )
+    t1 = np.where( secant | tangent, q / A_, 0.0 )
+    q_ = np.where( q != 0.0, q, 1.0 )
+    t2 = np.where( secant, np.where( q != 0.0, C / q_, -t1 ), t1 )
+
+    # Linear case: one finite point and the point at infinity d.
+    t1 = np.where( linear, -C / np.where( linear, 2.0 * B, 1.0 ), t1 )
+
+    P1 = p0 + t1[ ..., np.newaxis ] * d
+    P2 = np.where( linear[ ..., np.newaxis ], d, p0 + t2[ ..., np.newaxis ] * d )
+    valid = np.stack( [ finite & ( secant | tangent | linear ), finite & ( secant | linear ) ], axis = -1 )
+    P1[ ~valid[ ..., 0 ] ] = 0.0
+    P2[ ~valid[ ..., 1 ] ] = 0.0
+    return P1, P2, valid
+
+def tangents_from_many( M: np.ndarray, P: np.ndarray ) -> tuple[ np.ndarray, np.ndarray, np.ndarray ]:
+    # Get the tangent lines to the conics M ( ..., 3, 3 ) through the
+    # points P ( ..., 3 ). The stacks are broadcast against each other.
+    # The polar line of each point meets the conic at the points of
+    # tangency, whose polar lines are the tangents. It returns the lines
+    # l1 and l2 ( ..., 3 ) and a ( ..., 2 )-mask of the valid ones. A point
+    # on the conic has only l1 valid and interior points have none.
+    # Invalid lines are null vectors.
+    M = np.asarray( M, dtype = float )
+    P = np.asarray( P, dtype = float )
+    Q1, Q2, valid = intersect_lines_many( M, ( M @ P[ ..., np.newaxis ] )[ ..., 0 ] )
+    L1 = ( M @ Q1[ ..., np.newaxis ] )[ ..., 0 ]
+    L2 = ( M @ Q2[ ..., np.newaxis ] )[ ..., 0 ]
+
+    # The line at the infinity ( the tangent of a parabola at its point
+    # at the infinity ) is not a valid tangent.
+    valid[ ..., 0 ] &= np.any( L1[ ..., 0 : 2 ] != 0.0, axis = -1 )
+    valid[ ..., 1 ] &= np.any( L2[ ..., 0 : 2 ] != 0.0, axis = -1 )
+    L1[ ~valid[ ..., 0 ] ] = 0.0
+    L2[ ~valid[ ..., 1 ] ] = 0.0
+    return L1, L2, valid
+
+def intersect_conics_many( C1: np.ndarray, C2: np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+    # Intersect the pairs of conics of two ( K, 3, 3 )-stacks. It returns
+    # the ( K, 4, 3 )-stack of points and a ( K, 4 )-mask of the valid and
+    # distinct ones. Invalid points are null vectors.
+    C1 = np.asarray( C1, dtype = float )
+    C2 = np.asarray( C2, dtype = float )
+    K = C1.shape[ 0 ]
+
+    # Move the conics to a frame where they have a unit size around the
+    # origin, i.e. x = G * x', so their coefficients do not depend on the
+    # scale and the position of the pair.
+    G = _pair_frame_many( C1, C2 )
+    Gt = np.swapaxes( G, 1, 2 )
+    C1 = Gt @ C1 @ G
+    C2 = Gt @ C2 @ G
+
+    # Scale the conics to unit norm, so their determinants are comparable.
+    n1 = LA.norm( C1, axis = ( 1, 2 ) )
+    n2 = LA.norm( C2, axis = ( 1, 2 ) )
+    C1 = C1 / np.where( n1 > 0.0, n1, 1.0 )[ :, np.newaxis, np.newaxis ]
+    C2 = C2 / np.where( n2 > 0.0, n2, 1.0 )[ :, np.newaxis, np.newaxis ]
+
+    # The pencil is A + lambda * B, where B is the conic with the largest
+    # determinant, so the cubic det( A + lambda * B ) = 0 has a leading
+    # coefficient that is not zero, unless both conics are degenerate.
+    swap = np.abs( LA.det( C1 ) ) > np.abs( LA.det( C2 ) )
+    A = np.where( swap[ :, np.newaxis, np.newaxis ], C2, C1 )
+    B = np.where( swap[ :, np.newaxis, np.newaxis ], C1, C2 )
+
+    # det( A + l * B ) = det( A ) + tr( adj( A ) * B ) * l + tr( A * adj( B ) ) * l^2 + det( B ) * l^3.
+    c3 = LA.det( B )
+    c2 = np.einsum( 'kij,kji->k', A, adjugate( B ) )
+    c1 = np.einsum( 'kij,kji->k', adjugate( A ), B )
+    c0 = LA.det( A )
+    cmax = np.max( np.abs( np.stack( [ c0, c1, c2, c3 ] ) ), axis = 0 )
+    cubic = np.abs( c3 ) > ctol.eps_relzero * cmax
+
+    # Roots of the cubics. When both conics are degenerate, A itself is
+    # the degenerate member.
+    c3_ = np.where( cubic, c3, 1.0 )
+    roots = _cubic_roots( c2 / c3_, c1 / c3_, c0 / c3_ )
+    roots[ ~cubic ] = 0.0
+
+    # A real root whose member is a pair of real lines ( or a double line )
+    # has an adjugate with no positive diagonal entries.
+    real = np.abs( roots.imag ) <= np.sqrt( ctol.eps_relzero ) * ( 1.0 + np.abs( roots.real ) )
+    D = A[ :, np.newaxis ] + roots.real[ :, :, np.newaxis, np.newaxis ] * B[ :, np.newaxis ]
+    adjD = adjugate( D )
+    diag = np.diagonal( adjD, axis1 = -2, axis2 = -1 )
+    nD = LA.norm( D, axis = ( -2, -1 ) )
+    score = np.max( diag, axis = -1 ) / np.maximum( nD * nD, ctol.eps_relzero )
+    score[ ~real ] = np.inf
+    r = np.argmin( score, axis = 1 )
+    idx = np.arange( K )
+    D = D[ idx, r ]
+    adjD = adjD[ idx, r ]
+    split = score[ idx, r ] <= ctol.eps_relzero
+
+    # Split the degenerate members into two lines.
+    g, h = _split_lines( D, adjD )
+
+    # Intersect those lines with B and drop the repeated points.
+    L = np.stack( [ g, h ], axis = 1 )
+    P1, P2, valid = intersect_lines_many( B[ :, np.newaxis ], L )
+    P = np.stack( [ P1[ :, 0 ], P2[ :, 0 ], P1[ :, 1 ], P2[ :, 1 ] ], axis = 1 )
+    valid = np.stack( [ valid[ :, 0, 0 ], valid[ :, 0, 1 ], valid[ :, 1, 0 ], valid[ :, 1, 1 ] ], axis = 1 )
+    valid &= split[ :, np.newaxis ]
+    P = P / np.maximum( LA.norm( P, axis = 2, keepdims = True ), np.finfo( float ).tiny )
+    for i in range( 1, 4 ):
+        for j in range( i ):
+            same = np.minimum( LA.norm( P[ :, i ] - P[ :, j ], axis = 1 ),
+                               LA.norm( P[ :, i ] + P[ :, j ], axis = 1 ) ) <= ctol.eps_iszero
+            valid[ :, i ] &= ~( same & valid[ :, j ] )
+
+    # Back to the original frame.
+    P = np.einsum( 'kij,knj->kni', G, P )
+    P[ ~valid ] = 0.0
+    return P, valid
+
+def canonical_many( M: np.ndarray, rk: np.ndarray | None = None,
+                    eigh: tuple[ np.ndarray, np.ndarray ] | None = None ) -> dict[ str, np.ndarray ]:
+    # Classify a ( K, 3, 3 )-stack of conics and get their canonical
+    # parameters. It returns a dict of arrays:
+    #   'type':   ( K, ) codes into CONIC_TYPES.
+    #   'center': ( K, 2 ) centers ( the vertex of a parabola ).
+    #   'axes':   ( K, 2 ) semi-axes ( a, b ) of ellipses and hyperboles.
+    #   'angle':  ( K, ) angle of the major ( transverse ) axis or of the
+    #             axis of a parabola, in [ -pi/2, pi/2 ).
+    #   'foci':   ( K, 2, 2 ) foci. A parabola has only the first one.
+    # Undefined values are NaN. The ranks and the eigen-decomposition of
+    # the quadratic parts may be passed in, when they are already known.
+    K = M.shape[ 0 ]
+    if ( rk is None ):
+        rk = rank_many( M )
+    lambdas, V = LA.eigh( M[ :, 0 : 2, 0 : 2 ] ) if ( eigh is None ) else eigh
+
+    # The quadratic part is singular when its eigenvalues are too far apart.
+    lmax = np.max( np.abs( lambdas ), axis = 1 )
+    lmin = np.min( np.abs( lambdas ), axis = 1 )
+    detA = lambdas[ :, 0 ] * lambdas[ :, 1 ]
+    central = lmin > ctol.eps_relzero * lmax
+
+    # Linear and constant terms in the eigenbasis.
+    d = np.einsum( 'kji,kj->ki', V, M[ :, 0 : 2, 2 ] )
+    c = M[ :, 2, 2 ]
+
+    kind = np.zeros( K, dtype = int )
+    center = np.full( ( K, 2 ), np.nan )
+    axes = np.full( ( K, 2 ), np.nan )
+    angle = np.full( K, np.nan )
+    foci = np.full( ( K, 2, 2 ), np.nan )
+
+    # Central conics. Translated to the center, they become
+    # u.T * A * u + f = 0, and k holds the signed squared semi-axes.
+    # i is the index of the major ( transverse ) axis.
+    ic = np.flatnonzero( central & ( rk >= 2 ) )
+    lc = lambdas[ ic ]
+    uv = -d[ ic ] / lc
+    center[ ic ] = np.einsum( 'kij,kj->ki', V[ ic ], uv )
+    f = c[ ic ] + np.sum( d[ ic ] * uv, axis = 1 )
+    k = -f[ :, np.newaxis ] / lc
+    i = np.argmax( k, axis = 1 )
+    r = np.arange( ic.size )
+    ka, kb = k[ r, i ], k[ r, 1 - i ]
+    ellipse = detA[ ic ] > 0.0
+    full = rk[ ic ] == 3
+    kind[ ic ] = np.select( [ full & ellipse & ( ka > 0.0 ), full & ellipse, full, ellipse ], [ 1, 2, 3, 5 ], 6 )
+
+    real = ( kind[ ic ] == 1 ) | ( kind[ ic ] == 3 )
+    ab = np.sqrt( np.abs( np.stack( [ ka, kb ], axis = 1 ) ) )
+    ab[ ~real ] = np.nan
+    axes[ ic ] = ab
+    angle[ ic ] = _axis_angle( V[ ic, :, i ] )
+    angle[ ic[ ~real ] ] = np.nan
+    u = np.stack( [ np.cos( angle[ ic ] ), np.sin( angle[ ic ] ) ], axis = 1 )
+    fc = np.sqrt( np.abs( ab[ :, 0 ] ** 2 - np.where( ellipse, 1.0, -1.0 ) * ab[ :, 1 ] ** 2 ) )
+    foci[ ic, 0 ] = center[ ic ] + fc[ :, np.newaxis ] * u
+    foci[ ic, 1 ] = center[ ic ] - fc[ :, np.newaxis ] * u
+
+    # Non-central conics. j is the index of the nonzero eigenvalue, so
+    # the conic is l * s^2 + 2 * ds * s + 2 * dt * t + c = 0 in the
+    # eigenbasis ( s, t ).
+    inc = np.flatnonzero( ~central & ( rk >= 1 ) )
+    j = np.argmax( np.abs( lambdas[ inc ] ), axis = 1 )
+    r = np.arange( inc.size )
+    l = lambdas[ inc, j ]
+    ds, dt = d[ inc, j ], d[ inc, 1 - j ]
+    vs, vt = V[ inc, :, j ], V[ inc, :, 1 - j ]
+    disc = ds * ds - l * c[ inc ]
+    kind[ inc ] = np.select( [ rk[ inc ] == 3, rk[ inc ] == 1, disc > 0.0 ], [ 4, 9, 7 ], 8 )
+
+    # Parabolas: t - t0 = ( s - s0 )^2 / ( 4 * p ).
+    parabola = kind[ inc ] == 4
+    ip = inc[ parabola ]
+    l, ds, dt, c0 = l[ parabola ], ds[ parabola ], dt[ parabola ], c[ ip ]
+    vs, vt = vs[ parabola ], vt[ parabola ]
+    s0 = -ds / l
+    t0 = ( ds * ds / l - c0 ) / ( 2.0 * dt )
+    p = -dt / ( 2.0 * l )
+    center[ ip ] = s0[ :, np.newaxis ] * vs + t0[ :, np.newaxis ] * vt
+    foci[ ip, 0 ] = center[ ip ] + p[ :, np.newaxis ] * vt
+    angle[ ip ] = _axis_angle( vt )
+
+    return { 'type': kind, 'center': center, 'axes': axes, 'angle': angle, 'foci': foci }
+
+def conic_from_points_many( P: np.ndarray ) -> np.ndarray:
+    # Get the conics through the points of a ( K, 5, 3 )-stack of
+    # homogeneous coords. Each conic spans the null space of the ( 5, 6 )-
+    # matrix A whose rows are [ x^2 x*y y^2 x*w y*w w^2 ]. Five points that
+    # do not define a unique conic ( e.g. four of them are collinear )
+    # give a null matrix.
+    # Hartley's normalization of each group of points, where T moves the
+    # centroid of the finite points to ( 0, 0 ) and scales them to a mean
+    # distance of sqrt( 2 ).
+    K = P.shape[ 0 ]
+    w = P[ ..., 2 ]
+    finite = w != 0.0
+    n = np.maximum( np.count_nonzero( finite, axis = 1 ), 1 )
+    xy = np.divide( P[ ..., 0 : 2 ], w[ ..., np.newaxis ], out = np.zeros( ( K, 5, 2 ) ),
+                    where = finite[ ..., np.newaxis ] )
+    c = np.sum( xy, axis = 1 ) / n[ :, np.newaxis ]
+    d = np.sum( LA.norm( xy - c[ :, np.newaxis ], axis = 2 ) * finite, axis = 1 ) / n
+    s = np.sqrt( 2.0 ) / np.where( d > 0.0, d, np.sqrt( 2.0 ) )
+    T = np.zeros( ( K, 3, 3 ) )
+    T[ :, 0, 0 ] = T[ :, 1, 1 ] = s
+    T[ :, 0 : 2, 2 ] = -s[ :, np.newaxis ] * c
+    T[ :, 2, 2 ] = 1.0
+    P = np.einsum( 'kij,knj->kni', T, P )
+    P = P / np.maximum( LA.norm( P, axis = 2, keepdims = True ), np.finfo( float ).tiny )
+    x, y, w = P[ ..., 0 ], P[ ..., 1 ], P[ ..., 2 ]
+    A = np.stack( [ x * x, x * y, y * y, x * w, y * w, w * w ], axis = 2 )
+
+    # The null vector is the generalized cross product of the rows of A,
+    # i.e. its signed 5x5 minors. Its norm is the volume spanned by the
+    # rows, so a tiny norm means that the null space is larger.
+    theta = LA.det( np.moveaxis( A[ :, :, _MINORS ], 2, 1 ) ) * [ 1.0, -1.0, 1.0, -1.0, 1.0, -1.0 ]
+    valid = LA.norm( theta, axis = 1 ) > ctol.eps_relzero * np.prod( LA.norm( A, axis = 2 ), axis = 1 )
+
+    M = np.empty( ( P.shape[ 0 ], 3, 3 ) )
+    M[ :, 0, 0 ], M[ :, 1, 1 ], M[ :, 2, 2 ] = theta[ :, 0 ], theta[ :, 2 ], theta[ :, 5 ]
+    M[ :, 0, 1 ] = M[ :, 1, 0 ] = theta[ :, 1 ] / 2
+    M[ :, 0, 2 ] = M[ :, 2, 0 ] = theta[ :, 3 ] / 2
+    M[ :, 1, 2 ] = M[ :, 2, 1 ] = theta[ :, 4 ] / 2
+    M = np.swapaxes( T, 1, 2 ) @ M @ T
+    M[ ~valid ] = 0.0
+    M[ valid ] = normalize_many( M[ valid ] )
+    return M
+
+def adjugate( M: np.ndarray ) -> np.ndarray:
+    # Adjugate of a ( ..., 3, 3 )-stack. Its columns are the cross products
+    # of the rows of M.
+    a, b, c = M[ ..., 0, 0 ], M[ ..., 0, 1 ], M[ ..., 0, 2 ]
+    d, e, f = M[ ..., 1, 0 ], M[ ..., 1, 1 ], M[ ..., 1, 2 ]
+    g, h, i = M[ ..., 2, 0 ], M[ ..., 2, 1 ], M[ ..., 2, 2 ]
+    adj = np.empty( M.shape )
+    adj[ ..., 0, 0 ] = e * i - f * h
+    adj[ ..., 0, 1 ] = c * h - b * i
+    adj[ ..., 0, 2 ] = b * f - c * e
+    adj[ ..., 1, 0 ] = f * g - d * i
+    adj[ ..., 1, 1 ] = a * i - c * g
+    adj[ ..., 1, 2 ] = c * d - a * f
+    adj[ ..., 2, 0 ] = d * h - e * g
+    adj[ ..., 2, 1 ] = b * g - a * h
+    adj[ ..., 2, 2 ] = a * e - b * d
+    return adj
+
+def normalize_many( M: np.ndarray ) -> np.ndarray:
+    # Scale a ( K, 3, 3 )-stack of conics as the CConic constructor does:
+    # the constant term of a central conic is -1 when it is translated to
+    # its center. Otherwise, the matrix gets unit norm.
+    detA = M[ :, 0, 0 ] * M[ :, 1, 1 ] - M[ :, 0, 1 ] * M[ :, 1, 0 ]
+    nA = LA.norm( M[ :, 0 : 2, 0 : 2 ], axis = ( 1, 2 ) )
+    central = np.abs( detA ) > ctol.eps_relzero * nA * nA
+    f = np.divide( LA.det( M ), detA, out = np.zeros_like( detA ), where = central )
+    n = LA.norm( M, axis = ( 1, 2 ) )
+    central &= np.abs( f ) > ctol.eps_relzero * n
+    s = np.where( central, -f, n )
+    s[ s == 0.0 ] = 1.0
+    M = M / s[ :, np.newaxis, np.newaxis ]
+    return ctol.adjust2relzeros_many( ( M + np.swapaxes( M, 1, 2 ) ) / 2, 2 )
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+# Columns of A that are kept in each 5x5 minor.
+_MINORS = [ [ j for j in range( 6 ) if ( j != i ) ] for i in range( 6 ) ]
+
+def _pair_frame_many( C1: np.ndarray, C2: np.ndarray ) -> np.ndarray:
+    # Hartley's normalization of the pairs of conics of two ( K, 3, 3 )-
+    # stacks. It returns the ( K, 3, 3 )-transforms G = [ [ s, 0, cx ],
+    # [ 0, s, cy ], [ 0, 0, 1 ] ], where c is the mean of the centers of
+    # the central conics of the pair ( or ( 0, 0 ) ) and s is the geometric
+    # mean of the sizes of the conics translated to c.
+    K = C1.shape[ 0 ]
+    M = np.stack( [ C1, C2 ], axis = 1 )
+    Q = M[ ..., 0 : 2, 0 : 2 ]
+    detQ = Q[ ..., 0, 0 ] * Q[ ..., 1, 1 ] - Q[ ..., 0, 1 ] * Q[ ..., 1, 0 ]
+    nQ = LA.norm( Q, axis = ( -2, -1 ) )
+    central = np.abs( detQ ) > ctol.eps_relzero * nQ * nQ
+    d = M[ ..., 0 : 2, 2 ]
+    detQ_ = np.where( central, detQ, 1.0 )
+    centers = np.stack( [ Q[ ..., 0, 1 ] * d[ ..., 1 ] - Q[ ..., 1, 1 ] * d[ ..., 0 ],
+                          Q[ ..., 1, 0 ] * d[ ..., 0 ] - Q[ ..., 0, 0 ] * d[ ..., 1 ] ], axis = -1 ) / detQ_[ ..., np.newaxis ]
+    n = np.count_nonzero( central, axis = 1 )
+    c = np.sum( centers * central[ ..., np.newaxis ], axis = 1 ) / np.maximum( n, 1 )[ :, np.newaxis ]
+
+    # Size of each conic around c: the radius of a circle centered at c,
+    # or the length given by its linear terms.
+    Qc = np.einsum( 'knij,kj->kni', Q, c )
+    f = M[ ..., 2, 2 ] + np.sum( ( 2.0 * d + Qc ) * c[ :, np.newaxis ], axis = 2 )
+    d = d + Qc
+    nQ_ = np.where( nQ > 0.0, nQ, 1.0 )
+    size = np.maximum( np.sqrt( np.abs( f ) / nQ_ ), LA.norm( d, axis = 2 ) / nQ_ )
+    size = np.where( ( nQ > 0.0 ) & ( size > 0.0 ) & np.isfinite( size ), size, 1.0 )
+    s = np.sqrt( size[ :, 0 ] * size[ :, 1 ] )
+
+    G = np.zeros( ( K, 3, 3 ) )
+    G[ :, 0, 0 ] = G[ :, 1, 1 ] = s
+    G[ :, 0 : 2, 2 ] = c
+    G[ :, 2, 2 ] = 1.0
+    return G
+
+def _axis_angle( v: np.ndarray ) -> np.ndarray:
+    # Angle of the directions in the ( K, 2 )-matrix v, in [ -pi/2, pi/2 ).
+    a = np.arctan2( v[ :, 1 ], v[ :, 0 ] )
+    return ( a + cconst.pi / 2 ) % cconst.pi - cconst.pi / 2
+
+def _cubic_roots( a2: np.ndarray, a1: np.ndarray, a0: np.ndarray ) -> np.ndarray:
+    # Roots of the monic cubics x^3 + a2 * x^2 + a1 * x + a0 = 0 by the
+    # Cardano's formula, polished by Newton's method. It returns a ( K, 3 )
+    # complex array.
+    p = a1 - a2 * a2 / 3.0
+    q = 2.0 * a2 ** 3 / 27.0 - a2 * a1 / 3.0 + a0
+    sq = np.sqrt( ( q * q / 4.0 + p ** 3 / 27.0 ).astype( complex ) )
+
+    # The larger of -q / 2 +- sq avoids cancellation.
+    w1 = -q / 2.0 + sq
+    w2 = -q / 2.0 - sq
+    w = np.where( np.abs( w1 ) >= np.abs( w2 ), w1, w2 )
+    u = w ** ( 1.0 / 3.0 )
+    v = np.where( u != 0.0, -p / np.where( u != 0.0, u, 1.0 ) / 3.0, 0.0 )
+
+    omega = complex( -0.5, np.sqrt( 3.0 ) / 2.0 )
+    x = np.stack( [ u + v, omega * u + omega.conjugate() * v,
+                    omega.conjugate() * u + omega * v ], axis = -1 ) - ( a2 / 3.0 )[ :, np.newaxis ]
+
+    # Newton's steps.
+    a2 = a2[ :, np.newaxis ]
+    a1 = a1[ :, np.newaxis ]
+    a0 = a0[ :, np.newaxis ]
+    for _ in range( 2 ):
+        f = ( ( x + a2 ) * x + a1 ) * x + a0
+        df = ( 3.0 * x + 2.0 * a2 ) * x + a1
+        x = x - np.where( df != 0.0, f / np.where( df != 0.0, df, 1.0 ), 0.0 )
+    return x
+
+def _split_lines( D: np.ndarray, adjD: np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+    # Split the degenerate conics D = g * h.T + h * g.T of a ( K, 3, 3 )-stack.
+    # adj( D ) = -p * p.T, where p is the meet of g and h, and D + [ p ]x
+    # has rank 1, so a row and a column of it are the lines.
+    K = D.shape[ 0 ]
+    idx = np.arange( K )
+    diag = np.diagonal( adjD, axis1 = -2, axis2 = -1 )
+    i = np.argmin( diag, axis = 1 )
+    beta = np.sqrt( np.maximum( -diag[ idx, i ], 0.0 ) )
+    nD = LA.norm( D, axis = ( 1, 2 ) )
+    pair = beta > ctol.eps_relzero * nD * nD
+    p = adjD[ idx, :, i ] / np.where( pair, beta, 1.0 )[ :, np.newaxis ]
+
+    Px = np.zeros( ( K, 3, 3 ) )
+    Px[ :, 0, 1 ] = p[ :, 2 ]
+    Px[ :, 0, 2 ] = -p[ :, 1 ]
+    Px[ :, 1, 0 ] = -p[ :, 2 ]
+    Px[ :, 1, 2 ] = p[ :, 0 ]
+    Px[ :, 2, 0 ] = p[ :, 1 ]
+    Px[ :, 2, 1 ] = -p[ :, 0 ]
+    E = D + Px
+    rc = np.argmax( np.abs( E ).reshape( K, 9 ), axis = 1 )
+    g = E[ idx, rc // 3, : ]
+    h = E[ idx, :, rc % 3 ]
+
+    # A double line is any row of D with the largest diagonal entry.
+    j = np.argmax( np.abs( np.diagonal( D, axis1 = -2, axis2 = -1 ) ), axis = 1 )
+    g = np.where( pair[ :, np.newaxis ], g, D[ idx, j, : ] )
+    h = np.where( pair[ :, np.newaxis ], h, D[ idx, j, : ] )
+    return g, h
+
+def _stitch( segs: np.ndarray ) -> list[ list[ int ] ]:
+    # Join the segments that share an edge. Each edge belongs to at most
+    # two segments, so the chains are open ( ends at the grid border ) or
+    # closed ( the first node is repeated at the end ).
+    ends = np.concatenate( ( segs[ :, 0 ], segs[ :, 1 ] ) )
+    others = np.concatenate( ( segs[ :, 1 ], segs[ :, 0 ] ) )
+    order = np.argsort( ends, kind = 'stable' )
+    ends = ends[ order ]
+    others = others[ order ]
+    first = np.concatenate( ( [ True ], ends[ 1 : ] != ends[ : -1 ] ) )
+
+    nbrs: dict[ int, list[ int ] ] = {}
+    for e, o in zip( ends.tolist(), others.tolist() ):
+        nbrs.setdefault( e, [] ).append( o )
+    degree = { e: len( n ) for e, n in nbrs.items() }
+
+    # Open chains start at nodes of degree 1. Closed ones start anywhere.
+    starts = [ e for e in ends[ first ].tolist() if ( degree[ e ] == 1 ) ]
+    starts += [ e for e in ends[ first ].tolist() if ( degree[ e ] == 2 ) ]
+
+    visited: set[ int ] = set()
+    chains = []
+    for s in starts:
+        if ( s in visited ):
+            continue
+        chain = [ s ]
+        visited.add( s )
+        prev, node = -1, s
+        while ( True ):
+            nxt = [ n for n in nbrs[ node ] if ( n != prev ) ]
+            if ( ( len( nxt ) == 0 ) or ( ( nxt[ 0 ] in visited ) and ( nxt[ 0 ] != s ) ) ):
+                break
+            prev, node = node, nxt[ 0 ]
+            chain.append( node )
+            if ( node == s ):
+                break
+            visited.add( node )
+        chains.append( chain )
+    return chains
+
+def _inside_box( P: np.ndarray, xlim: tuple[ float, float ], ylim: tuple[ float, float ] ) -> np.ndarray:
+    return ( ( P[ :, 0 ] >= xlim[ 0 ] ) & ( P[ :, 0 ] <= xlim[ 1 ] ) &
+             ( P[ :, 1 ] >= ylim[ 0 ] ) & ( P[ :, 1 ] <= ylim[ 1 ] ) )
+
+def _split_runs( mask: np.ndarray ) -> list[ tuple[ int, int ] ]:
+    # Return the [ start, end ) intervals where mask is True.
+    d = np.diff( np.concatenate( ( [ 0 ], mask.astype( np.int8 ), [ 0 ] ) ) )
+    return list( zip( np.flatnonzero( d == 1 ), np.flatnonzero( d == -1 ) ) )
+
+def _sample_runs( curve: Callable[ [ np.ndarray ], np.ndarray ], t0: float, t1: float, n: int,
+                  xlim: tuple[ float, float ], ylim: tuple[ float, float ] ) -> list[ np.ndarray ]:
+    # A coarse pass finds the pieces of the curve in the box. Then each
+    # piece is sampled again with n points between its bracketing samples.
+    t = np.linspace( t0, t1, n )
+    inside = _inside_box( curve( t ), xlim, ylim )
+    runs = []
+    for start, end in _split_runs( inside ):
+        tt = np.linspace( t[ max( start - 1, 0 ) ], t[ min( end, n - 1 ) ], n )
+        P = curve( tt )
+        for s, e in _split_runs( _inside_box( P, xlim, ylim ) ):
+            runs.append( P[ s : e ] )
+    return runs
+
 #------------------------------------------------------------------
 # For development and test.
 #  
@@ -187,3 +819,10 @@ if __name__ == '__main__':
     # print( f'Rank of Matrix A: {rank( A )} --- Det of A: {LA.det( A )}' )
     A = np.array( [ [ 40, -17, 166 ], [ -17, -20, -125 ], [ 166, -125, 580 ] ] )
     print( f'Rank of Matrix A: {rank( A )} --- Det of A: {LA.det( A )}' )
+
+    # Sampling an ellipse and a hyperbola inside a box.
+    runs = sample_conic( C5.gform, ( -1.0, 5.0 ), ( -1.0, 3.0 ), 11 )
+    print( [ P.shape for P in runs ] ) # type: ignore
+    C7 = CConic( 1.0, 2.0, 0.0, CPoint( ( 0, 0 ) ), 'C7' )
+    runs = sample_conic( C7.gform, ( -3.0, 3.0 ), ( -2.0, 2.0 ), 11 )
+    print( [ P.shape for P in runs ] ) # type: ignore
@@ -39,6 +39,8 @@ np.set_printoptions( formatter = { 'float': lambda x: "{0:0.4e}".format( x ) } )
 # Class CLine.
 #  
 class CLine( CAGObj ):
+    __slots__ = ()
+
     def __init__( self,
                   line: tuple[ float, float, float ] = ( 1.0, -1.0, 0.0 ),
                   /,
@@ -54,12 +56,28 @@ class CLine( CAGObj ):
         self._gform = ctol.adjust2relzeros( self._gform )
 
         # Store this value to be possible restore it to the origin.
-        self._from_origin = self._gform.copy()
+        # Both forms share the same array while the origin is not shifted.
+        self._from_origin = self._gform
 
         # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
         if ( shift_origin == True ):
             self.update_origin()
 
+    @classmethod
+    def from_array( cls, gform: np.ndarray, name: str = '', *, shift_origin: bool = False ) -> CLine:
+        # Trusted constructor. gform must be a float ( 3, )-array that has
+        # already been adjusted to relative zeros. It is neither validated
+        # nor copied.
+        l = cls.__new__( cls )
+        l.name = name
+        l._gform = gform
+        l._from_origin = gform
+
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        if ( shift_origin == True ):
+            l.update_origin()
+        return l
+
     def __repr__( self ) -> str:
         # return an info messsage for this class.
         info = f'{self.name}: ( x, y ) | {self.gform} * [ x y 1 ].T = 0'
@@ -72,8 +90,7 @@ class CLine( CAGObj ):
         self._gform = corigin.change_line( self._from_origin )
 
     def copy( self ) -> CLine:
-        xy  = ( self._gform[ 0 ], self._gform[ 1 ], self._gform[ 2 ] )
-        return CLine( xy, self.name, shift_origin = False )
+        return CLine.from_array( self._gform.copy(), self.name )
 
     def cross( self, other: CPoint | CLine ) -> Any[ CPoint | CLine ]:
         from pyConics.utils import cross
@@ -151,18 +168,22 @@ class CLine( CAGObj ):
 
         # Test for lines at infinity.
         if ( ( self.gform[ 0 ] == 0.0 ) and ( self.gform[ 1 ] == 0.0 ) ):
-            return tuple( [ CPoint( ( 0.0, 0.0, 0.0 ), shift_origin = False ) ] )
+            return tuple( [ CPoint.from_array( np.zeros( 3 ) ) ] )
 
         # Test for the other conditions.
-        y = x
         alp: float = self.gform[ 0 ]
         bet: float = self.gform[ 1 ]
         gam: float = self.gform[ 2 ]
-        for i, _x in enumerate( x ):
-            if ( bet == 0.0 ):
-                xy.append( CPoint( ( -gam / alp, y [ i ] ), shift_origin = False ) )
-            else:
-                xy.append( CPoint( ( _x, ( ( -alp * _x ) - gam ) / bet ), shift_origin = False ) )
+        XY = np.empty( ( len( x ), 3 ) )
+        XY[ :, 2 ] = 1.0
+        if ( bet == 0.0 ):
+            XY[ :, 0 ] = -gam / alp
+            XY[ :, 1 ] = x
+        else:
+            XY[ :, 0 ] = x
+            XY[ :, 1 ] = ( ( -alp * XY[ :, 0 ] ) - gam ) / bet
+        for v in XY:
+            xy.append( CPoint.from_array( v ) )
         return tuple( xy )
     
     def coef_angular( self, return_angle = False ) -> float:
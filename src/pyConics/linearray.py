@@ -0,0 +1,201 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'CLineArray' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Sequence
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyConics.point import CPoint
+    from pyConics.pointarray import CPointArray
+
+from pyConics.constants import cconst
+from pyConics.agobj import CAGObj
+from pyConics.errors import CLineTypeError, CValueError
+from pyConics.origin import corigin
+from pyConics.tolerance import ctol
+from pyConics.line import CLine
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+np.set_printoptions( formatter = { 'float': lambda x: "{0:0.4e}".format( x ) } )
+
+#------------------------------------------------------------------
+# Class CLineArray.
+#
+class CLineArray( CAGObj ):
+    __slots__ = ()
+
+    def __init__( self,
+                  lines: np.ndarray | Sequence[ Any ] = np.zeros( ( 0, 3 ) ),
+                  /,
+                  name: str = '',
+                  *,
+                  shift_origin: bool = True ) -> None:
+        super().__init__( name )
+
+        # Redim the geometric form. It is a ( N, 3 )-matrix where
+        # each row is a line.
+        self._gform = _validate_lines( lines )
+
+        # Test for epsilon number condition.
+        self._gform = ctol.adjust2relzeros_many( self._gform )
+
+        # Store this value to be possible restore it to the origin.
+        # Both forms share the same array while the origin is not shifted.
+        self._from_origin = self._gform
+
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        if ( shift_origin == True ):
+            self.update_origin()
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        n_inf = int( np.count_nonzero( self.at_infinity() ) )
+        info = f'{self.name}: {len( self )} lines ( x, y ) | L * [ x y 1 ].T = 0\n{self.gform}'
+        if ( n_inf > 0 ):
+            info += f'\n-> {n_inf} lines at the infinity'
+        return info
+
+    def __len__( self ) -> int:
+        return self._gform.shape[ 0 ]
+
+    def __getitem__( self, key: int | slice | np.ndarray ) -> Any[ CLine | CLineArray ]:
+        # An integer returns a CLine whose arrays are views of the rows
+        # of this array. Otherwise, a new CLineArray is returned.
+        if ( isinstance( key, ( int, np.integer ) ) ):
+            name = f'{self.name}[{key}]' if ( self.name != '' ) else ''
+            l = CLine.from_array( self._gform[ key ], name )
+            l._from_origin = self._from_origin[ key ]
+            return l
+
+        L = CLineArray( name = self.name )
+        L._from_origin = self._from_origin[ key ]
+        L._gform = self._gform[ key ]
+        return L
+
+    def update_origin( self ) -> None:
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        self._gform = corigin.change_line( self._from_origin )
+
+    def copy( self ) -> CLineArray:
+        return CLineArray( self._gform.copy(), self.name, shift_origin = False )
+
+    def cross( self, other: CPoint | CLine | CPointArray | CLineArray, /,
+               *, outer: bool = False ) -> Any[ CPointArray | CLineArray ]:
+        from pyConics.utils import cross
+
+        # Get the cross product.
+        return cross( self, other, outer = outer )
+
+    def __mul__( self, other: CPoint | CLine | CPointArray | CLineArray ) -> Any[ CPointArray | CLineArray ]:
+        # Get the cross product.
+        return self.cross( other )
+
+    def at_infinity( self ) -> np.ndarray:
+        return ( self._gform[ :, 0 ] == 0.0 ) & ( self._gform[ :, 1 ] == 0.0 )
+
+    def coef_angular( self, return_angle = False ) -> np.ndarray:
+        # The lines can not be at infinity.
+        if ( self.at_infinity().any() ):
+            raise CValueError( CLineArray.__name__, 'A line at infinity has improper coeficients.' )
+
+        # Lines that are perpendicular to the y-axis get an infinite coef.
+        a = self._gform[ :, 0 ]
+        b = self._gform[ :, 1 ]
+        vert = b == 0.0
+        coef = np.where( a > 0, cconst.inf, -cconst.inf )
+        coef[ ~vert ] = -a[ ~vert ] / b[ ~vert ]
+
+        # Return angles in radians.
+        return np.arctan( coef ) if ( return_angle ) else coef
+
+    def coef_linear( self ) -> np.ndarray:
+        # The lines can not be at infinity.
+        if ( self.at_infinity().any() ):
+            raise CValueError( CLineArray.__name__, 'A line at infinity has improper coeficients.' )
+
+        # Lines that are perpendicular to the y-axis get an infinite coef.
+        b = self._gform[ :, 1 ]
+        c = self._gform[ :, 2 ]
+        vert = b == 0.0
+        coef = np.full( b.shape, cconst.inf )
+        coef[ ~vert ] = -c[ ~vert ] / b[ ~vert ]
+        return coef
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _validate_lines( lines: np.ndarray | Sequence[ Any ] ) -> np.ndarray:
+    # A sequence of CLines is stacked by using their original forms.
+    if ( ( not isinstance( lines, np.ndarray ) ) and ( len( lines ) > 0 ) and
+         ( isinstance( lines[ 0 ], CLine ) ) ):
+        return np.array( [ l.from_origin for l in lines ], dtype = float )
+
+    try:
+        L = np.array( lines, dtype = float )
+    except ValueError:
+        raise CLineTypeError( CLineArray.__name__, CLineArray.gform.fget.__name__ )
+    if ( L.size == 0 ):
+        return np.zeros( ( 0, 3 ) )
+    if ( ( L.ndim != 2 ) or ( L.shape[ 1 ] != 3 ) ):
+        raise CLineTypeError( CLineArray.__name__, CLineArray.gform.fget.__name__ )
+    return L
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    from pyConics.pointarray import CPointArray
+
+    import os
+    os.system( 'cls' )
+
+    # Shows info about an array of lines.
+    L = CLineArray( [ ( 1, -1, 1 ), ( 1, 0, -2 ), ( 0, 0, 1 ) ], 'L' )
+    print( L )
+    print( L.at_infinity() )
+    print()
+
+    # Angular and linear coefs.
+    L = CLineArray( [ ( 1, -1, 1 ), ( 1, 0, -2 ), ( 2, 1, 0 ) ], 'L' )
+    print( L.coef_angular() )
+    print( L.coef_angular( True ) )
+    print( L.coef_linear() )
+    print()
+
+    # Change the origin.
+    corigin.x = 0
+    corigin.y = 1
+    L.update_origin()
+    print( corigin )
+    print( L )
+    corigin.reset()
+    L.update_origin()
+    print( corigin )
+    print( L )
+    print()
+
+    # Join and meet.
+    P1 = CPointArray( [ ( 1, 1 ), ( 0, 1 ) ] )
+    P2 = CPointArray( [ ( -1, -1 ), ( 1, 0 ) ] )
+    L = P1 * P2 # y = x and y = -x + 1
+    print( L )
+    print( L[ 0 ] * L[ 1 ] )
+    print( L * L[ :: -1 ] )
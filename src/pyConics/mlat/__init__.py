@@ -0,0 +1,14 @@
+#------------------------------------------------------------------
+# __init__ dunder.
+#
+# It defines a package in Python.
+#
+
+#------------------------------------------------------------------
+# Modules that belong to pyConics.mlat package.
+#
+from pyConics.mlat.stations import *
+from pyConics.mlat.tdoa import *
+from pyConics.mlat.solver import *
+from pyConics.mlat.pipeline import *
+from pyConics.mlat.parallel import *
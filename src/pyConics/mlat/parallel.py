@@ -0,0 +1,197 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'CMlatPool' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.errors import CValueError
+from pyConics.pointarray import CPointArray
+from pyConics.mlat.stations import CStations, _station_coords
+from pyConics.mlat.solver import solve_tdoa, _weights, _solve, _positions
+
+#------------------------------------------------------------------
+# Import as...
+#
+import os
+import sys
+import numpy as np
+
+# Emitters per task when the shard size is not given.
+MIN_SHARD_SIZE = 1024
+
+#------------------------------------------------------------------
+# Class CMlatPool.
+#
+class CMlatPool:
+    __slots__ = ( '_S', '_workers', '_executor' )
+
+    def __init__( self, stations: CStations | CPointArray | np.ndarray, workers: int | None = None,
+                  mp_context: object = None ) -> None:
+        # A pool of worker processes that solve shards of large emitter
+        # batches with solve_tdoa. The stations are sent once to each
+        # worker, when it starts. The measurements and the results go
+        # through a shared memory block, so the tasks only carry their
+        # row ranges. By default, there is one worker per CPU.
+        # Use it as a context manager or call close() at the end.
+        self._S = _station_coords( stations )
+        self._workers = ( os.cpu_count() or 1 ) if ( workers is None ) else workers
+        if ( self._workers < 1 ):
+            raise CValueError( CMlatPool.__name__, 'workers must be a positive integer.' )
+
+        # The workers must share the resource tracker of this process.
+        # Otherwise, each one would start its own tracker, which would try
+        # to unlink the blocks of the batches ( and warn that they leaked )
+        # when the worker stops.
+        resource_tracker.ensure_running()
+        self._executor: ProcessPoolExecutor | None = ProcessPoolExecutor(
+            self._workers, mp_context = mp_context, initializer = _init_worker, initargs = ( self._S, ) )
+
+        # Start the workers now. Forked later, they would inherit the
+        # mapping of the shared memory block of the first batch.
+        self._executor.submit( os.getpid ).result()
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        state = 'closed' if ( self._executor is None ) else 'open'
+        info = f'MLAT pool of {self._workers} workers over {self._S.shape[ 0 ]} stations ( {state} )'
+        return info
+
+    def __enter__( self ) -> CMlatPool:
+        return self
+
+    def __exit__( self, *args: object ) -> None:
+        self.close()
+
+    @property
+    def workers( self ) -> int:
+        return self._workers
+
+    def close( self ) -> None:
+        # Stop the workers.
+        if ( self._executor is not None ):
+            self._executor.shutdown()
+            self._executor = None
+
+    def solve_tdoa( self, rho: np.ndarray, *, sigma: float | np.ndarray = 1.0,
+                    iterations: int = 10, tol: float = 1e-9,
+                    shard_size: int | None = None ) -> tuple[ CPointArray, np.ndarray, np.ndarray ]:
+        # The same as solve_tdoa( stations, rho, ... ), where the emitters
+        # are split in shards of shard_size rows that are solved by the
+        # workers. By default, each worker gets 4 shards, but a shard is
+        # not smaller than MIN_SHARD_SIZE emitters.
+        if ( self._executor is None ):
+            raise CValueError( CMlatPool.__name__, 'the pool is closed.' )
+        n = self._S.shape[ 0 ]
+        rho, W = _weights( rho, sigma, n )
+        E = rho.shape[ 0 ]
+        if ( shard_size is None ):
+            shard_size = max( MIN_SHARD_SIZE, -( -E // ( 4 * self._workers ) ) )
+        if ( shard_size < 1 ):
+            raise CValueError( CMlatPool.__name__, 'shard_size must be a positive integer.' )
+        if ( E <= shard_size ):
+            xb, cov, valid = _solve( self._S, rho, W, iterations, tol )
+            return _positions( xb, valid ), cov, valid
+
+        # A row of the block for each emitter: [ rho, W, x, y, b, cov, valid ].
+        cols = 2 * n + 8
+        shm = shared_memory.SharedMemory( create = True, size = E * cols * 8 )
+        try:
+            block = np.ndarray( ( E, cols ), dtype = float, buffer = shm.buf )
+            block[ :, 0 : n ] = rho
+            block[ :, n : 2 * n ] = W
+            futures = [ self._executor.submit( _solve_shard, shm.name, E, n, k, min( k + shard_size, E ),
+                                               iterations, tol )
+                        for k in range( 0, E, shard_size ) ]
+            for f in futures:
+                f.result()
+
+            xb = block[ :, 2 * n : 2 * n + 3 ].copy()
+            cov = block[ :, 2 * n + 3 : 2 * n + 7 ].reshape( E, 2, 2 ).copy()
+            valid = block[ :, 2 * n + 7 ] != 0.0
+            del block
+        finally:
+            shm.close()
+            shm.unlink()
+        return _positions( xb, valid ), cov, valid
+
+#------------------------------------------------------------------
+# Workers.
+#
+# State of each worker process: the station coords.
+_worker_S: np.ndarray | None = None
+
+def _init_worker( S: np.ndarray ) -> None:
+    global _worker_S
+    _worker_S = S
+
+def _attach( name: str ) -> shared_memory.SharedMemory:
+    # Attach to a block of this process' parent, which owns it. Before
+    # Python 3.13, the block is registered with the resource tracker
+    # again, which is the one of the parent and holds it already.
+    if ( sys.version_info >= ( 3, 13 ) ):
+        return shared_memory.SharedMemory( name = name, track = False )
+    return shared_memory.SharedMemory( name = name )
+
+def _solve_shard( name: str, E: int, n: int, start: int, stop: int,
+                  iterations: int, tol: float ) -> None:
+    # Solve the rows [ start, stop ) of the block and write the results
+    # in place. The block is closed when the shard is done, so the
+    # workers do not keep the blocks of past batches mapped.
+    shm = _attach( name )
+    try:
+        block = np.ndarray( ( E, 2 * n + 8 ), dtype = float, buffer = shm.buf )
+        rows = block[ start : stop ]
+        xb, cov, valid = _solve( _worker_S, rows[ :, 0 : n ], rows[ :, n : 2 * n ], iterations, tol )
+        rows[ :, 2 * n : 2 * n + 3 ] = xb
+        rows[ :, 2 * n + 3 : 2 * n + 7 ] = cov.reshape( -1, 4 )
+        rows[ :, 2 * n + 7 ] = valid
+        del rows, block
+    finally:
+        shm.close()
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    os.system( 'cls' )
+
+    from time import perf_counter
+
+    # 200000 emitters and four stations.
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+    rng = np.random.default_rng( 1 )
+    X = rng.uniform( 0.0, 10.0, ( 200000, 2 ) )
+    rho = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 ) + rng.normal( 0.0, 0.01, ( 200000, 4 ) )
+
+    t0 = perf_counter()
+    P0, cov0, valid0 = solve_tdoa( S, rho, sigma = 0.01 )
+    print( f'serial: {perf_counter() - t0:.3f} s' )
+
+    with CMlatPool( S ) as pool:
+        print( pool )
+        pool.solve_tdoa( rho[ : 10000 ], sigma = 0.01, shard_size = 1000 )  # Warm up.
+        t0 = perf_counter()
+        P, cov, valid = pool.solve_tdoa( rho, sigma = 0.01 )
+        print( f'pool:   {perf_counter() - t0:.3f} s' )
+    print( np.allclose( P.gform, P0.gform ), np.allclose( cov, cov0 ), ( valid == valid0 ).all() )
+    print()
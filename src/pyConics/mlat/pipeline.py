@@ -0,0 +1,314 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'CMlatPipeline' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Iterable, Iterator
+from time import perf_counter
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.errors import CValueError
+from pyConics.pointarray import CPointArray
+from pyConics.conics.conicarray import CConicArray
+from pyConics.mlat.stations import CStations
+from pyConics.mlat.tdoa import tdoa_hyperbolae
+from pyConics.mlat.solver import solve_tdoa
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+# Stages of the pipeline, in the order they are run.
+STAGES = ( 'ingest', 'group', 'build', 'solve' )
+
+# Records of the stream, as they are packed in chunks. The event ids and
+# the station indices are kept as integers, so large ids are exact.
+RECORD = np.dtype( [ ( 'event', np.int64 ), ( 'station', np.int64 ), ( 'rho', float ) ] )
+
+#------------------------------------------------------------------
+# Class CMlatPipeline.
+#
+class CMlatPipeline:
+    __slots__ = ( 'name', '_stations', '_S', '_chunk_size', '_max_pending', '_max_done', '_sigma',
+                  '_iterations', '_hyperbolae', '_ids', '_rho', '_done', '_dropped', '_late',
+                  '_items', '_seconds' )
+
+    def __init__( self, stations: CStations | CPointArray | np.ndarray, name: str = '', *,
+                  chunk_size: int = 4096, max_pending: int = 65536, max_done: int = 65536,
+                  sigma: float = 1.0, iterations: int = 10, hyperbolae: bool = False ) -> None:
+        # Locate the emitters of an unbounded stream of arrival times.
+        # The stream goes through the stages
+        # ingest -> group by event -> ( build hyperbolae ) -> solve,
+        # chunk_size records at a time, and the fixes are yielded as
+        # soon as their events are complete.
+        # stations:    CStations, CPointArray or ( S, 2 )-matrix of the
+        #              station coords. The hyperbolae are built for the
+        #              pairs of a CStations, or for all pairs otherwise.
+        # max_pending: number of incomplete events that are kept. When it
+        #              is exceeded, the oldest ones are solved with the
+        #              stations they have got so far.
+        # max_done:    number of ids of the last events taken out of the
+        #              pending buffer that are kept. A record of one of
+        #              them comes too late: it is counted in late and
+        #              dropped, so the event is not output twice.
+        # sigma and iterations are passed to solve_tdoa.
+        # hyperbolae:  when True, the hyperbolae of the range differences
+        #              are built as well ( e.g. to plot them ). They are
+        #              only output: solve_tdoa does not use them, so this
+        #              stage only adds to the cost of the pipeline.
+        # The memory in use is bounded by chunk_size records plus
+        # max_pending events and max_done ids, whatever the length of the
+        # stream is.
+        if ( chunk_size < 1 ):
+            raise CValueError( CMlatPipeline.__name__, 'chunk_size must be a positive integer.' )
+        if ( max_pending < 0 ):
+            raise CValueError( CMlatPipeline.__name__, 'max_pending must not be negative.' )
+        if ( max_done < 0 ):
+            raise CValueError( CMlatPipeline.__name__, 'max_done must not be negative.' )
+
+        self.name = name
+        self._stations = stations if ( isinstance( stations, CStations ) ) else CStations( stations )
+        self._S = self._stations.coords
+        self._chunk_size = chunk_size
+        self._max_pending = max_pending
+        self._max_done = max_done
+        self._sigma = sigma
+        self._iterations = iterations
+        self._hyperbolae = hyperbolae
+        self.reset()
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        info = f'{self.name}: MLAT pipeline over {self._S.shape[ 0 ]} stations'
+        for stage, s in self.stats.items():
+            info += f'\n  {stage:<7}{s[ "items" ]:>12} items {s[ "seconds" ]:>10.4f} s {s[ "rate" ]:>12.4g} items/s'
+        info += f'\n  {self.pending} pending and {self.dropped} dropped events, {self.late} late records'
+        return info
+
+    @property
+    def pending( self ) -> int:
+        # Number of events that wait for more stations.
+        return self._ids.shape[ 0 ]
+
+    @property
+    def dropped( self ) -> int:
+        # Number of events that were left with less than 3 stations.
+        return self._dropped
+
+    @property
+    def late( self ) -> int:
+        # Number of records that were dropped because their events had
+        # already been taken out of the pending buffer.
+        return self._late
+
+    @property
+    def stats( self ) -> dict[ str, dict[ str, Any ] ]:
+        # Throughput of each stage. The items are records for ingest and
+        # group, hyperbolae for build and events for solve. The time that
+        # the consumer of run() spends between fixes is not counted.
+        stats = {}
+        for stage in STAGES:
+            n, t = self._items[ stage ], self._seconds[ stage ]
+            stats[ stage ] = { 'items': n, 'seconds': t, 'rate': n / t if ( t > 0.0 ) else 0.0 }
+        return stats
+
+    def reset( self ) -> None:
+        # Forget the pending events, the events taken out and the stats.
+        self._ids = np.empty( 0, dtype = np.int64 )
+        self._rho = np.empty( ( 0, self._S.shape[ 0 ] ) )
+        self._done = np.empty( 0, dtype = np.int64 )
+        self._dropped = 0
+        self._late = 0
+        self._items = { stage: 0 for stage in STAGES }
+        self._seconds = { stage: 0.0 for stage in STAGES }
+
+    def run( self, records: Iterable[ tuple[ int, int, float ] | np.ndarray ],
+             flush: bool = True ) -> Iterator[ tuple[ np.ndarray, CPointArray, np.ndarray,
+                                                      np.ndarray, CConicArray | None ] ]:
+        # Process a stream of records ( event id, station index, rho ), where
+        # rho is the arrival time times the propagation speed. The stream
+        # may also hold chunks of records: ( N, )-arrays of RECORD dtype
+        # ( or any structured dtype of three fields in that order ) or
+        # ( N, 3 )-matrices. The event ids of float matrices are exact up
+        # to 2^53 only. For each batch of complete events, it yields:
+        # 1) the ( K, )-array of event ids.
+        # 2) the positions, the ( K, 2, 2 )-covariances and the ( K, )-mask
+        #    of valid fixes, as solve_tdoa returns them.
+        # 3) the CConicArray of the ( K * P ) hyperbolae of the events, whose
+        #    rows follow the pairs of the stations for each event, or None
+        #    when hyperbolae is False.
+        # When flush is True, the pending events are solved at the end of
+        # the stream. Otherwise, they are kept for the next call.
+        chunks = self._ingest( records )
+        while ( True ):
+            t0 = perf_counter()
+            chunk = next( chunks, None )
+            self._seconds[ 'ingest' ] += perf_counter() - t0
+            if ( chunk is None ):
+                break
+            self._items[ 'ingest' ] += chunk.shape[ 0 ]
+
+            ids, rho = self._timed( 'group', chunk.shape[ 0 ], self._group, chunk )
+            if ( ids.shape[ 0 ] > 0 ):
+                yield self._fixes( ids, rho )
+
+        if ( flush ):
+            ids, rho = self._timed( 'group', 0, self._flush )
+            for k in range( 0, ids.shape[ 0 ], self._chunk_size ):
+                yield self._fixes( ids[ k : k + self._chunk_size ], rho[ k : k + self._chunk_size ] )
+
+    #--------------------------------------------------------------
+    # Stages.
+    #
+    def _ingest( self, records: Iterable[ tuple[ int, int, float ] | np.ndarray ] ) -> Iterator[ np.ndarray ]:
+        # Pack the records in ( N, )-arrays of RECORD dtype of chunk_size
+        # rows at most.
+        buf: list[ tuple[ int, int, float ] ] = []
+        for item in records:
+            if ( isinstance( item, np.ndarray ) ):
+                if ( len( buf ) > 0 ):
+                    yield np.array( buf, dtype = RECORD )
+                    buf = []
+                item = _as_records( item )
+                for k in range( 0, item.shape[ 0 ], self._chunk_size ):
+                    yield item[ k : k + self._chunk_size ]
+                continue
+
+            buf.append( tuple( item ) )
+            if ( len( buf ) == self._chunk_size ):
+                yield np.array( buf, dtype = RECORD )
+                buf = []
+        if ( len( buf ) > 0 ):
+            yield np.array( buf, dtype = RECORD )
+
+    def _group( self, chunk: np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+        # Add the records to the pending events and take the complete ones
+        # out, together with the oldest ones beyond max_pending.
+        S = self._S.shape[ 0 ]
+        ev = chunk[ 'event' ]
+        st = chunk[ 'station' ]
+        r = chunk[ 'rho' ]
+        ok = ( st >= 0 ) & ( st < S ) & np.isfinite( r )
+        late = ok & np.isin( ev, self._done )
+        self._late += int( np.count_nonzero( late ) )
+        ok &= ~late
+        ev, st, r = ev[ ok ], st[ ok ], r[ ok ]
+
+        # Rows of the events in the pending buffer. New events are appended
+        # in the order they first show up.
+        u, first, inv = np.unique( ev, return_index = True, return_inverse = True )
+        row = np.empty( u.shape[ 0 ], dtype = np.int64 )
+        known = np.zeros( u.shape[ 0 ], dtype = bool )
+        if ( self._ids.shape[ 0 ] > 0 ):
+            order = np.argsort( self._ids, kind = 'stable' )
+            pos = np.minimum( np.searchsorted( self._ids[ order ], u ), order.shape[ 0 ] - 1 )
+            known = self._ids[ order[ pos ] ] == u
+            row[ known ] = order[ pos[ known ] ]
+        new = np.flatnonzero( ~known )
+        new = new[ np.argsort( first[ new ], kind = 'stable' ) ]
+        row[ new ] = self._ids.shape[ 0 ] + np.arange( new.shape[ 0 ] )
+        self._ids = np.concatenate( [ self._ids, u[ new ] ] )
+        self._rho = np.concatenate( [ self._rho, np.full( ( new.shape[ 0 ], S ), np.nan ) ] )
+        self._rho[ row[ inv ], st ] = r
+
+        out = ~np.isnan( self._rho ).any( axis = 1 )
+        excess = self._ids.shape[ 0 ] - int( np.count_nonzero( out ) ) - self._max_pending
+        if ( excess > 0 ):
+            out[ np.flatnonzero( ~out )[ : excess ] ] = True
+        return self._take( out )
+
+    def _flush( self ) -> tuple[ np.ndarray, np.ndarray ]:
+        # Take all pending events out.
+        return self._take( np.ones( self._ids.shape[ 0 ], dtype = bool ) )
+
+    def _take( self, out: np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+        # Remove the events of the mask from the pending buffer and return
+        # the ones that can be solved. Their ids are kept, up to max_done,
+        # to catch their late records.
+        ids, rho = self._ids[ out ], self._rho[ out ]
+        self._ids, self._rho = self._ids[ ~out ], self._rho[ ~out ]
+        if ( self._max_done > 0 ):
+            self._done = np.concatenate( [ self._done, ids ] )[ -self._max_done : ]
+        enough = np.count_nonzero( ~np.isnan( rho ), axis = 1 ) >= 3
+        self._dropped += int( np.count_nonzero( ~enough ) )
+        return ids[ enough ], rho[ enough ]
+
+    def _fixes( self, ids: np.ndarray, rho: np.ndarray ) -> tuple[ np.ndarray, CPointArray, np.ndarray,
+                                                                  np.ndarray, CConicArray | None ]:
+        CC = None
+        if ( self._hyperbolae ):
+            pairs = self._stations.pairs
+            rdiff = rho[ :, pairs[ :, 0 ] ] - rho[ :, pairs[ :, 1 ] ]
+            CC, _, _ = self._timed( 'build', rdiff.size, tdoa_hyperbolae, self._stations, rdiff,
+                                    name = self.name )
+        X, cov, valid = self._timed( 'solve', ids.shape[ 0 ], solve_tdoa, self._S, rho,
+                                     sigma = self._sigma, iterations = self._iterations )
+        return ids, X, cov, valid, CC
+
+    def _timed( self, stage: str, items: int, fn: Any, *args: Any, **kwargs: Any ) -> Any:
+        t0 = perf_counter()
+        res = fn( *args, **kwargs )
+        self._seconds[ stage ] += perf_counter() - t0
+        self._items[ stage ] += items
+        return res
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _as_records( chunk: np.ndarray ) -> np.ndarray:
+    # Get a chunk of records as an ( N, )-array of RECORD dtype.
+    if ( chunk.dtype == RECORD ):
+        return chunk
+    if ( ( chunk.dtype.names is not None ) and ( len( chunk.dtype.names ) == 3 ) and ( chunk.ndim == 1 ) ):
+        cols = [ chunk[ name ] for name in chunk.dtype.names ]
+    elif ( ( chunk.dtype.names is None ) and ( chunk.ndim == 2 ) and ( chunk.shape[ 1 ] == 3 ) ):
+        cols = [ chunk[ :, 0 ], chunk[ :, 1 ], chunk[ :, 2 ] ]
+    else:
+        raise CValueError( CMlatPipeline.__name__, 'chunks of records must be ( N, 3 )-matrices or arrays of RECORD dtype.' )
+    records = np.empty( chunk.shape[ 0 ], dtype = RECORD )
+    for name, col in zip( RECORD.names, cols ):
+        records[ name ] = col
+    return records
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    # A stream of 10000 events at four stations, whose records arrive
+    # out of order within a window of 100 records.
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+    rng = np.random.default_rng( 1 )
+    X = rng.uniform( 0.0, 10.0, ( 10000, 2 ) )
+    rho = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 ) + rng.normal( 0.0, 0.01, ( 10000, 4 ) )
+    records = np.stack( [ np.repeat( np.arange( 10000 ), 4 ), np.tile( np.arange( 4 ), 10000 ),
+                         rho.reshape( -1 ) ], axis = 1 )
+    records = records[ np.argsort( np.arange( 40000 ) + rng.uniform( 0.0, 100.0, 40000 ) ) ]
+
+    pipeline = CMlatPipeline( S, 'H', chunk_size = 1000, max_pending = 1000, sigma = 0.01 )
+    err = []
+    for ids, P, cov, valid, CC in pipeline.run( map( tuple, records ) ):
+        err.append( np.linalg.norm( P.gform[ valid, 0 : 2 ] - X[ ids[ valid ] ], axis = 1 ) )
+    print( pipeline )
+    print( np.concatenate( err ).max() )
+    print()
@@ -0,0 +1,211 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'solve_tdoa' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from numpy import linalg as LA
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.errors import CValueError
+from pyConics.pointarray import CPointArray
+from pyConics.conics.utils import adjugate
+from pyConics.mlat.stations import CStations, _station_coords
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+#------------------------------------------------------------------
+# Solve.
+#
+def solve_tdoa( stations: CStations | CPointArray | np.ndarray, rho: np.ndarray, *,
+                sigma: float | np.ndarray = 1.0, iterations: int = 10,
+                tol: float = 1e-9 ) -> tuple[ CPointArray, np.ndarray, np.ndarray ]:
+    # Locate E emitters from their arrival times at S stations at once.
+    # stations: CStations, CPointArray or ( S, 2 )-matrix of the station
+    #           coords, related to the origin ( 0, 0 ).
+    # rho:      ( E, S )-matrix of pseudo-ranges, i.e. arrival times times
+    #           the propagation speed. rho[ e, i ] - rho[ e, j ] is the
+    #           range difference of tdoa_hyperbolae for the pair ( i, j ).
+    #           Missing measurements are NaN.
+    # sigma:    standard deviation of rho, a scalar or a ( E, S )-matrix.
+    # The model is rho = | x - s | + b, where b is the unknown time of
+    # emission times the speed. The estimate starts at the spherical
+    # interpolation solution and is refined by Gauss-Newton iterations.
+    # It returns the positions, their ( E, 2, 2 )-covariances and a
+    # ( E, )-mask of the valid ones. An emitter needs 3 stations at least.
+    # Invalid emitters get a null point and NaN covariances.
+    S = _station_coords( stations )
+    rho, W = _weights( rho, sigma, S.shape[ 0 ] )
+    xb, cov, valid = _solve( S, rho, W, iterations, tol )
+    return _positions( xb, valid ), cov, valid
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _weights( rho: np.ndarray, sigma: float | np.ndarray, n: int ) -> tuple[ np.ndarray, np.ndarray ]:
+    # Check rho and get the weights 1 / sigma^2 of its entries, which are
+    # zero for the missing ones. The missing entries of rho are set to zero.
+    rho = np.asarray( rho, dtype = float )
+    if ( ( rho.ndim != 2 ) or ( rho.shape[ 1 ] != n ) ):
+        raise CValueError( solve_tdoa.__name__, 'rho must be a ( E, S )-matrix.' )
+    W = np.broadcast_to( 1.0 / np.square( np.asarray( sigma, dtype = float ) ), rho.shape )
+    W = np.where( np.isnan( rho ), 0.0, W )
+    return np.where( W > 0.0, rho, 0.0 ), W
+
+def _solve( S: np.ndarray, rho: np.ndarray, W: np.ndarray, iterations: int,
+            tol: float ) -> tuple[ np.ndarray, np.ndarray, np.ndarray ]:
+    # The estimates ( x, y, b ) ( E, 3 ), the covariances of ( x, y ) and
+    # the mask of the valid ones.
+    xb = _spherical_interpolation( S, rho, W )
+    xb, H, valid = _gauss_newton( S, rho, W, xb, iterations, tol )
+
+    # Covariance of ( x, y ) from the information matrix of ( x, y, b ).
+    valid &= np.count_nonzero( W, axis = 1 ) >= 3
+    cov = _inverse( H )[ 0 ][ :, 0 : 2, 0 : 2 ]
+    cov[ ~valid ] = np.nan
+    return xb, cov, valid
+
+def _positions( xb: np.ndarray, valid: np.ndarray ) -> CPointArray:
+    # Points of the estimates. The invalid ones are null points.
+    X = np.ones( ( xb.shape[ 0 ], 3 ) )
+    X[ :, 0 : 2 ] = xb[ :, 0 : 2 ]
+    X[ ~valid ] = 0.0
+    return CPointArray( X )
+
+def _spherical_interpolation( S: np.ndarray, rho: np.ndarray, W: np.ndarray ) -> np.ndarray:
+    # Closed form estimate of ( x, y, b ) for each emitter. With the
+    # reference station r at the origin, R_i = d_i + R_r, where
+    # d_i = rho_i - rho_r, and R_r = | x | give the linear equations
+    # 2 * s_i.T * x + 2 * d_i * R_r = | s_i |^2 - d_i^2.
+    # Emitters with less than 4 stations start at the centroid of
+    # their stations.
+    E = rho.shape[ 0 ]
+    seen = W > 0.0
+    ref = np.argmax( seen, axis = 1 )
+    e = np.arange( E )
+    Sr = S[ np.newaxis ] - S[ ref ][ :, np.newaxis ]
+    d = rho - rho[ e, ref ][ :, np.newaxis ]
+    w = np.where( seen, W, 0.0 )
+    w[ e, ref ] = 0.0
+
+    A = np.concatenate( [ 2.0 * Sr, 2.0 * d[ ..., np.newaxis ] ], axis = 2 )
+    y = np.sum( Sr * Sr, axis = 2 ) - d * d
+    N = np.einsum( 'eki,ek,ekj->eij', A, w, A )
+    g = np.einsum( 'eki,ek,ek->ei', A, w, y )
+    Ninv, ok = _inverse( N )
+    ok &= np.count_nonzero( w, axis = 1 ) >= 3
+    theta = np.einsum( 'eij,ej->ei', Ninv, g )
+
+    centroid = np.sum( S[ np.newaxis ] * seen[ ..., np.newaxis ], axis = 1 ) / \
+               np.maximum( np.count_nonzero( seen, axis = 1 ), 1 )[ :, np.newaxis ]
+    x = np.where( ok[ :, np.newaxis ], theta[ :, 0 : 2 ] + S[ ref ], centroid )
+    R = LA.norm( x[ :, np.newaxis ] - S, axis = 2 )
+    b = np.sum( W * ( rho - R ), axis = 1 ) / np.maximum( np.sum( W, axis = 1 ), np.finfo( float ).tiny )
+    return np.concatenate( [ x, b[ :, np.newaxis ] ], axis = 1 )
+
+def _gauss_newton( S: np.ndarray, rho: np.ndarray, W: np.ndarray, xb: np.ndarray,
+                   iterations: int, tol: float ) -> tuple[ np.ndarray, np.ndarray, np.ndarray ]:
+    # Refine ( x, y, b ) by minimizing sum( W * ( rho - | x - s | - b )^2 ).
+    # It returns the estimates, the information matrices J.T * W * J and
+    # the mask of the emitters whose systems could be solved.
+    E = rho.shape[ 0 ]
+    xb = xb.copy()
+    valid = np.ones( E, dtype = bool )
+    active = np.ones( E, dtype = bool )
+    for it in range( iterations + 1 ):
+        H, g = _normal_equations( S, rho[ active ], W[ active ], xb[ active ] )
+        Hinv, ok = _inverse( H )
+        valid[ active ] = ok
+        if ( it == iterations ):
+            break
+        step = np.einsum( 'eij,ej->ei', Hinv, g )
+        xb[ active ] += step
+
+        # Emitters that have converged are not updated anymore.
+        scale = 1.0 + LA.norm( xb[ active, 0 : 2 ], axis = 1 )
+        idx = np.flatnonzero( active )
+        active[ idx[ LA.norm( step[ :, 0 : 2 ], axis = 1 ) <= tol * scale ] ] = False
+        if ( not active.any() ):
+            break
+
+    H, _ = _normal_equations( S, rho, W, xb )
+    valid &= _inverse( H )[ 1 ] & np.all( np.isfinite( xb ), axis = 1 )
+    return xb, H, valid
+
+def _normal_equations( S: np.ndarray, rho: np.ndarray, W: np.ndarray,
+                       xb: np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+    # J.T * W * J and J.T * W * r, where the rows of J are
+    # [ ( x - s ).T / | x - s |, 1 ] and r = rho - | x - s | - b.
+    D = xb[ :, np.newaxis, 0 : 2 ] - S[ np.newaxis ]
+    R = LA.norm( D, axis = 2 )
+    U = D / np.where( R > 0.0, R, 1.0 )[ ..., np.newaxis ]
+    J = np.concatenate( [ U, np.ones( R.shape + ( 1, ) ) ], axis = 2 )
+    r = rho - R - xb[ :, 2 : 3 ]
+    WJ = W[ ..., np.newaxis ] * J
+    return np.einsum( 'eki,ekj->eij', WJ, J ), np.einsum( 'eki,ek->ei', WJ, r )
+
+def _inverse( N: np.ndarray ) -> tuple[ np.ndarray, np.ndarray ]:
+    # Inverses adj( N ) / det( N ) of a ( K, 3, 3 )-stack of normal matrices
+    # and the mask of the ones that are not singular in floating point,
+    # i.e. whose condition numbers | N | * | adj( N ) | / | det( N ) | are
+    # less than 1 / sqrt( eps ), so the inverses keep half of the digits.
+    # A poor geometry is not rejected here: it gives a large covariance.
+    # Only estimates that ran away to the infinity ( all the stations in
+    # the same direction ) are. The singular matrices get null inverses.
+    adj = adjugate( N )
+    det = np.einsum( 'ki,ki->k', N[ :, 0, : ], adj[ :, :, 0 ] )
+    scale = LA.norm( N, axis = ( 1, 2 ) ) * LA.norm( adj, axis = ( 1, 2 ) )
+    with np.errstate( invalid = 'ignore', over = 'ignore' ):
+        ok = np.abs( det ) > np.sqrt( np.finfo( float ).eps ) * scale
+    det = np.where( ok, det, 1.0 )
+    Ninv = adj / det[ :, np.newaxis, np.newaxis ]
+    Ninv[ ~ok ] = 0.0
+    return Ninv, ok
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    # Four stations and five emitters.
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+    rng = np.random.default_rng( 1 )
+    X = rng.uniform( 0.0, 10.0, ( 5, 2 ) )
+    rho = LA.norm( X[ :, np.newaxis ] - S, axis = 2 ) + rng.uniform( 0.0, 100.0, ( 5, 1 ) )
+    rho += rng.normal( 0.0, 0.01, rho.shape )
+    print( X )
+    print()
+
+    P, cov, valid = solve_tdoa( S, rho, sigma = 0.01 )
+    print( P )
+    print( np.sqrt( np.diagonal( cov, axis1 = 1, axis2 = 2 ) ) )
+    print( valid )
+    print()
+
+    # A missing measurement.
+    rho[ 0, 1 ] = np.nan
+    P, cov, valid = solve_tdoa( S, rho, sigma = 0.01 )
+    print( P )
+    print( valid )
+    print()
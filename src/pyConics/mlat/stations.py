@@ -0,0 +1,216 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'station_pairs', 'CStations' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Sequence
+from numpy import linalg as LA
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.errors import CTypeError, CValueError
+from pyConics.tolerance import ctol
+from pyConics.pointarray import CPointArray
+from pyConics.conics.conic import CConic
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+#------------------------------------------------------------------
+# Pairs of stations.
+#
+def station_pairs( n: int ) -> np.ndarray:
+    # All pairs ( i, j ) of n stations, where i < j, as a ( P, 2 )-matrix.
+    i, j = np.triu_indices( n, 1 )
+    return np.stack( [ i, j ], axis = 1 )
+
+#------------------------------------------------------------------
+# Class CStations.
+#
+class CStations:
+    __slots__ = ( 'name', '_S', '_pairs', '_m', '_c', '_T', '_Lu', '_Lv' )
+
+    def __init__( self, stations: CStations | CPointArray | np.ndarray,
+                  pairs: np.ndarray | Sequence[ tuple[ int, int ] ] | None = None,
+                  name: str = '' ) -> None:
+        # Geometry of a set of stations and of their pairs, which is
+        # computed once and shared by all range differences.
+        # stations: CPointArray or ( S, 2 )-matrix of the station coords,
+        #           related to the origin ( 0, 0 ).
+        # pairs:    ( P, 2 )-matrix of station indices. By default, all
+        #           pairs of station_pairs( S ).
+        # For the pair ( i, j ), the canonical frame has its origin at the
+        # midpoint m of the stations and its x-axis along the unit vector u
+        # from s_i to s_j. With the transform T = [ [ u.T, -u.T * m ],
+        # [ v.T, -v.T * m ], [ 0, 0, 1 ] ], where v is u rotated by pi / 2,
+        # the hyperbola of the range difference r is
+        # T.T * diag( 1 / a^2, -1 / b^2, -1 ) * T, where a = | r | / 2 and
+        # b^2 = c^2 - a^2. The outer products of the first two rows of T
+        # are kept, so a new range difference costs two scalars.
+        self.name = name
+        self._S = _station_coords( stations )
+        P = station_pairs( self._S.shape[ 0 ] ) if ( pairs is None ) else np.asarray( pairs, dtype = int )
+        if ( ( P.ndim != 2 ) or ( P.shape[ 1 ] != 2 ) ):
+            raise CValueError( CStations.__name__, 'pairs must be a ( P, 2 )-matrix of station indices.' )
+        if ( ( P.size > 0 ) and ( ( P.min() < 0 ) or ( P.max() >= self._S.shape[ 0 ] ) ) ):
+            raise CValueError( CStations.__name__, 'pairs refer to stations that do not exist.' )
+        self._pairs = P
+
+        s1, s2 = self._S[ P[ :, 0 ] ], self._S[ P[ :, 1 ] ]
+        self._m = ( s1 + s2 ) / 2
+        d = s2 - s1
+        self._c = LA.norm( d, axis = 1 ) / 2
+        u = d / np.where( self._c > 0.0, 2 * self._c, 1.0 )[ :, np.newaxis ]
+        v = np.stack( [ -u[ :, 1 ], u[ :, 0 ] ], axis = 1 )
+
+        self._T = np.zeros( ( P.shape[ 0 ], 3, 3 ) )
+        self._T[ :, 0, 0 : 2 ] = u
+        self._T[ :, 0, 2 ] = -np.sum( u * self._m, axis = 1 )
+        self._T[ :, 1, 0 : 2 ] = v
+        self._T[ :, 1, 2 ] = -np.sum( v * self._m, axis = 1 )
+        self._T[ :, 2, 2 ] = 1.0
+        lu, lv = self._T[ :, 0 ], self._T[ :, 1 ]
+        self._Lu = lu[ :, :, np.newaxis ] * lu[ :, np.newaxis, : ]
+        self._Lv = lv[ :, :, np.newaxis ] * lv[ :, np.newaxis, : ]
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        info = f'{self.name}: {self._S.shape[ 0 ]} stations and {self._pairs.shape[ 0 ]} pairs'
+        return info
+
+    def __len__( self ) -> int:
+        return self._S.shape[ 0 ]
+
+    @property
+    def coords( self ) -> np.ndarray:
+        # ( S, 2 )-matrix of the station coords.
+        return self._S
+
+    @property
+    def pairs( self ) -> np.ndarray:
+        return self._pairs
+
+    @property
+    def baselines( self ) -> np.ndarray:
+        # Distances between the stations of the pairs ( 2 * c ).
+        return 2 * self._c
+
+    @property
+    def centers( self ) -> np.ndarray:
+        # ( P, 2 )-matrix of the midpoints of the pairs.
+        return self._m
+
+    @property
+    def angles( self ) -> np.ndarray:
+        # Angles of the baselines, from s_i to s_j.
+        return np.arctan2( self._T[ :, 0, 1 ], self._T[ :, 0, 0 ] )
+
+    @property
+    def rotations( self ) -> np.ndarray:
+        # ( P, 2, 2 )-rotations from the canonical frames, whose columns
+        # are u and v.
+        return np.swapaxes( self._T[ :, 0 : 2, 0 : 2 ], 1, 2 )
+
+    @property
+    def transforms( self ) -> np.ndarray:
+        # ( P, 3, 3 )-transforms of homogeneous coords to the canonical
+        # frames.
+        return self._T
+
+    def hyperbola( self, pair: int, rdiff: float, name: str = '' ) -> CConic:
+        # The hyperbola of the range difference rdiff for the pair-th pair,
+        # as tdoa_hyperbolae builds it. It has the same matrix as
+        # CConic( abs( rdiff ) / 2, foci = ( s_i, s_j ) ).
+        M, branch, valid = _hyperbolae( self, np.asarray( [ rdiff ], dtype = float ), [ pair ] )
+        if ( not valid[ 0 ] ):
+            raise CValueError( CStations.__name__, 'the range difference is not less than the baseline.' )
+        rank = 3 if ( branch[ 0 ] != 0.0 ) else 1
+        return CConic.from_matrix( M[ 0 ], name, rank = rank, shift_origin = True )
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _station_coords( stations: CStations | CPointArray | np.ndarray ) -> np.ndarray:
+    # Get the ( S, 2 )-matrix of the station coords.
+    if ( isinstance( stations, CStations ) ):
+        return stations.coords
+    if ( isinstance( stations, CPointArray ) ):
+        S = stations.from_origin
+        if ( np.any( S[ :, 2 ] == 0.0 ) ):
+            raise CValueError( CStations.__name__, 'stations can not be at the infinity.' )
+        return S[ :, 0 : 2 ] / S[ :, 2 : 3 ]
+    if ( isinstance( stations, np.ndarray ) ):
+        S = np.asarray( stations, dtype = float )
+        if ( ( S.ndim != 2 ) or ( S.shape[ 1 ] != 2 ) ):
+            raise CValueError( CStations.__name__, 'stations must be a ( S, 2 )-matrix.' )
+        return S
+    raise CTypeError( stations.__class__.__name__ )
+
+def _hyperbolae( geometry: CStations, r: np.ndarray,
+                 index: np.ndarray | Sequence[ int ] | slice = slice( None ) ) -> tuple[ np.ndarray, np.ndarray, np.ndarray ]:
+    # Hyperbolae of the range differences r ( ..., P ) for the pairs
+    # geometry.pairs[ index ]. They are built as create_conic does, i.e.
+    # the constant term is -1 when the conic is translated to its center.
+    c = geometry._c[ index ]
+    Lu = geometry._Lu[ index ]
+    Lv = geometry._Lv[ index ]
+
+    a = np.abs( r ) / 2
+    bisector = a <= ctol.eps_relzero * c
+    valid = ( c > 0.0 ) & ( a < c )
+    hyperbola = valid & ~bisector
+    a2 = np.where( hyperbola, a * a, 1.0 )[ ..., np.newaxis, np.newaxis ]
+    b2 = np.where( hyperbola, c * c - a * a, 1.0 )[ ..., np.newaxis, np.newaxis ]
+
+    # The bisector is the double line u.T * ( x - m ) = 0.
+    M = Lu / a2 - Lv / b2
+    M[ ..., 2, 2 ] -= 1.0
+    M = np.where( bisector[ ..., np.newaxis, np.newaxis ], Lu, M )
+    M[ ~valid ] = 0.0
+
+    branch = np.where( valid, np.sign( r ), 0.0 )
+    branch[ bisector ] = 0.0
+    return M, branch, valid
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    from pyConics.point import CPoint
+
+    # Four stations.
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+    stations = CStations( S, name = 'S' )
+    print( stations )
+    print( stations.pairs )
+    print( stations.baselines )
+    print( stations.angles )
+    print( stations.transforms[ 0 ] )
+    print()
+
+    # The same hyperbola as the foci constructor.
+    H = stations.hyperbola( 1, 4.0, 'H' )
+    print( H )
+    print( CConic( 2.0, foci = ( CPoint( ( 0.0, 0.0 ) ), CPoint( ( 10.0, 10.0 ) ) ), name = 'C' ) )
+    print()
@@ -0,0 +1,105 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'tdoa_hyperbolae' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Sequence
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    ... # Do nothing here, because there are no pyConics modules
+        # here to be imported.
+
+from pyConics.errors import CValueError
+from pyConics.pointarray import CPointArray
+from pyConics.conics.conicarray import CConicArray
+from pyConics.mlat.stations import station_pairs, CStations, _hyperbolae
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+
+#------------------------------------------------------------------
+# TDOA hyperbolae.
+#
+def tdoa_hyperbolae( stations: CStations | CPointArray | np.ndarray,
+                     rdiff: np.ndarray | Sequence[ float ],
+                     pairs: np.ndarray | Sequence[ tuple[ int, int ] ] | None = None,
+                     name: str = '' ) -> tuple[ CConicArray, np.ndarray, np.ndarray ]:
+    # Build the hyperbolae of the time differences of arrival at once.
+    # stations: CStations, CPointArray or ( S, 2 )-matrix of the station
+    #           coords, related to the origin ( 0, 0 ). The pair geometry
+    #           of a CStations is reused, unless other pairs are given.
+    # rdiff:    range differences ( ..., P ), where the column p is
+    #           | x - s_i | - | x - s_j | for the p-th pair ( i, j ).
+    # pairs:    ( P, 2 )-matrix of station indices. By default, all
+    #           pairs of station_pairs( S ), or the pairs of a CStations.
+    # It returns:
+    # 1) a CConicArray whose rows follow rdiff in C order. The pair
+    #    with rdiff equal to zero gives the perpendicular bisector of
+    #    the stations ( a double line ).
+    # 2) the branch signs ( ..., P ). The emitter x lies in the branch
+    #    where sign * ( x - m ).T * u >= 0, where m is the midpoint of
+    #    the stations and u is the unit vector from s_i to s_j.
+    # 3) a ( ..., P )-mask of the valid hyperbolae. A range difference
+    #    whose magnitude is not less than the distance between the
+    #    stations gives no hyperbola and a null matrix.
+    if ( ( not isinstance( stations, CStations ) ) or ( pairs is not None ) ):
+        stations = CStations( stations, pairs )
+    r = np.asarray( rdiff, dtype = float )
+    if ( ( r.ndim == 0 ) or ( r.shape[ -1 ] != stations.pairs.shape[ 0 ] ) ):
+        raise CValueError( tdoa_hyperbolae.__name__, 'rdiff must have one column for each pair.' )
+
+    M, branch, valid = _hyperbolae( stations, r )
+
+    # The matrices are not adjusted to relative zeros, which would wipe out
+    # the small entries of narrow hyperbolae. Their ranks are known: 3 for
+    # hyperbolae, 1 for bisectors and 0 for null matrices.
+    rank = np.where( valid, np.where( branch != 0.0, 3, 1 ), 0 ).reshape( -1 )
+    CC = CConicArray.from_matrices( M.reshape( -1, 3, 3 ), name, rank = rank, shift_origin = True )
+    return CC, branch, valid
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    from numpy import linalg as LA
+
+    # Four stations and an emitter.
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+    x = np.array( [ 3.0, 4.0 ] )
+    pairs = station_pairs( 4 )
+    d = LA.norm( S - x, axis = 1 )
+    rdiff = d[ pairs[ :, 0 ] ] - d[ pairs[ :, 1 ] ]
+    print( pairs )
+    print( rdiff )
+    print()
+
+    CC, branch, valid = tdoa_hyperbolae( S, rdiff, name = 'H' )
+    print( CC )
+    print( CC.classify() )
+    print( branch )
+    print( valid )
+    print()
+
+    # The emitter lies in all of them.
+    X = np.append( x, 1.0 )
+    print( np.einsum( 'i,kij,j->k', X, CC.gform, X ) )
+    print()
@@ -39,11 +39,20 @@ class Origin:
     y: float = 0.0
 
     def change_point( self, point: np.ndarray ) -> np.ndarray:
+        # point can be a vector or a ( N, 3 )-matrix of points.
+        # Nothing is copied when the origin is not shifted.
+        if ( ( self.x == 0.0 ) and ( self.y == 0.0 ) ):
+            return point
         return point - np.array( ( self.x, self.y, 0.0 ) )
     
     def change_line( self, line: np.ndarray ) -> np.ndarray:
-        c = ( line[ 0 ] * self.x ) + ( line[ 1 ] * self.y )
-        return line + np.array( ( 0.0, 0.0, c ) )
+        # line can be a vector or a ( N, 3 )-matrix of lines.
+        # Nothing is copied when the origin is not shifted.
+        if ( ( self.x == 0.0 ) and ( self.y == 0.0 ) ):
+            return line
+        shift = np.zeros( line.shape )
+        shift[ ..., 2 ] = ( line[ ..., 0 ] * self.x ) + ( line[ ..., 1 ] * self.y )
+        return line + shift
 
     def change_conic( self, conic: np.ndarray ) -> np.ndarray:
         from pyConics.point import CPoint
@@ -67,6 +76,15 @@ class Origin:
         # Build the matrix representation of a conic.
         return ctol.adjust2relzeros( np.block( [ [ ABC, DE ], [ DE.T, F ] ] ) )
 
+    def change_conics( self, conics: np.ndarray ) -> np.ndarray:
+        # conics is a ( K, 3, 3 )-stack of conics. A point p in the new
+        # origin is equal to S * p in the old one, so C becomes S.T * C * S.
+        # Nothing is copied when the origin is not shifted.
+        if ( ( self.x == 0.0 ) and ( self.y == 0.0 ) ):
+            return conics
+        S = np.array( [ [ 1.0, 0.0, self.x ], [ 0.0, 1.0, self.y ], [ 0.0, 0.0, 1.0 ] ] )
+        return ctol.adjust2relzeros_many( S.T @ conics @ S, 2 )
+
     def reset( self ) -> None:
         self.x = 0.0
         self.y = 0.0
@@ -196,48 +196,25 @@ class CAxes:
                     # Nondegenerate conic.
                     # Get the list of points.
                     lst_pts = C.sequence( list( x ), list( y ) )
-                    lst_len = len( lst_pts )
-                    
-                    if ( lst_len == 0 ):
-                        continue
-                    elif ( lst_len == 1 ):
-                        lp1 = lst_pts[ 0 ]
-                        lp2 = tuple( [] )
-                    else:
-                        lp1 = lst_pts[ 0 ]
-                        lp2 = lst_pts[ 1 ]
-
-                    # Get the first list of points.
-                    xy1 = CPointList2MatrixXY( list( lp1 ) )
 
-                    # Get the second list of points.
-                    xy2 = CPointList2MatrixXY( list( lp2 ) )
+                    # Get a matrix of points for each piece of the conic.
+                    lst_xy = [ CPointList2MatrixXY( list( lp ) ) for lp in lst_pts if ( len( lp ) > 0 ) ]
 
                     # List of points must exist.
-                    if ( ( xy1.size == 0 ) and ( xy2.size == 0 ) ):
+                    if ( len( lst_xy ) == 0 ):
                         continue
 
-                    # Build the list of x and y.
-                    if ( xy2.size == 0 ):
-                        X = list( xy1[ :, 0 ][np.newaxis].T )
-                        Y = list( xy1[ :, 1 ][np.newaxis].T )
-                    else:
-                        x1 = xy1[ :, 0 ][np.newaxis].T
-                        y1 = xy1[ :, 1 ][np.newaxis].T
-                        x2 = xy2[ :, 0 ][np.newaxis].T
-                        y2 = xy2[ :, 1 ][np.newaxis].T
-                        dsize = np.abs( x1.size - x2.size )
-                        dx = np.full( shape = ( dsize, 1 ), fill_value = cconst.inf )
-                        if ( x1.size <= x2.size):
-                            x1 = np.block( [ [ x1 ], [ dx ] ] )
-                            y1 = np.block( [ [ y1 ], [ dx ] ] )
-                        else:
-                            x2 = np.block( [ [ x2 ], [ dx ] ] )
-                            y2 = np.block( [ [ y2 ], [ dx ] ] )
-
-                        X = list( np.block( [ x1, x2 ] ) )
-                        Y = list( np.block( [ y1, y2 ] ) )
-                        
+                    # Build the list of x and y. Each piece is a column and the
+                    # shorter ones are completed with inf.
+                    nrows = max( xy.shape[ 0 ] for xy in lst_xy )
+                    X = np.full( shape = ( nrows, len( lst_xy ) ), fill_value = cconst.inf )
+                    Y = np.full( shape = ( nrows, len( lst_xy ) ), fill_value = cconst.inf )
+                    for k, xy in enumerate( lst_xy ):
+                        X[ 0 : xy.shape[ 0 ], k ] = xy[ :, 0 ]
+                        Y[ 0 : xy.shape[ 0 ], k ] = xy[ :, 1 ]
+                    X = list( X )
+                    Y = list( Y )
+
                     new_args.append( X )
                     new_args.append( Y )
                     continue
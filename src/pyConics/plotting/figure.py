@@ -29,7 +29,6 @@ if TYPE_CHECKING:
 #------------------------------------------------------------------
 # Import as ...
 #  
-import pyautogui as gui
 import matplotlib as mpl
 import numpy as np
 
@@ -57,6 +56,9 @@ class CFigure:
                 w = h
             elif ( h == 0.0 ):
                 h = w
+
+            # pyautogui probes the display, so it is only loaded here.
+            import pyautogui as gui
             width, height = gui.size()
             dpi = mpl.rcParams[ 'figure.dpi' ]
             w = round( w * ( width / dpi ), 1 )
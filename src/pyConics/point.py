@@ -38,6 +38,8 @@ np.set_printoptions( formatter = { 'float': lambda x: "{0:0.4e}".format( x ) } )
 # Class CPoint.
 #  
 class CPoint( CAGObj ):
+    __slots__ = ()
+
     def __init__( self,
                   coord: tuple[ float, float ] | tuple[ float, float, float ] = ( 0.0, 0.0, 1.0 ),
                   /,
@@ -57,12 +59,28 @@ class CPoint( CAGObj ):
             self._gform = self._gform / self._gform[ -1 ]
 
         # Store this value to be possible restore it to the origin.
-        self._from_origin = self._gform.copy()
+        # Both forms share the same array while the origin is not shifted.
+        self._from_origin = self._gform
 
         # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
         if ( shift_origin == True ):
             self.update_origin()
 
+    @classmethod
+    def from_array( cls, gform: np.ndarray, name: str = '', *, shift_origin: bool = False ) -> CPoint:
+        # Trusted constructor. gform must be a float ( 3, )-array that has
+        # already been adjusted to relative zeros and normalized by w.
+        # It is neither validated nor copied.
+        p = cls.__new__( cls )
+        p.name = name
+        p._gform = gform
+        p._from_origin = gform
+
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        if ( shift_origin == True ):
+            p.update_origin()
+        return p
+
     def __repr__( self ) -> str:
         # return an info messsage for this class.
         info = f'{self.name}: {self.gform}'
@@ -79,8 +97,7 @@ class CPoint( CAGObj ):
         return self._gform[ 1 ]
 
     def copy( self ) -> CPoint:
-        xy  = ( self._gform[ 0 ], self._gform[ 1 ], self._gform[ 2 ] )
-        return CPoint( xy, self.name, shift_origin = False )
+        return CPoint.from_array( self._gform.copy(), self.name )
     
     def update_origin( self ) -> None:
         # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
@@ -0,0 +1,189 @@
+#------------------------------------------------------------------
+# Import it to be able to pass an object of same class as argument
+# to a member function
+from __future__ import annotations
+
+#------------------------------------------------------------------
+# Everything that can be visible to the world.
+#
+__all__ = [ 'CPointArray' ]
+
+#------------------------------------------------------------------
+# Import from...
+#
+from typing import Any, Sequence
+
+#------------------------------------------------------------------
+# Import from...
+# We use here TYPE_CHECKING constant to avoid circular import
+# exceptions.
+#
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from pyConics.line import CLine
+    from pyConics.linearray import CLineArray
+
+from pyConics.agobj import CAGObj
+from pyConics.errors import CPointTypeError
+from pyConics.origin import corigin
+from pyConics.tolerance import ctol
+from pyConics.point import CPoint, _validate_point
+
+#------------------------------------------------------------------
+# Import as...
+#
+import numpy as np
+np.set_printoptions( formatter = { 'float': lambda x: "{0:0.4e}".format( x ) } )
+
+#------------------------------------------------------------------
+# Class CPointArray.
+#
+class CPointArray( CAGObj ):
+    __slots__ = ()
+
+    def __init__( self,
+                  coords: np.ndarray | Sequence[ Any ] = np.zeros( ( 0, 3 ) ),
+                  /,
+                  name: str = '',
+                  *,
+                  shift_origin: bool = True ) -> None:
+        super().__init__( name )
+
+        # Redim the geometric form. It is a ( N, 3 )-matrix where
+        # each row is a point.
+        self._gform = _validate_points( coords )
+
+        # Test for epsilon number condition.
+        self._gform = ctol.adjust2relzeros_many( self._gform )
+
+        # Transform the points to homogeneous coords.
+        w = self._gform[ :, 2 ]
+        finite = w != 0.0
+        self._gform[ finite ] = self._gform[ finite ] / w[ finite ][np.newaxis].T
+
+        # Store this value to be possible restore it to the origin.
+        # Both forms share the same array while the origin is not shifted.
+        self._from_origin = self._gform
+
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        if ( shift_origin == True ):
+            self.update_origin()
+
+    def __repr__( self ) -> str:
+        # return an info messsage for this class.
+        n_inf = int( np.count_nonzero( self.at_infinity() ) )
+        info = f'{self.name}: {len( self )} points\n{self.gform}'
+        if ( n_inf > 0 ):
+            info += f'\n-> {n_inf} points at the infinity'
+        return info
+
+    def __len__( self ) -> int:
+        return self._gform.shape[ 0 ]
+
+    def __getitem__( self, key: int | slice | np.ndarray ) -> Any[ CPoint | CPointArray ]:
+        # An integer returns a CPoint whose arrays are views of the rows
+        # of this array. Otherwise, a new CPointArray is returned.
+        if ( isinstance( key, ( int, np.integer ) ) ):
+            name = f'{self.name}[{key}]' if ( self.name != '' ) else ''
+            p = CPoint.from_array( self._gform[ key ], name )
+            p._from_origin = self._from_origin[ key ]
+            return p
+
+        P = CPointArray( name = self.name )
+        P._from_origin = self._from_origin[ key ]
+        P._gform = self._gform[ key ]
+        return P
+
+    @property
+    def x( self ) -> np.ndarray:
+        return self._gform[ :, 0 ]
+
+    @property
+    def y( self ) -> np.ndarray:
+        return self._gform[ :, 1 ]
+
+    def copy( self ) -> CPointArray:
+        return CPointArray( self._gform.copy(), self.name, shift_origin = False )
+
+    def update_origin( self ) -> None:
+        # Translate the origin from ( 0, 0 ) to another origin in '(origin.x, origin.y )'.
+        self._gform = corigin.change_point( self._from_origin )
+
+    def cross( self, other: CPoint | CLine | CPointArray | CLineArray, /,
+               *, outer: bool = False ) -> Any[ CPointArray | CLineArray ]:
+        from pyConics.utils import cross
+
+        # Get the cross product.
+        return cross( self, other, outer = outer )
+
+    def __mul__( self, other: CPoint | CLine | CPointArray | CLineArray ) -> Any[ CPointArray | CLineArray ]:
+        # Get the cross product.
+        return self.cross( other )
+
+    def at_infinity( self ) -> np.ndarray:
+        return self._gform[ :, 2 ] == 0.0
+
+#------------------------------------------------------------------
+# Internal functions.
+#
+def _validate_points( coords: np.ndarray | Sequence[ Any ] ) -> np.ndarray:
+    # A sequence of CPoints is stacked by using their original forms.
+    if ( ( not isinstance( coords, np.ndarray ) ) and ( len( coords ) > 0 ) and
+         ( isinstance( coords[ 0 ], CPoint ) ) ):
+        return np.array( [ p.from_origin for p in coords ], dtype = float )
+
+    try:
+        P = np.array( coords, dtype = float )
+    except ValueError:
+        # Coords with lengths of 2 and 3 were mixed up.
+        P = np.array( [ _validate_point( tuple( c ) ) for c in coords ], dtype = float )
+    if ( P.size == 0 ):
+        return np.zeros( ( 0, 3 ) )
+    if ( ( P.ndim != 2 ) or ( P.shape[ 1 ] not in ( 2, 3 ) ) ):
+        raise CPointTypeError( CPointArray.__name__, CPointArray.gform.fget.__name__ )
+    if ( P.shape[ 1 ] == 2 ):
+        return np.block( [ [ P, np.ones( ( P.shape[ 0 ], 1 ) ) ] ] )
+    return P
+
+#------------------------------------------------------------------
+# For development and test.
+#
+if __name__ == '__main__':
+    import os
+    os.system( 'cls' )
+
+    # Shows info about an array of points.
+    P = CPointArray( [ ( 0, 1 ), ( 1, 1 ), ( 2, 4 ) ], 'P' )
+    print( P )
+    print( P.name, P.gform.shape, len( P ) )
+    print()
+
+    # Points in HC and at the infinity.
+    P = CPointArray( [ ( 1, 2, 0 ), ( 0.001, 2, 3 ), ( 2, 2, 2 ) ], 'P' )
+    print( P )
+    print( P.at_infinity() )
+    print()
+
+    # Indexing returns a CPoint or a CPointArray.
+    print( P[ 1 ] )
+    print( P[ 1 : ] )
+    print()
+
+    # Change the origin.
+    P = CPointArray( [ ( 1.0, 1.0 ), ( 2.0, 3.0 ) ], 'P' )
+    corigin.x = 2.0
+    corigin.y = 2.0
+    P.update_origin()
+    print( corigin )
+    print( P )
+    corigin.reset()
+    P.update_origin()
+    print( corigin )
+    print( P )
+    print()
+
+    # Try to create an array of points with only one dimension.
+    try:
+        P = CPointArray( [ ( 0, ), ( 1, ) ] )
+    except CPointTypeError as e:
+        print( e )
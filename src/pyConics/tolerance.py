@@ -62,6 +62,29 @@ class CTolerance:
         # Return 'x' that was adjusted to relative zeros.
         return np.where( np.abs( x ) > rk * self.eps_relzero, x, 0.0 )
 
+    def adjust2relzeros_many( self, x: np.ndarray, ndim: int = 1 ) -> np.ndarray:
+        # Apply adjust2relzeros() to each element of a stack, where every
+        # element is made of the last 'ndim' axes of 'x'.
+        # For instance, a ( N, 3 ) array of points uses ndim = 1 and
+        # a ( K, 3, 3 ) array of conics uses ndim = 2.
+        shape = x.shape
+        n_elem = int( np.prod( shape[ len( shape ) - ndim : ] ) )
+        if ( ( x.size == 0 ) or ( n_elem <= 1 ) ):
+            return x
+        X = x.reshape( ( -1, n_elem ) )
+
+        # Elements with a norm equal to zero are set to zero.
+        n = LA.norm( X, axis = 1 )
+        is_zero = n <= self.eps_iszero
+
+        # Get the rank of the largest number in each element.
+        rk = _larger_ranks( X )[np.newaxis].T
+
+        # Return 'x' that was adjusted to relative zeros.
+        X = np.where( np.abs( X ) > rk * self.eps_relzero, X, 0.0 )
+        X[ is_zero ] = 0.0
+        return X.reshape( shape )
+
 #------------------------------------------------------------------
 # Internal functions.
 #  
@@ -88,6 +111,34 @@ def _larger_rank( x: np.ndarray ) -> float:
 
     return ( 10 ** p_rk )
 
+def _larger_ranks( X: np.ndarray ) -> np.ndarray:
+    # It is the same algorithm of _larger_rank function, but it is
+    # applied to each row of X at once.
+    x_max = np.max( np.abs( X ), axis = 1 )
+    x_min = np.min( np.abs( X ), axis = 1 )
+    is_null = ( x_max == 0.0 ) & ( x_min == 0.0 )
+
+    p_rk = np.ones( x_max.shape )
+    gt_one = x_max > 1.0
+    
+    # for values greater than 1.0
+    m = gt_one & ( ( x_max // 10.0 ) != 0.0 )
+    while ( m.any() ):
+        x_max[ m ] = x_max[ m ] // 10.0
+        p_rk[ m ] += 1
+        m = gt_one & ( ( x_max // 10.0 ) != 0.0 )
+
+    # for values less or equal to 1.0
+    m = ( ~gt_one ) & ( ~is_null ) & ( ( ( x_max * 10.0 ) // 10.0 ) == 0.0 )
+    while ( m.any() ):
+        x_max[ m ] *= 10.0
+        p_rk[ m ] -= 1
+        m = ( ~gt_one ) & ( ~is_null ) & ( ( ( x_max * 10.0 ) // 10.0 ) == 0.0 )
+
+    p_rk[ x_max == 1.0 ] -= 1
+
+    return np.where( is_null, 0.0, 10.0 ** p_rk )
+
 #--------------------------------------------------------------
 # Global variable.
 #
@@ -7,7 +7,7 @@ from __future__ import annotations
 # Everything that can be visible to the world.
 #  
 __all__ = [ 'skew_symmetric', 'cross', 'dot', 'are_perpendicular', \
-            'are_parallel', 'distance' ]
+            'are_parallel', 'distance', 'distance_matrix' ]
 
 #------------------------------------------------------------------
 # Import from...
@@ -25,11 +25,13 @@ if TYPE_CHECKING:
     ... # Do nothing here, because there are no pyConics modules
         # here to be imported.
         
-from pyConics.errors import CTypeError, CArgumentsError
+from pyConics.errors import CTypeError, CArgumentsError, CValueError
 from pyConics.tolerance import ctol
 from pyConics.constants import cconst
 from pyConics.point import CPoint
 from pyConics.line import CLine
+from pyConics.pointarray import CPointArray
+from pyConics.linearray import CLineArray
 
 #------------------------------------------------------------------
 # Import as...
@@ -46,7 +48,15 @@ def skew_symmetric( gf: CPoint | CLine ) -> np.ndarray:
     l3 = [ -gf.gform[ 1 ], gf.gform[ 0 ], 0.0 ]
     return np.array( [ l1, l2, l3 ] )
 
-def cross( gf1: CPoint | CLine, gf2: CPoint | CLine ) -> Any[ CPoint | CLine ]:
+def cross( gf1: CPoint | CLine | CPointArray | CLineArray,
+           gf2: CPoint | CLine | CPointArray | CLineArray,
+           /, *,
+           outer: bool = False ) -> Any[ CPoint | CLine | CPointArray | CLineArray ]:
+    # Arrays of points and lines are handled by a broadcasting kernel.
+    if ( isinstance( gf1, ( CPointArray, CLineArray ) ) ) or \
+        ( isinstance( gf2, ( CPointArray, CLineArray ) ) ) or ( outer == True ):
+        return _cross_many( gf1, gf2, outer )
+
     if ( not isinstance( gf1, ( CPoint, CLine ) ) ):
         raise CTypeError( gf1.__class__.__name__ )
     if ( not isinstance( gf2, ( CPoint, CLine ) ) ):
@@ -62,32 +72,25 @@ def cross( gf1: CPoint | CLine, gf2: CPoint | CLine ) -> Any[ CPoint | CLine ]:
     if ( ( isinstance( gf1, ( CPoint ) ) ) and ( isinstance( gf2, ( CLine ) ) ) ) or \
         ( ( isinstance( gf1, ( CLine ) ) ) and ( isinstance( gf2, ( CPoint ) ) ) ):
         # Condition 3.
-        to_origin = np.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, 1.0, 0.0 ], [ 0.0, 0.0, 0.0 ] ] )
-
-        # Get the skew-symmetric matrix from gf{1,2}.
+        # Take the Line to the origin and get its cross product with the Point.
         if ( isinstance( gf1, ( CPoint ) ) ):
-            ss_gf = skew_symmetric( gf1 )
-            res = ss_gf @ to_origin @ gf2.gform
+            p, l = gf1.gform, gf2.gform
         else:
-            ss_gf = skew_symmetric( gf2 )
-            res = ss_gf @ to_origin @ gf1.gform
-        return CLine( tuple[float, float, float]( res ), shift_origin = False )
+            p, l = gf2.gform, gf1.gform
+        return _line_from( _cross3( p, ( l[ 0 ], l[ 1 ], 0.0 ) ) )
     elif ( ( isinstance( gf1, ( CPoint ) ) ) and ( isinstance( gf2, ( CPoint ) ) ) ):
         # Condition 1.
         # Points couldn't be the same.
         if ( gf1 == gf2 ):
-            return CLine( ( 0.0, 0.0, 0.0 ), shift_origin = False )
+            return CLine.from_array( np.zeros( 3 ) )
         
-        # Get the skew-symmetric matrix from gf1.
-        ss_gf1 = skew_symmetric( gf1 )
-
         # Cross product betwwen them.
-        return CLine( tuple[float, float, float]( ss_gf1 @ gf2.gform ), shift_origin = False )
+        return _line_from( _cross3( gf1.gform, gf2.gform ) )
     else:    
         # Condition 2.
         # Lines couldn't be the same.
         if ( gf1 == gf2 ): # type: ignore
-            return CPoint( ( 0.0, 0.0, 0.0 ), shift_origin = False )
+            return CPoint.from_array( np.zeros( 3 ) )
         
         # Are they parallel lines? Test for epsilon number condition.
         alpha = 1.0
@@ -100,19 +103,10 @@ def cross( gf1: CPoint | CLine, gf2: CPoint | CLine ) -> Any[ CPoint | CLine ]:
                 alpha = gf2.gform[ 0 ] / gf1.gform[ 0 ]
             else:
                 alpha = 1.0
-            
-            a = alpha * gf1.gform[ 0 ]
-            b = alpha * gf1.gform[ 1 ]
-            c = alpha * gf1.gform[ 2 ]
-            l0 = CLine( ( a, b, c ), 'l0' )
-
-            # Get the skew-symmetric matrix from l0.
-            ss_gf1 = skew_symmetric( l0 )
-        else:
-            # Get the skew-symmetric matrix from gf1.
-            ss_gf1 = skew_symmetric( gf1 )
-
-        return CPoint( tuple[ float, float, float ]( ( ss_gf1 @ gf2.gform ) / alpha ), shift_origin = False )
+        
+        # Cross product between alpha * gf1 and gf2.
+        l0 = alpha * gf1.gform
+        return _point_from( _cross3( l0, gf2.gform ) / alpha )
 
 def dot( gf1: CPoint | CLine, gf2: CPoint | CLine ) -> float:
     if ( not isinstance( gf1, ( CPoint, CLine ) ) ):
@@ -203,6 +197,143 @@ def distance( gf1: CPoint | CLine, gf2: CPoint | CLine ) -> float:
         d = distance( p1, p2 )
     return 0.0 if ( ctol.iszero( d ) ) else d
 
+def distance_matrix( gf1: CPoint | CLine | CPointArray | CLineArray,
+                     gf2: CPoint | CLine | CPointArray | CLineArray ) -> np.ndarray:
+    # Get the ( N, M )-matrix of distances from each one of the N points/lines
+    # in gf1 to each one of the M points/lines in gf2.
+    is_pt1, M1 = _as_matrix( gf1 )
+    is_pt2, M2 = _as_matrix( gf2 )
+    M1 = M1[ :, np.newaxis, : ]
+    M2 = M2[ np.newaxis, :, : ]
+
+    # There are the same 4 conditions of the distance function.
+    if ( is_pt1 and is_pt2 ):
+        # Condition 1.
+        return _points_distance( M1, M2 )
+    elif ( ( not is_pt1 ) and is_pt2 ):
+        # Condition 2.
+        return _point_line_distance( M2, M1 )
+    elif ( is_pt1 and ( not is_pt2 ) ):
+        # Condition 3.
+        return _point_line_distance( M1, M2 )
+    else:
+        # Condition 4.
+        return _lines_distance( M1, M2 )
+
+#------------------------------------------------------------------
+# Internal functions.
+#  
+def _cross3( v1: Any, v2: Any ) -> np.ndarray:
+    # Cross product between two 3-vectors without building any
+    # skew-symmetric matrix.
+    return np.array( [ ( v1[ 1 ] * v2[ 2 ] ) - ( v1[ 2 ] * v2[ 1 ] ),
+                       ( v1[ 2 ] * v2[ 0 ] ) - ( v1[ 0 ] * v2[ 2 ] ),
+                       ( v1[ 0 ] * v2[ 1 ] ) - ( v1[ 1 ] * v2[ 0 ] ) ] )
+
+def _line_from( v: np.ndarray ) -> CLine:
+    # Build a CLine from a vector that was computed here.
+    return CLine.from_array( ctol.adjust2relzeros( v ) )
+
+def _point_from( v: np.ndarray ) -> CPoint:
+    # Build a CPoint from a vector that was computed here.
+    v = ctol.adjust2relzeros( v )
+    if ( v[ 2 ] != 0.0 ):
+        v = v / v[ 2 ]
+    return CPoint.from_array( v )
+
+def _as_matrix( gf: CPoint | CLine | CPointArray | CLineArray ) -> tuple[ bool, np.ndarray ]:
+    # Return whether gf is made of points and its ( N, 3 )-matrix.
+    if ( isinstance( gf, ( CPoint, CLine ) ) ):
+        return isinstance( gf, CPoint ), gf.gform[np.newaxis]
+    if ( isinstance( gf, ( CPointArray, CLineArray ) ) ):
+        return isinstance( gf, CPointArray ), gf.gform
+    raise CTypeError( gf.__class__.__name__ )
+
+def _broadcast( M1: np.ndarray, M2: np.ndarray, outer: bool ) -> tuple[ np.ndarray, np.ndarray ]:
+    # Pair up the rows of M1 and M2. If outer is True, every row of M1 is
+    # paired up with every row of M2 and the ( N * M, 3 )-matrices are
+    # returned in a row-major order, i.e., the pair ( i, j ) is in the
+    # row i * M + j.
+    if ( outer == True ):
+        n1 = M1.shape[ 0 ]
+        n2 = M2.shape[ 0 ]
+        return np.repeat( M1, n2, axis = 0 ), np.tile( M2, ( n1, 1 ) )
+    
+    if ( ( M1.shape[ 0 ] != M2.shape[ 0 ] ) and ( M1.shape[ 0 ] != 1 ) and ( M2.shape[ 0 ] != 1 ) ):
+        raise CValueError( cross.__name__, 'the arrays must have the same number of rows.' )
+    return np.broadcast_arrays( M1, M2 )
+
+def _points_distance( P1: np.ndarray, P2: np.ndarray ) -> np.ndarray:
+    # Euclidean distance between points, row by row. Points at infinity
+    # are infinitely far away from anything.
+    d = np.hypot( P1[ ..., 0 ] - P2[ ..., 0 ], P1[ ..., 1 ] - P2[ ..., 1 ] )
+    d[ ( P1[ ..., 2 ] == 0.0 ) | ( P2[ ..., 2 ] == 0.0 ) ] = cconst.inf
+    return np.where( d <= ctol.eps_iszero, 0.0, d )
+
+def _point_line_distance( P: np.ndarray, L: np.ndarray ) -> np.ndarray:
+    # Distance between points and lines, row by row. It is the absolute
+    # value of < p, l > once the normal vector of l has a unit length.
+    n = np.hypot( L[ ..., 0 ], L[ ..., 1 ] )
+    at_inf = ( P[ ..., 2 ] == 0.0 ) | ( n == 0.0 )
+    n = np.where( n == 0.0, 1.0, n )
+    d = np.abs( ( P[ ..., 0 ] * L[ ..., 0 ] ) + ( P[ ..., 1 ] * L[ ..., 1 ] ) + L[ ..., 2 ] ) / n
+    d[ at_inf ] = cconst.inf
+    return np.where( d <= ctol.eps_iszero, 0.0, d )
+
+def _are_parallel( L1: np.ndarray, L2: np.ndarray ) -> np.ndarray:
+    # To be parallel lines, ( x1 * y2 ) - ( x2 * y1 ) must be zero.
+    op = ( L1[ ..., 0 ] * L2[ ..., 1 ] ) - ( L1[ ..., 1 ] * L2[ ..., 0 ] )
+    return np.abs( op ) <= ctol.eps_iszero
+
+def _lines_distance( L1: np.ndarray, L2: np.ndarray ) -> np.ndarray:
+    # Distance between lines, row by row. Concurrent lines are 0.0 apart
+    # and lines at infinity are infinitely far away from anything.
+    n1 = np.hypot( L1[ ..., 0 ], L1[ ..., 1 ] )
+    n2 = np.hypot( L2[ ..., 0 ], L2[ ..., 1 ] )
+    at_inf = ( n1 == 0.0 ) | ( n2 == 0.0 )
+    n1 = np.where( n1 == 0.0, 1.0, n1 )
+    n2 = np.where( n2 == 0.0, 1.0, n2 )
+
+    # Parallel lines have normal vectors that point to the same or to
+    # opposite directions. So, the distance is the difference between
+    # their normalized linear coefs.
+    s = np.sign( ( L1[ ..., 0 ] * L2[ ..., 0 ] ) + ( L1[ ..., 1 ] * L2[ ..., 1 ] ) )
+    d = np.abs( ( L1[ ..., 2 ] / n1 ) - ( s * L2[ ..., 2 ] / n2 ) )
+    d[ ~_are_parallel( L1, L2 ) ] = 0.0
+    d[ at_inf ] = cconst.inf
+    return np.where( d <= ctol.eps_iszero, 0.0, d )
+
+def _cross_many( gf1: CPoint | CLine | CPointArray | CLineArray,
+                 gf2: CPoint | CLine | CPointArray | CLineArray,
+                 outer: bool ) -> CPointArray | CLineArray:
+    is_pt1, M1 = _as_matrix( gf1 )
+    is_pt2, M2 = _as_matrix( gf2 )
+    M1, M2 = _broadcast( M1, M2, outer )
+
+    # There are the same 3 conditions of the cross function.
+    if ( is_pt1 != is_pt2 ):
+        # Condition 3.
+        # The lines that pass through the Points and are orthogonal
+        # to the Lines.
+        P, L = ( M1, M2 ) if ( is_pt1 ) else ( M2, M1 )
+        L = L * np.array( [ 1.0, 1.0, 0.0 ] )
+        return CLineArray( np.cross( P, L ), shift_origin = False )
+    elif ( is_pt1 ):
+        # Condition 1.
+        # Coincident points return a null line.
+        res = np.cross( M1, M2 )
+        res[ _points_distance( M1, M2 ) == 0.0 ] = 0.0
+        return CLineArray( res, shift_origin = False )
+    else:
+        # Condition 2.
+        # Parallel lines meet at a point at the infinity and
+        # coincident lines return a null point.
+        res = np.cross( M1, M2 )
+        parallel = _are_parallel( M1, M2 )
+        res[ parallel, 2 ] = 0.0
+        res[ parallel & ( _lines_distance( M1, M2 ) == 0.0 ) ] = 0.0
+        return CPointArray( res, shift_origin = False )
+
 #------------------------------------------------------------------
 # For development and test.
 #  
@@ -333,3 +464,18 @@ if __name__ == '__main__':
     print( cross( l1, l2 ) )
     print( l1 )
     print( l2 )
+    print()
+
+    # Broadcasting cross product.
+    P = CPointArray( [ ( 1, 1 ), ( -1, -1 ), ( 0, 1 ) ], 'P' )
+    L = CLineArray( [ ( 1, -1, 1 ), ( 1, -1, -1 ), ( 2, -2, 2 ) ], 'L' )
+    print( cross( P, P[ :: -1 ] ) )             # joins, row by row.
+    print( cross( P, P, outer = True ) )        # all the joins.
+    print( cross( L, L, outer = True ) )        # all the meets.
+    print( cross( L, CPoint( ( 1, 0 ) ) ) )     # lines through ( 1, 0 ).
+    print()
+
+    # Matrices of distances.
+    print( distance_matrix( P, P ) )
+    print( distance_matrix( P, L ) )
+    print( distance_matrix( L, L ) )
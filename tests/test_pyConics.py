@@ -84,6 +84,1152 @@ def test_origin():
 
     # assert p1 == p2
 
+def test_CPointArray():
+    from pyConics import CPointArray, corigin
+
+    coords = [ ( 0, 1 ), ( 2, 4, 2 ), ( 1, 1, 0 ), ( 1e-9, 3 ) ]
+    P = CPointArray( coords, 'P' )
+    assert len( P ) == 4
+    assert P.gform.shape == ( 4, 3 )
+    assert P.gform.flags[ 'C_CONTIGUOUS' ]
+
+    # It must have the same semantics of CPoint.
+    for i, coord in enumerate( coords ):
+        p = CPoint( coord )
+        assert np.array_equal( P.gform[ i ], p.gform )
+    assert list( P.at_infinity() ) == [ False, False, True, False ]
+    assert np.array_equal( P.x, P.gform[ :, 0 ] )
+    assert np.array_equal( P.y, P.gform[ :, 1 ] )
+
+    # Indexing.
+    p1 = P[ 1 ]
+    assert isinstance( p1, CPoint )
+    assert p1 == CPoint( ( 1, 2 ) )
+    assert p1.name == 'P[1]'
+    assert isinstance( P[ 1 : 3 ], CPointArray )
+    assert len( P[ np.array( [ 0, 3 ] ) ] ) == 2
+
+    # Shifting origin.
+    corigin.x = 2.0
+    corigin.y = 1.0
+    P.update_origin()
+    assert np.array_equal( P.gform[ 0 ], CPoint( ( 0, 1 ) ).gform )
+    corigin.reset()
+    P.update_origin()
+    assert np.array_equal( P.gform, P.from_origin )
+
+    # Built from a list of CPoints.
+    Q = CPointArray( [ CPoint( ( 0, 1 ) ), CPoint( ( 1, 2 ) ) ] )
+    assert np.array_equal( Q.gform, P.gform[ 0 : 2 ] )
+
+def test_CLineArray():
+    from pyConics import CPointArray, CLineArray, corigin
+
+    coefs = [ ( 1, -1, 1 ), ( 1, 0, -2 ), ( 2, 1, 0 ), ( 1.5, -1.5, -1.5 ) ]
+    L = CLineArray( coefs, 'L' )
+    assert len( L ) == 4
+    assert not L.at_infinity().any()
+
+    # It must have the same semantics of CLine.
+    for i, coef in enumerate( coefs ):
+        l = CLine( coef )
+        assert np.array_equal( L.gform[ i ], l.gform )
+        assert L.coef_angular()[ i ] == l.coef_angular()
+        assert L.coef_angular( True )[ i ] == l.coef_angular( True )
+        assert L.coef_linear()[ i ] == l.coef_linear()
+    assert isinstance( L[ 0 ], CLine )
+    assert len( L[ 1 : ] ) == 3
+
+    # Shifting origin.
+    corigin.x = 3.0
+    corigin.y = 2.0
+    L.update_origin()
+    for i, coef in enumerate( coefs ):
+        assert np.array_equal( L.gform[ i ], CLine( coef ).gform )
+    corigin.reset()
+    L.update_origin()
+    assert np.array_equal( L.gform, L.from_origin )
+
+    # Join and meet.
+    P1 = CPointArray( [ ( 1, 1 ), ( 0, 1 ) ] )
+    P2 = CPointArray( [ ( -1, -1 ), ( 1, 0 ) ] )
+    L = P1 * P2
+    assert L[ 0 ] == CLine( ( 1, -1, 0 ) )
+    assert L[ 1 ] == CLine( ( 1, 1, -1 ) )
+    P = L * L[ :: -1 ]
+    assert P[ 0 ] == CPoint( ( 0.5, 0.5 ) )
+
+    # Lines at infinity.
+    L = CLineArray( [ ( 0, 0, 1 ), ( 1, 1, 1 ) ] )
+    assert list( L.at_infinity() ) == [ True, False ]
+
+def test_cross():
+    from pyConics import CPointArray, CLineArray
+    from pyConics.utils import cross
+
+    pts = [ ( 1, 1 ), ( -1, -1 ), ( 0, 1 ), ( 1, 1 ), ( 2, 3, 0 ) ]
+    lns = [ ( 1, -1, 1 ), ( 1, -1, -1 ), ( 2, -2, 2 ), ( -1, -1, 1 ), ( 1, 0, -2 ) ]
+    P = CPointArray( pts )
+    L = CLineArray( lns )
+
+    # All the pairs must be equal to the scalar cross product.
+    for A, B, fa, fb in [ ( P, P, CPoint, CPoint ), ( L, L, CLine, CLine ),
+                          ( P, L, CPoint, CLine ), ( L, P, CLine, CPoint ) ]:
+        R = cross( A, B, outer = True )
+        a_list = pts if ( fa == CPoint ) else lns
+        b_list = pts if ( fb == CPoint ) else lns
+        assert len( R ) == len( a_list ) * len( b_list )
+        for i, a in enumerate( a_list ):
+            for j, b in enumerate( b_list ):
+                r = fa( a ) * fb( b )
+                assert np.allclose( R.gform[ i * len( b_list ) + j ], r.gform )
+
+    # Degenerate cases: coincident -> zero vector, parallel -> point at infinity.
+    assert not cross( P, P, outer = True ).gform[ 0 ].any()
+    M = cross( L[ 0 : 2 ], L[ 2 : 3 ] )
+    assert not M.gform[ 0 ].any()
+    assert M.at_infinity()[ 1 ]
+    assert not cross( P[ 0 : 1 ], P[ 3 : 4 ] ).gform.any()
+
+    # Rows are broadcast and scalars are accepted.
+    assert len( P * CPoint( ( 0, 0 ) ) ) == len( P )
+    assert len( cross( CLine( ( 1, 0, 0 ) ), L ) ) == len( L )
+
+def test_distance_matrix():
+    from pyConics import CPointArray, CLineArray, cconst
+    from pyConics.utils import distance_matrix, distance
+
+    pts = [ ( 0, 1 ), ( 1, 0 ), ( 2, 3 ), ( 1, 1, 0 ) ]
+    lns = [ ( 1, -1, 1 ), ( 1, -1, -1 ), ( 2, -2, 5 ), ( 1, 0, -2 ), ( 0, 0, 1 ) ]
+    P = CPointArray( pts )
+    L = CLineArray( lns )
+
+    # All the pairs must be equal to the scalar distance.
+    for A, B, fa, fb in [ ( P, P, CPoint, CPoint ), ( L, L, CLine, CLine ),
+                          ( P, L, CPoint, CLine ), ( L, P, CLine, CPoint ) ]:
+        D = distance_matrix( A, B )
+        a_list = pts if ( fa == CPoint ) else lns
+        b_list = pts if ( fb == CPoint ) else lns
+        assert D.shape == ( len( a_list ), len( b_list ) )
+        for i, a in enumerate( a_list ):
+            for j, b in enumerate( b_list ):
+                d = distance( fa( a ), fb( b ) )
+                if ( d == cconst.inf ):
+                    assert D[ i, j ] == cconst.inf
+                else:
+                    assert np.isclose( D[ i, j ], d )
+
+def test_CConic_contains_many():
+    from pyConics import CConic, CPointArray, cconst
+
+    C1 = CConic( 2.0, 1.0, 30.0 / 180 * cconst.pi, CPoint( ( 1, 2 ) ), 'C1' )  # ellipse.
+    C2 = CConic( 0.5, name = 'C2', foci = ( CPoint( ( 0, 1 ) ), CPoint( ( 0, -1 ) ) ) )  # hyperbole.
+
+    rng = np.random.default_rng( 0 )
+    xy = rng.uniform( -3.0, 3.0, size = ( 200, 2 ) )
+    pts = np.block( [ [ xy ], [ np.array( [ [ 0, 0.5 ], [ 0, 1 ], [ 0, 0 ], [ 5, 0 ] ] ) ] ] )
+    P = CPointArray( pts )
+
+    for C in [ C1, C2 ]:
+        on_conic, side = C.contains_many( P )
+        assert on_conic.shape == side.shape == ( len( P ), )
+
+        # It must be equal to the __contains__ method.
+        for i in range( len( P ) ):
+            assert on_conic[ i ] == ( P[ i ] in C )
+        assert np.array_equal( C.contains_many( pts )[ 0 ], on_conic )
+
+    # Integer coords are accepted.
+    on_conic, side = CConic( 2.0, 1.0 ).contains_many( np.array( [ [ 2, 0, 1 ], [ 0, 0, 1 ], [ 4, 0, 2 ] ] ) )
+    assert on_conic.tolist() == [ True, False, True ] and side.tolist() == [ 0, -1, 0 ]
+
+    # A single point, in homogeneous or in cartesian coords.
+    for p in ( np.array( [ 4.0, 0.0, 2.0 ] ), np.array( [ 2.0, 0.0 ] ) ):
+        on_conic, side = CConic( 2.0, 1.0 ).contains_many( p )
+        assert on_conic.tolist() == [ True ] and side.tolist() == [ 0 ]
+
+    # Classification.
+    _, side = C1.contains_many( CPointArray( [ ( 1, 2 ), ( 10, 10 ) ] ) )
+    assert list( side ) == [ -1, 1 ]
+    _, side = C2.contains_many( CPointArray( [ ( 0, 1 ), ( 0, -1 ), ( 0, 0 ), ( 2, 0 ), ( 0, 0.5 ) ] ) )
+    assert list( side ) == [ -1, -1, 1, 1, 0 ]
+
+def test_CConicArray():
+    from pyConics import CConic, CConicArray, CPointArray, CLineArray, cconst, corigin
+
+    conics = [ CConic( name = 'C0' ),
+               CConic( 0.3, 0.5, 30.0 / 180 * cconst.pi, CPoint( ( 0, 0 ) ), 'C1' ),
+               CConic( 2.0, 0.5, 30.0 / 180 * cconst.pi, CPoint( ( 2, 1 ) ), 'C2' ),
+               CConic( 0.2, name = 'C3', foci = ( CPoint( ( 0, 0.4 ) ), CPoint( ( 0, -0.4 ) ) ) ),
+               CConic( degenerate = ( CLine( ( 1, -1, 0 ) ), CLine( ( 1, 1, 0 ) ) ), name = 'C4' ),
+               CConic( degenerate = ( CLine( ( 1, 0, -2 ) ), CLine( ( 1, 0, -2 ) ) ), name = 'C5' ) ]
+    CC = CConicArray( conics, 'CC' )
+    assert len( CC ) == len( conics )
+
+    # It must have the same results of CConic.
+    p = CPoint( ( 1, 0.5 ) )
+    l = CLine( ( 1, -1, 1 ) )
+    polars = CC.polar( p )
+    poles = CC.pole( l )
+    for i, C in enumerate( conics ):
+        assert CC.rank[ i ] == C.rank
+        assert CC.is_fullrank()[ i ] == C.is_fullrank()
+        assert CC.area()[ i ] == C.area() or np.isclose( CC.area()[ i ], C.area() )
+        assert np.allclose( polars.gform[ i ], C.polar( p ).gform )
+        assert np.allclose( poles.gform[ i ], C.pole( l ).gform )
+        assert isinstance( CC[ i ], CConic )
+        assert np.array_equal( CC[ i ].gform, C.gform )
+
+    # Pairing row by row.
+    P = CPointArray( [ ( i, 1 ) for i in range( len( CC ) ) ] )
+    assert len( CC * P ) == len( CC )
+    assert isinstance( CC * CLineArray( [ ( 1, 1, 1 ) ] ), CPointArray )
+
+    # Shifting origin.
+    corigin.x = 1.0
+    corigin.y = -2.0
+    CC.update_origin()
+    for i, C in enumerate( conics[ 0 : 4 ] ):
+        assert np.allclose( CC.gform[ i ], corigin.change_conic( C.gform ) )
+    corigin.reset()
+    CC.update_origin()
+    assert np.allclose( CC.gform, CC.from_origin )
+
+def test_trusted_constructors():
+    from pyConics import CConic, corigin
+
+    p = CPoint.from_array( np.array( [ 1.0, 2.0, 1.0 ] ), 'p' )
+    assert p == CPoint( ( 1, 2 ) )
+    assert p.name == 'p'
+    l = CLine.from_array( np.array( [ 1.0, -1.0, 1.0 ] ), 'l' )
+    assert l == CLine( ( 1, -1, 1 ) )
+
+    # Shifting origin.
+    corigin.x = 1.0
+    corigin.y = 1.0
+    assert CPoint.from_array( p.from_origin, shift_origin = True ) == CPoint( ( 1, 2 ) )
+    assert np.array_equal( CLine.from_array( l.from_origin, shift_origin = True ).gform,
+                           CLine( ( 1, -1, 1 ) ).gform )
+    corigin.reset()
+
+    # Conics.
+    C1 = CConic( 2.0, 0.5, 0.3, CPoint( ( 1, 2 ) ), 'C1' )
+    C2 = CConic.from_matrix( C1.gform.copy(), 'C2' )
+    assert C2.rank == C1.rank
+    assert not C2.is_degenerate
+    assert np.array_equal( C2.gform, C1.gform )
+    assert C1.copy().rank == C1.rank
+
+def test_slots():
+    from pyConics import CConic, CPointArray, corigin
+
+    # No __dict__ is carried by the geometric objects.
+    p = CPoint( ( 1, 2 ) )
+    l = CLine( ( 1, -1, 1 ) )
+    C = CConic( 2.0, 0.5 )
+    for obj in ( p, l, C, CPointArray( [ ( 1, 2 ) ] ) ):
+        assert not hasattr( obj, '__dict__' )
+
+    # Both forms are the same array while the origin is not shifted.
+    assert p.gform is p.from_origin
+    assert C.gform is C.from_origin
+
+    # Shifting the origin must not touch the original form.
+    corigin.x = 1.0
+    corigin.y = 1.0
+    p.update_origin()
+    assert p.gform is not p.from_origin
+    assert p == CPoint( ( 0, 1 ), shift_origin = False )
+    assert np.array_equal( p.from_origin, np.array( [ 1.0, 2.0, 1.0 ] ) )
+    corigin.reset()
+    p.update_origin()
+    assert np.array_equal( p.gform, np.array( [ 1.0, 2.0, 1.0 ] ) )
+
+def test_headless_import():
+    import sys
+
+    # The geometry core must not load the plotting stack. Its import
+    # time is measured by the 'import pyConics' benchmark.
+    code = ( 'import sys\n'
+             'import pyConics\n'
+             'C = pyConics.CConic( 2.0, 0.5 )\n'
+             'print( "matplotlib" in sys.modules, "pyautogui" in sys.modules )' )
+    r = sp.run( [ sys.executable, '-c', code ], capture_output = True, text = True )
+    assert r.stdout.split() == [ 'False', 'False' ]
+
+    # The lazy names are still exported by a star import and the
+    # plotting classes are still reachable from the package.
+    assert all( name in con.__all__ for name in ( 'CFigure', 'CAxes', 'CConic', 'corigin' ) )
+    assert 'CFigure' in dir( con ) and 'plotting' in dir( con )
+    assert con.CAxes.__name__ == 'CAxes'
+    ns: dict = {}
+    exec( 'from pyConics import *', ns )
+    assert ns[ 'CFigure' ] is con.plotting.CFigure and 'CAxes' in ns
+
+def test_CConic_sequence():
+    from pyConics import CConic, cconst
+    from pyConics.errors import CValueError
+
+    C1 = CConic( 2.0, 1.0, 30.0 / 180 * cconst.pi, CPoint( ( 1, 2 ) ), 'C1' )  # ellipse.
+    C2 = CConic( 0.5, name = 'C2', foci = ( CPoint( ( 0, 1 ) ), CPoint( ( 0, -1 ) ) ) )  # hyperbole.
+
+    # The whole ellipse lies in the box. So, it is a closed curve.
+    x = list( np.linspace( -3.0, 5.0, 21 ) )
+    y = list( np.linspace( -1.0, 5.0, 21 ) )
+    lst = C1.sequence( x, y )
+    assert len( lst ) == 1
+    assert lst[ 0 ][ 0 ] == lst[ 0 ][ -1 ]
+
+    # Each branch of the hyperbole is a piece.
+    x = list( np.linspace( -3.0, 3.0, 21 ) )
+    lst = C2.sequence( x )
+    assert len( lst ) == 2
+
+    # The points lie in the conics and in the box.
+    for C, x, y in [ ( C1, np.linspace( 0.5, 1.5, 21 ), np.linspace( -1.0, 5.0, 21 ) ),
+                     ( C2, np.linspace( -3.0, 3.0, 21 ), np.linspace( -2.0, 2.0, 21 ) ) ]:
+        lst = C.sequence( list( x ), list( y ) )
+        assert len( lst ) >= 2
+        for lp in lst:
+            for p in lp:
+                assert p in C
+                assert ( x[ 0 ] <= p.x <= x[ -1 ] ) and ( y[ 0 ] <= p.y <= y[ -1 ] )
+
+    # No piece lies in the box.
+    assert C1.sequence( [ 10.0, 11.0 ] ) == ( (), )
+
+    # The contour method is still available.
+    x = list( np.linspace( -3.0, 5.0, 21 ) )
+    assert len( C1.sequence( x, method = 'contour' ) ) == 1
+    try:
+        C1.sequence( x, method = 'grid' )
+        assert False
+    except CValueError:
+        pass
+
+def test_contour_conic():
+    from concurrent.futures import ThreadPoolExecutor
+    from pyConics import CConic, cconst
+    from pyConics.conics.utils import contour_conic
+
+    C1 = CConic( 2.0, 1.0, 30.0 / 180 * cconst.pi, CPoint( ( 1, 2 ) ), 'C1' )  # ellipse.
+    C2 = CConic( 0.5, name = 'C2', foci = ( CPoint( ( 0, 1 ) ), CPoint( ( 0, -1 ) ) ) )  # hyperbole.
+    C3 = CConic.from_matrix( np.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, 0.0, -0.5 ], [ 0.0, -0.5, 0.0 ] ] ) )  # y = x^2.
+
+    # An ellipse is a closed polyline and a hyperbole has two branches.
+    x = np.linspace( -3.0, 5.0, 41 )
+    lst = contour_conic( C1.gform, x, x )
+    assert ( len( lst ) == 1 ) and np.array_equal( lst[ 0 ][ 0 ], lst[ 0 ][ -1 ] )
+    lst = contour_conic( C2.gform, x, x )
+    assert ( len( lst ) == 2 ) and not np.array_equal( lst[ 0 ][ 0 ], lst[ 0 ][ -1 ] )
+
+    # The vertices are close to the conics.
+    for C in [ C1, C2, C3 ]:
+        for P in contour_conic( C.gform, x, x ):
+            v = np.block( [ [ P, np.ones( ( P.shape[ 0 ], 1 ) ) ] ] )
+            assert np.abs( np.einsum( 'ki,ij,kj->k', v, C.gform, v ) ).max() < 0.05
+
+    # A parabola falls back to the contour method.
+    lst = C3.sequence( list( np.linspace( -2.0, 2.0, 21 ) ), list( np.linspace( -1.0, 3.0, 21 ) ) )
+    assert len( lst ) == 1
+    for p in lst[ 0 ]:
+        assert abs( p.y - p.x ** 2 ) < 0.05
+
+    # There is no global state, so it can be used from worker threads.
+    with ThreadPoolExecutor( 4 ) as pool:
+        res = list( pool.map( lambda C: C.sequence( list( x ), method = 'contour' ), [ C1, C2 ] * 4 ) )
+    for k, lst in enumerate( res ):
+        assert len( lst ) == ( 1 if ( k % 2 == 0 ) else 2 )
+
+def test_CConic_intersect_lines():
+    from pyConics import CConic, CLineArray, cconst
+
+    C1 = CConic( 2.0, 1.0, 30.0 / 180 * cconst.pi, CPoint( ( 1, 2 ) ), 'C1' )  # ellipse.
+    C2 = CConic( 1.0, 2.0, 0.0, CPoint( ( 0, 0 ) ), 'C2' )  # hyperbole x^2 - y^2 / 3 = 1.
+
+    # Random lines through the center of the ellipse meet it twice.
+    rng = np.random.default_rng( 0 )
+    ang = rng.uniform( 0.0, cconst.pi, 100 )
+    L = CLineArray( np.stack( [ np.sin( ang ), -np.cos( ang ), np.cos( ang ) * 2 - np.sin( ang ) ], axis = 1 ) )
+    P1, P2, valid = C1.intersect_lines( L )
+    assert valid.all()
+    for k in range( len( L ) ):
+        assert ( P1[ k ] in C1 ) and ( P2[ k ] in C1 )
+        assert ( P1[ k ] in L[ k ] ) and ( P2[ k ] in L[ k ] )
+
+    # Tangent, missing and at infinity lines.
+    x = C2.gform.copy()
+    P1, P2, valid = C2.intersect_lines( np.array( [ [ 1.0, 0.0, -1.0 ],              # tangent at ( 1, 0 ).
+                                                    [ 1.0, 0.0, 0.0 ],               # misses it.
+                                                    [ np.sqrt( 3 ), -1.0, 1.0 ],     # parallel to an asymptote.
+                                                    [ 0.0, 0.0, 1.0 ] ] ) )          # line at infinity.
+    assert valid.tolist() == [ [ True, False ], [ False, False ], [ True, True ], [ False, False ] ]
+    assert P1[ 0 ] == CPoint( ( 1, 0 ) )
+    assert P1[ 2 ] in C2
+    assert P2.at_infinity()[ 2 ]
+    assert np.array_equal( x, C2.gform )
+
+    # A single CLine.
+    P1, P2, valid = C2.intersect_lines( CLine( ( 0, 1, 0 ) ) )
+    assert valid.tolist() == [ [ True, True ] ]
+    assert sorted( [ P1[ 0 ].x, P2[ 0 ].x ] ) == [ -1.0, 1.0 ]
+
+def test_CConic_intersect():
+    from pyConics import CConic, CConicArray, cconst
+
+    C1 = CConic( 2.0, 1.0, 0.0, CPoint( ( 0, 0 ) ), 'C1' )
+    C2 = CConic( 2.0, 1.0, cconst.pi / 2, CPoint( ( 0, 0 ) ), 'C2' )
+    C3 = CConic( 1.0, 2.0, 0.3, CPoint( ( 0.5, 0 ) ), 'C3' )         # hyperbole.
+    C4 = CConic( 2.0, 1.0, 0.0, CPoint( ( 4, 0 ) ), 'C4' )           # tangent to C1 at ( 2, 0 ).
+    C5 = CConic( 2.0, 1.0, 0.0, CPoint( ( 6, 0 ) ), 'C5' )           # far from C1.
+    C6 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, 0.0 ) ) ), name = 'C6' )
+
+    # Number of points and where they lie.
+    for C, n in [ ( C2, 4 ), ( C3, 4 ), ( C4, 1 ), ( C5, 0 ), ( C6, 4 ) ]:
+        P = C1.intersect( C )
+        assert len( P ) == n
+        for k in range( n ):
+            assert ( P[ k ] in C1 ) and ( P[ k ] in C )
+
+    # The order of the conics does not matter.
+    P = C3.intersect( C1 )
+    Q = C1.intersect( C3 )
+    assert all( any( P[ i ] == Q[ j ] for j in range( 4 ) ) for i in range( 4 ) )
+    assert C1.intersect( C4 )[ 0 ] == CPoint( ( 2, 0 ) )
+
+    # Batched version over K pairs.
+    CC = CConicArray( [ C2, C3, C4, C5, C6 ] )
+    P, valid = CC.intersect( C1 )
+    assert valid.shape == ( 5, 4 )
+    assert list( valid.sum( axis = 1 ) ) == [ 4, 4, 1, 0, 4 ]
+    for k in range( 5 ):
+        for j in range( 4 ):
+            if ( valid[ k, j ] ):
+                assert ( P[ 4 * k + j ] in C1 ) and ( P[ 4 * k + j ] in CC[ k ] )
+    P, valid = CC.intersect( CConicArray( [ C1 ] * 5 ) )
+    assert list( valid.sum( axis = 1 ) ) == [ 4, 4, 1, 0, 4 ]
+
+def test_CConic_cache():
+    from pyConics import CConic, corigin
+    from pyConics.errors import CValueError
+
+    C1 = CConic( 2.0, 1.0, 0.5, CPoint( ( 0.5, -0.5 ) ), 'C1' )
+    C2 = CConic( 1.0, 2.0, 0.0, CPoint( ( 1.0, 2.0 ) ), 'C2' )          # hyperbole.
+    C3 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, -2.0 ) ) ), name = 'C3' )
+
+    # Center and semi-axes.
+    assert C1.center() == CPoint( ( 0.5, -0.5 ) )
+    assert np.allclose( C1.axes(), ( 2.0, np.sqrt( 3.0 ) ) )
+    assert C2.center() == CPoint( ( 1.0, 2.0 ) )
+    assert np.allclose( C2.axes(), ( 1.0, np.sqrt( 3.0 ) ) )
+    assert C3.center() == CPoint( ( 1.0, 1.0 ) )
+    try:
+        C3.axes()
+        assert False
+    except CValueError:
+        pass
+
+    # The adjugate of the conics, one at a time or as a stack.
+    from pyConics.conics.utils import adjugate
+    M = np.stack( [ C1.gform, C2.gform ] )
+    assert np.allclose( adjugate( M ), np.linalg.det( M )[ :, np.newaxis, np.newaxis ] * np.linalg.inv( M ) )
+    assert np.allclose( adjugate( C3.gform ) @ C3.gform, 0.0 )
+
+    # Repeated queries return the same values.
+    l = CLine( ( 1.0, 2.0, 3.0 ) )
+    p = C1 * l
+    assert ( C1 * l ) == p
+    assert C1.area() == C1.area()
+
+    # The cache is dropped when the origin changes.
+    C4 = C1.copy()
+    corigin.x = 1.0
+    corigin.y = 2.0
+    C1.update_origin()
+    assert np.allclose( C1.center().gform, ( -0.5, -2.5, 1.0 ) )
+    assert np.allclose( C1.axes(), ( 2.0, np.sqrt( 3.0 ) ) )
+    assert np.isclose( C1.area(), C4.area() )
+    assert ( C1 * l ) != p
+    corigin.reset()
+    assert C4.center() == CPoint( ( 0.5, -0.5 ) )
+
+def test_CConic_canonical():
+    from pyConics import CConic, CConicArray, cconst
+
+    C1 = CConic( 2.0, 1.0, 0.5, CPoint( ( 0.5, -0.5 ) ), 'C1' )
+    C2 = CConic( 1.0, 2.0, -0.3, CPoint( ( 1.0, 2.0 ) ), 'C2' )        # hyperbole.
+    C3 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, -2.0 ) ) ), name = 'C3' )
+    C4 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, -1.0, -2.0 ) ) ), name = 'C4' )
+    C5 = CConic.from_matrix( np.array( [ [ 0.0, 0.0, -0.5 ], [ 0.0, 1.0, 0.0 ], [ -0.5, 0.0, 0.0 ] ] ) )
+    C6 = CConic.from_matrix( np.diag( [ 1.0, 1.0, 1.0 ] ) )
+
+    # The parameters of the constructor are recovered.
+    params = C1.canonical()
+    assert C1.classify() == 'ellipse'
+    assert np.allclose( params[ 'center' ], ( 0.5, -0.5 ) )
+    assert np.allclose( params[ 'axes' ], ( 2.0, np.sqrt( 3.0 ) ) )
+    assert np.isclose( params[ 'angle' ], 0.5 )
+    assert np.allclose( params[ 'foci' ][ 0 ], ( 0.5 + np.cos( 0.5 ), -0.5 + np.sin( 0.5 ) ) )
+    params = C2.canonical()
+    assert C2.classify() == 'hyperbole'
+    assert np.allclose( params[ 'axes' ], ( 1.0, np.sqrt( 3.0 ) ) )
+    assert np.isclose( params[ 'angle' ], -0.3 )
+    assert np.allclose( params[ 'foci' ][ 0 ], ( 1.0 + 2.0 * np.cos( 0.3 ), 2.0 - 2.0 * np.sin( 0.3 ) ) )
+
+    # y^2 = x has its vertex at ( 0, 0 ) and its focus at ( 1/4, 0 ).
+    params = C5.canonical()
+    assert C5.classify() == 'parabola'
+    assert np.allclose( params[ 'center' ], ( 0.0, 0.0 ) )
+    assert np.allclose( params[ 'foci' ][ 0 ], ( 0.25, 0.0 ) )
+    assert np.isnan( params[ 'foci' ][ 1 ] ).all()
+
+    assert C3.classify() == 'crossing lines'
+    assert np.allclose( C3.canonical()[ 'center' ], ( 1.0, 1.0 ) )
+    assert C4.classify() == 'parallel lines'
+    assert C6.classify() == 'imaginary ellipse'
+
+    # The vectorized version agrees with the scalar one.
+    CC = CConicArray( [ C1, C2, C3, C4, C5, C6 ] )
+    assert list( CC.classify() ) == [ C.classify() for C in [ C1, C2, C3, C4, C5, C6 ] ]
+    params = CC.canonical()
+    for k, C in enumerate( [ C1, C2, C3, C4, C5, C6 ] ):
+        for key in ( 'center', 'axes', 'angle', 'foci' ):
+            assert np.allclose( params[ key ][ k ], C.canonical()[ key ], equal_nan = True )
+
+def test_fit_conic():
+    from pyConics import CConic, CPointArray, cconst, corigin, fit_conic
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 1 )
+    t = rng.uniform( 0.0, 2.0 * cconst.pi, 20000 )
+
+    # Noisy points of an ellipse with a = 2, b = 1, angle = 0.5 and center ( 3, -1 ).
+    u = np.stack( [ 2.0 * np.cos( t ), np.sin( t ) ], axis = 1 )
+    R = np.array( [ [ np.cos( 0.5 ), -np.sin( 0.5 ) ], [ np.sin( 0.5 ), np.cos( 0.5 ) ] ] )
+    xy = u @ R.T + ( 3.0, -1.0 ) + rng.normal( 0.0, 0.01, u.shape )
+    for method in ( 'algebraic', 'ellipse' ):
+        C = fit_conic( CPointArray( xy ), 'C', method = method )
+        params = C.canonical()
+        assert params[ 'type' ] == 'ellipse'
+        assert np.allclose( params[ 'center' ], ( 3.0, -1.0 ), atol = 1e-2 )
+        assert np.allclose( params[ 'axes' ], ( 2.0, 1.0 ), atol = 1e-2 )
+        assert np.isclose( params[ 'angle' ], 0.5, atol = 1e-2 )
+
+    # Any multiple of a matrix is scaled as the constructor does.
+    from pyConics.conics.utils import normalize_many
+    C = CConic( 2.0, 1.0, 0.5, CPoint( ( 3.0, -1.0 ) ) )
+    assert np.allclose( normalize_many( np.stack( [ 5.0 * C.gform, -0.1 * C.gform ] ) ), C.gform )
+
+    # Exact points recover the conic matrix of the constructor.
+    C0 = CConic( 1.0, 2.0, 0.3, CPoint( ( 1.0, 2.0 ) ), 'C0' )
+    u = np.stack( [ np.cosh( t - cconst.pi ), np.sqrt( 3.0 ) * np.sinh( t - cconst.pi ) ], axis = 1 )
+    u[ : 10000, 0 ] *= -1.0
+    R = np.array( [ [ np.cos( 0.3 ), -np.sin( 0.3 ) ], [ np.sin( 0.3 ), np.cos( 0.3 ) ] ] )
+    xy = np.block( [ [ u @ R.T + ( 1.0, 2.0 ), np.ones( ( u.shape[ 0 ], 1 ) ) ] ] )
+    C = fit_conic( xy )
+    assert C.classify() == 'hyperbole'
+    assert np.allclose( C.gform, C0.gform, atol = 1e-6 )
+
+    # A parabola and a pair of lines at a shifted origin. They are fitted
+    # at the origin ( 0, 0 ) and moved to the current one.
+    x = np.linspace( -3.0, 3.0, 200 )
+    for xy, kind in [ ( np.stack( [ x, x * x / 4 + 1.0 ], axis = 1 ), 'parabola' ),
+                      ( np.stack( [ x, np.where( x < 0.0, x, 2.0 - x ) ], axis = 1 ), 'crossing lines' ) ]:
+        M0 = fit_conic( xy ).gform
+        corigin.x = 1.0
+        corigin.y = -2.0
+        C = fit_conic( xy )
+        assert C.classify() == kind
+        assert np.allclose( C.gform, corigin.change_conics( M0[ np.newaxis ] )[ 0 ] )
+        X = np.block( [ [ xy - ( 1.0, -2.0 ), np.ones( ( 200, 1 ) ) ] ] )
+        assert np.allclose( np.einsum( 'ki,ij,kj->k', X, C.gform, X ), 0.0, atol = 1e-8 * np.linalg.norm( C.gform ) )
+        corigin.reset()
+
+    # Bad input.
+    for args, kwargs in [ ( ( xy[ : 4 ], ), {} ), ( ( xy, ), { 'method': 'parabola' } ),
+                          ( ( xy[ :, 0 ], ), {} ) ]:
+        try:
+            fit_conic( *args, **kwargs )
+            assert False
+        except CValueError:
+            pass
+
+def test_CConicFitter():
+    from pyConics import CConicFitter, cconst, corigin, fit_conic
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 2 )
+    t = rng.uniform( 0.0, 2.0 * cconst.pi, 4000 )
+    xy1 = np.stack( [ 2.0 * np.cos( t ) + 3.0, np.sin( t ) - 1.0 ], axis = 1 )
+    xy2 = np.stack( [ np.cos( t ), 0.5 * np.sin( t ) ], axis = 1 )
+
+    # Without forgetting, chunks give the batch fit.
+    F = CConicFitter( 'F' )
+    try:
+        F.conic()
+        assert False
+    except CValueError:
+        pass
+    for k in range( 0, 2000, 100 ):
+        F.update( xy1[ k : k + 100 ] + rng.normal( 0.0, 0.01, ( 100, 2 ) ) )
+    assert F.count == 2000
+    C = F.conic()
+    assert C.name == 'F'
+    assert np.allclose( C.canonical()[ 'center' ], ( 3.0, -1.0 ), atol = 1e-2 )
+    F.reset()
+    F.update( xy1 )
+    assert np.allclose( F.conic().gform, fit_conic( xy1 ).gform )
+
+    # The fit follows the stream when old points are forgotten.
+    for F in ( CConicFitter( forget = 0.99 ), CConicFitter( window = 5 ) ):
+        for k in range( 0, 4000, 100 ):
+            F.update( ( xy1 if ( k < 2000 ) else xy2 )[ k : k + 100 ] )
+        params = F.conic().canonical()
+        assert np.allclose( params[ 'center' ], ( 0.0, 0.0 ), atol = 1e-6 )
+        assert np.allclose( params[ 'axes' ], ( 1.0, 0.5 ), atol = 1e-6 )
+    assert F.count == 500
+
+    # A first chunk of a single point, and a window that drifts far away
+    # from the first chunks. The normalization follows the kept points.
+    xy3 = 0.1 * ( xy2 + rng.normal( 0.0, 0.01, ( 4000, 2 ) ) )
+    F = CConicFitter()
+    F.update( xy3[ 0 : 1 ] )
+    F.update( xy3[ 1 : ] )
+    M = fit_conic( xy3 ).gform
+    assert np.linalg.norm( F.conic().gform - M ) < 5e-4 * np.linalg.norm( M )
+    F = CConicFitter( window = 2 )
+    for k in range( 0, 4000, 100 ):
+        F.update( ( 100.0 * xy1 if ( k < 2000 ) else xy3 )[ k : k + 100 ] )
+    M = fit_conic( xy3[ 3800 : ] ).gform
+    assert np.linalg.norm( F.conic().gform - M ) < 1e-4 * np.linalg.norm( M )
+    assert F.count == 200
+
+    # A parabola at a shifted origin. The cached fit is moved to the
+    # origin of each call to conic().
+    x = np.linspace( -3.0, 3.0, 200 )
+    xy = np.stack( [ x, x * x / 4 + 1.0 ], axis = 1 )
+    F = CConicFitter()
+    F.update( xy )
+    M0 = F.conic().gform
+    corigin.x = 1.0
+    corigin.y = -2.0
+    C = F.conic()
+    assert C.classify() == 'parabola'
+    assert np.allclose( C.gform, corigin.change_conics( M0[ np.newaxis ] )[ 0 ] )
+    corigin.reset()
+    assert np.allclose( F.conic().gform, M0 )
+
+    # Bad arguments.
+    for kwargs in [ { 'method': 'parabola' }, { 'forget': 0.0 }, { 'window': 0 },
+                    { 'forget': 0.9, 'window': 3 } ]:
+        try:
+            CConicFitter( **kwargs )
+            assert False
+        except CValueError:
+            pass
+
+def test_CConic_from_points():
+    from pyConics import CConic, CConicArray, CPointArray
+    from pyConics.errors import CValueError
+
+    C0 = CConic( 2.0, 1.0, 0.5, CPoint( ( 0.5, -0.5 ) ), 'C0' )
+    C1 = CConic( 1.0, 2.0, -0.3, CPoint( ( 1.0, 2.0 ) ), 'C1' )        # hyperbole.
+
+    # Five points of each conic.
+    Q = []
+    for C, y in ( ( C0, -0.5 ), ( C1, 2.0 ) ):
+        P1, P2, valid = C.intersect_lines( np.array( [ [ 0.0, 1.0, -y - d ] for d in ( -0.5, 0.0, 0.5 ) ] ) )
+        assert valid.all()
+        Q.append( [ P1[ 0 ], P2[ 0 ], P1[ 1 ], P2[ 1 ], P1[ 2 ] ] )
+
+    # A sequence of points, a CPointArray and a ( 5, 3 )-matrix.
+    for C, P in zip( ( C0, C1 ), Q ):
+        P = [ p.gform for p in P ]
+        for arg in ( [ CPoint( p ) for p in P ], CPointArray( P ), np.array( P ) ):
+            assert np.allclose( CConic.from_points( arg, 'C' ).gform, C.gform )
+    assert CConic.from_points( CPointArray( np.array( P ) ), 'C' ).name == 'C'
+
+    # A point at the infinity is a direction of the conic.
+    C2 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, -2.0 ) ) ) )
+    P = np.array( [ [ 0, 0, 1 ], [ 1, 1, 1 ], [ 3, 3, 1 ], [ 0, 2, 1 ], [ 1, -1, 0 ] ], dtype = float )
+    assert CConic.from_points( P ).classify() == 'crossing lines'
+    assert all( CPoint( p ) in CConic.from_points( P ) for p in P[ : 4 ] )
+
+    # Four collinear points.
+    P = np.array( [ [ 0, 0, 1 ], [ 1, 0, 1 ], [ 2, 0, 1 ], [ 3, 0, 1 ], [ 0, 1, 1 ] ], dtype = float )
+    for R in ( P, P[ : 4 ] ):
+        try:
+            CConic.from_points( R )
+            assert False
+        except CValueError:
+            pass
+
+    # The points are related to the origin ( 0, 0 ).
+    from pyConics import corigin, fit_conic
+    corigin.x = 1.0
+    corigin.y = 2.0
+    P = np.array( [ p.from_origin for p in Q[ 0 ] ] )
+    assert np.allclose( CConic.from_points( P ).gform, CConic( 2.0, 1.0, 0.5, CPoint( ( 0.5, -0.5 ) ) ).gform )
+    P = np.array( [ [ t * t, t, 1.0 ] for t in ( -2.0, -1.0, 0.0, 1.0, 3.0 ) ] )
+    for C in ( CConic.from_points( P ), fit_conic( P ) ):
+        assert C.classify() == 'parabola'
+        assert np.allclose( C.canonical()[ 'foci' ][ 0 ], ( 0.25 - 1.0, -2.0 ) )
+    corigin.reset()
+
+    # Batched version. The last conic is not unique.
+    P = np.array( [ [ 0, 0, 1 ], [ 1, 0, 1 ], [ 2, 0, 1 ], [ 3, 0, 1 ], [ 0, 1, 1 ] ], dtype = float )
+    P = np.array( [ [ p.gform for p in Q[ 0 ] ], [ p.gform for p in Q[ 1 ] ], P ] )
+    CC = CConicArray.from_points( P, 'CC' )
+    assert np.allclose( CC.gform[ 0 ], C0.gform ) and np.allclose( CC.gform[ 1 ], C1.gform )
+    assert list( CC.classify() ) == [ 'ellipse', 'hyperbole', 'null' ]
+    assert np.allclose( CConicArray.from_points( CPointArray( P.reshape( -1, 3 ) ) ).gform, CC.gform )
+
+def test_CConic_tangents_from():
+    from pyConics import CConic, CPointArray, CLineArray, cconst
+    from pyConics.utils import are_parallel
+
+    C0 = CConic( name = 'C0' )                                          # unit circle.
+    C1 = CConic( 1.0, 2.0, 0.3, CPoint( ( 1.0, 2.0 ) ), 'C1' )          # hyperbole.
+    C2 = CConic( degenerate = ( CLine( ( 1.0, -1.0, 0.0 ) ), CLine( ( 1.0, 1.0, 0.0 ) ) ), name = 'C2' )
+
+    # Exterior, on the conic, interior and at the infinity.
+    P = CPointArray( np.array( [ [ 1.0, 1.0, 1.0 ], [ 0.0, 1.0, 1.0 ], [ 0.1, 0.2, 1.0 ], [ 1.0, 0.0, 0.0 ] ] ) )
+    L1, L2, valid = C0.tangents_from( P )
+    assert isinstance( L1, CLineArray ) and isinstance( L2, CLineArray )
+    assert valid.tolist() == [ [ True, True ], [ True, False ], [ False, False ], [ True, True ] ]
+    assert { tuple( np.round( l / l[ np.argmax( np.abs( l ) ) ], 6 ) ) for l in ( L1.gform[ 0 ], L2.gform[ 0 ] ) } == \
+           { ( 1.0, 0.0, -1.0 ), ( 0.0, 1.0, -1.0 ) }
+    assert L1[ 1 ] == CLine( ( 0.0, 1.0, -1.0 ) )
+    assert are_parallel( L1[ 3 ], CLine( ( 0.0, 1.0, 0.0 ) ) ) and are_parallel( L2[ 3 ], CLine( ( 0.0, 1.0, 0.0 ) ) )
+
+    # Each valid line passes through its point and touches the conic once.
+    rng = np.random.default_rng( 3 )
+    P = CPointArray( rng.uniform( -6.0, 6.0, ( 200, 2 ) ) )
+    for C in ( C0, C1 ):
+        L1, L2, valid = C.tangents_from( P )
+        assert valid.any()
+        for L, ok in ( ( L1, valid[ :, 0 ] ), ( L2, valid[ :, 1 ] ) ):
+            assert np.allclose( np.sum( L.gform[ ok ] * P.gform[ ok ], axis = 1 ), 0.0, atol = 1e-8 )
+            _, _, v = C.intersect_lines( L[ ok ] )
+            assert ( v[ :, 0 ] & ~v[ :, 1 ] ).all()
+        assert not ( valid[ :, 1 ] & ~valid[ :, 0 ] ).any()
+
+    # A single point and a degenerate conic.
+    L1, L2, valid = C0.tangents_from( CPoint( ( 2.0, 0.0 ) ) )
+    assert valid.tolist() == [ [ True, True ] ]
+    assert np.isclose( abs( L1.gform[ 0, 1 ] / L1.gform[ 0, 0 ] ), np.sqrt( 3.0 ) )
+    assert not C2.tangents_from( P )[ 2 ].any()
+
+def test_tdoa_hyperbolae():
+    from pyConics import CConic, CPointArray, tdoa_hyperbolae, station_pairs
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 4 )
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ], [ 5.0, -3.0 ] ] )
+    X = rng.uniform( -5.0, 15.0, ( 50, 2 ) )
+    pairs = station_pairs( 5 )
+    assert pairs.shape == ( 10, 2 )
+    D = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 )
+    R = D[ :, pairs[ :, 0 ] ] - D[ :, pairs[ :, 1 ] ]
+
+    # One hyperbole for each emitter and pair, which holds the emitter in
+    # the branch given by the sign.
+    CC, branch, valid = tdoa_hyperbolae( CPointArray( S ), R, name = 'H' )
+    assert len( CC ) == 500 and branch.shape == R.shape and valid.all()
+    M = CC.gform.reshape( 50, 10, 3, 3 )
+    Xh = np.block( [ [ X, np.ones( ( 50, 1 ) ) ] ] )
+    assert np.allclose( np.einsum( 'ki,kpij,kj->kp', Xh, M, Xh ), 0.0, atol = 1e-8 )
+    m = ( S[ pairs[ :, 0 ] ] + S[ pairs[ :, 1 ] ] ) / 2
+    u = S[ pairs[ :, 1 ] ] - S[ pairs[ :, 0 ] ]
+    assert ( branch * np.sum( ( X[ :, np.newaxis ] - m ) * u, axis = 2 ) >= 0.0 ).all()
+
+    # The matrices are equal to the ones of the foci constructor.
+    for p in range( 10 ):
+        i, j = pairs[ p ]
+        C = CConic( abs( R[ 0, p ] ) / 2, foci = ( CPoint( tuple( S[ i ] ) ), CPoint( tuple( S[ j ] ) ) ) )
+        assert np.allclose( CC.gform[ p ], C.gform, atol = 1e-4 * np.linalg.norm( C.gform ) )
+
+    # A copy is equal to the stack and follows the origin as it does.
+    from pyConics import corigin
+    DD = CC.copy()
+    assert np.array_equal( DD.gform, CC.gform ) and np.array_equal( DD.rank, CC.rank )
+    assert ( DD.rank == 3 ).all()
+    corigin.x = 2.0
+    corigin.y = -1.0
+    try:
+        CC.update_origin()
+        DD.update_origin()
+        assert np.array_equal( DD.gform, CC.gform )
+        EE = CC.copy()
+        EE.update_origin()
+        assert np.array_equal( EE.gform, CC.gform )
+    finally:
+        corigin.reset()
+    DD.update_origin()
+    assert np.allclose( DD.gform, M.reshape( 500, 3, 3 ) )
+
+    # A zero range difference is the bisector and a too large one is invalid.
+    CC, branch, valid = tdoa_hyperbolae( S[ : 2 ], [ 0.0, 9.0, 10.0, -12.0 ], [ ( 0, 1 ) ] * 4 )
+    assert valid.tolist() == [ True, True, False, False ]
+    assert branch.tolist() == [ 0.0, 1.0, 0.0, 0.0 ]
+    assert list( CC.classify() ) == [ 'double line', 'hyperbole', 'null', 'null' ]
+    assert CPoint( ( 5.0, 7.0 ) ) in CC[ 0 ]
+
+    # Bad input.
+    for args in [ ( S, R[ :, : 3 ] ), ( S, R, [ ( 0, 5 ) ] * 10 ), ( S[ :, 0 ], R ) ]:
+        try:
+            tdoa_hyperbolae( *args )
+            assert False
+        except CValueError:
+            pass
+
+def test_solve_tdoa():
+    from pyConics import CPointArray, solve_tdoa
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 5 )
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ], [ 5.0, -3.0 ] ] )
+    X = rng.uniform( -5.0, 15.0, ( 200, 2 ) )
+    b = rng.uniform( -50.0, 50.0, ( 200, 1 ) )
+    rho = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 ) + b
+
+    # Exact measurements give the emitters back.
+    P, cov, valid = solve_tdoa( CPointArray( S ), rho )
+    assert len( P ) == 200 and cov.shape == ( 200, 2, 2 ) and valid.all()
+    assert np.allclose( P.gform[ :, 0 : 2 ], X, atol = 1e-6 )
+    assert np.allclose( cov, np.swapaxes( cov, 1, 2 ) )
+    assert ( np.linalg.eigvalsh( cov ) > 0.0 ).all()
+
+    # The covariances scale with sigma^2 and agree with the spread of
+    # the noisy estimates.
+    _, cov2, _ = solve_tdoa( S, rho, sigma = 0.1 )
+    assert np.allclose( cov2, 0.01 * cov )
+    x0 = np.array( [ 3.0, 4.0 ] )
+    rho0 = np.linalg.norm( x0 - S, axis = 1 ) + 7.0
+    noisy = rho0 + rng.normal( 0.0, 0.01, ( 2000, 5 ) )
+    P, cov, valid = solve_tdoa( S, noisy, sigma = 0.01 )
+    assert valid.all()
+    spread = np.cov( P.gform[ :, 0 : 2 ].T )
+    assert np.allclose( spread, cov.mean( axis = 0 ), rtol = 0.2, atol = 1e-6 )
+
+    # Emitters outside the hull of the stations have a poor geometry,
+    # which shows in their covariances, not in their validity.
+    S4 = S[ 0 : 4 ]
+    Y = rng.uniform( -30.0, 40.0, ( 2000, 2 ) )
+    rho4 = np.linalg.norm( Y[ :, np.newaxis ] - S4, axis = 2 ) + rng.uniform( 0.0, 100.0, ( 2000, 1 ) )
+    rho4 += rng.normal( 0.0, 0.01, rho4.shape )
+    P, cov, valid = solve_tdoa( S4, rho4, sigma = 0.01 )
+    assert valid.sum() >= 0.99 * 2000
+    err = P.gform[ valid, 0 : 2 ] - Y[ valid ]
+    d2 = np.einsum( 'ei,eij,ej->e', err, np.linalg.inv( cov[ valid ] ), err )
+    assert 1.5 < d2.mean() < 2.5
+
+    # Missing measurements are NaN. An emitter needs 3 stations.
+    rho = rho[ : 3 ].copy()
+    rho[ 0, 1 ] = np.nan
+    rho[ 1, 0 : 2 ] = np.nan
+    rho[ 2, 0 : 3 ] = np.nan
+    P, cov, valid = solve_tdoa( S, rho )
+    assert valid.tolist() == [ True, True, False ]
+    assert np.allclose( P.gform[ 0 : 2, 0 : 2 ], X[ 0 : 2 ], atol = 1e-6 )
+    assert np.all( P.gform[ 2 ] == 0.0 ) and np.isnan( cov[ 2 ] ).all()
+
+    # Bad input.
+    for args in [ ( S, rho[ :, : 4 ] ), ( S, rho[ 0 ] ) ]:
+        try:
+            solve_tdoa( *args )
+            assert False
+        except CValueError:
+            pass
+
+def test_CMlatPipeline():
+    from pyConics import CMlatPipeline, station_pairs
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 6 )
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )
+    X = rng.uniform( 0.0, 10.0, ( 500, 2 ) )
+    rho = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 ) + rng.uniform( 0.0, 50.0, ( 500, 1 ) )
+    records = np.stack( [ np.repeat( np.arange( 500 ), 4 ), np.tile( np.arange( 4 ), 500 ),
+                         rho.reshape( -1 ) ], axis = 1 )
+    records = records[ np.argsort( np.arange( 2000 ) + rng.uniform( 0.0, 20.0, 2000 ) ) ]
+
+    # Out of order records, one at a time. Every event is solved once and
+    # the pending buffer never exceeds max_pending.
+    pipeline = CMlatPipeline( S, 'H', chunk_size = 64, max_pending = 100, hyperbolae = True )
+    seen = []
+    for ids, P, cov, valid, CC in pipeline.run( map( tuple, records ) ):
+        assert pipeline.pending <= 100
+        assert valid.all() and cov.shape == ( len( ids ), 2, 2 )
+        assert np.allclose( P.gform[ :, 0 : 2 ], X[ ids ], atol = 1e-6 )
+        assert len( CC ) == 6 * len( ids )
+        seen.append( ids )
+    seen = np.concatenate( seen )
+    assert sorted( seen.tolist() ) == list( range( 500 ) )
+    stats = pipeline.stats
+    assert stats[ 'ingest' ][ 'items' ] == 2000 and stats[ 'solve' ][ 'items' ] == 500
+    assert stats[ 'build' ][ 'items' ] == 500 * len( station_pairs( 4 ) )
+    assert pipeline.pending == 0 and pipeline.dropped == 0
+
+    # Chunks of records. Without max_pending, the events that miss a
+    # station wait until the end of the stream. The ones with less than 3
+    # stations are dropped.
+    part = records[ ~( ( records[ :, 0 ] < 10 ) & ( records[ :, 1 ] == 0 ) ) ]
+    part = part[ ~( ( part[ :, 0 ] < 5 ) & ( part[ :, 1 ] == 1 ) ) ]
+    pipeline = CMlatPipeline( S, chunk_size = 300 )
+    out = list( pipeline.run( [ part[ : 1000 ], part[ 1000 : ] ], flush = False ) )
+    assert sum( len( o[ 0 ] ) for o in out ) == 490 and out[ 0 ][ 4 ] is None
+    assert pipeline.pending == 10
+    out = list( pipeline.run( [] ) )
+    assert sorted( out[ 0 ][ 0 ].tolist() ) == list( range( 5, 10 ) )
+    assert np.allclose( out[ 0 ][ 1 ].gform[ :, 0 : 2 ], X[ out[ 0 ][ 0 ] ], atol = 1e-6 )
+    assert pipeline.pending == 0 and pipeline.dropped == 5
+
+    # Late records. Event 0 is taken out with 3 stations before its last
+    # record shows up, and the records of event 1 are sent twice. The late
+    # records are dropped, unless no ids are kept.
+    ordered = records[ np.lexsort( ( records[ :, 1 ], records[ :, 0 ] ) ) ][ : 80 ]
+    stream = np.concatenate( [ ordered[ [ 0, 1, 2 ] ], ordered[ 4 : ], ordered[ [ 3 ] ], ordered[ 4 : 8 ] ] )
+    for max_done, late, dropped in [ ( 100, 5, 0 ), ( 0, 0, 1 ) ]:
+        pipeline = CMlatPipeline( S, chunk_size = 4, max_pending = 1, max_done = max_done )
+        ids = np.concatenate( [ o[ 0 ] for o in pipeline.run( map( tuple, stream ) ) ] )
+        assert pipeline.late == late and pipeline.dropped == dropped
+        if ( max_done > 0 ):
+            assert sorted( ids.tolist() ) == list( range( 20 ) )
+        else:
+            assert sorted( ids.tolist() ) == [ 0, 1 ] + list( range( 1, 20 ) )
+
+    # Event ids beyond 2^53 are kept exact, as tuples or as chunks of
+    # RECORD dtype.
+    from pyConics.mlat.pipeline import RECORD
+    base = 1_760_000_000_000_000_001
+    big = np.empty( 2000, dtype = RECORD )
+    big[ 'event' ] = base + records[ :, 0 ].astype( np.int64 )
+    big[ 'station' ] = records[ :, 1 ]
+    big[ 'rho' ] = records[ :, 2 ]
+    tuples = [ ( base + int( e ), int( i ), r ) for e, i, r in records ]
+    for stream in [ tuples, [ big[ : 1000 ], big[ 1000 : ] ] ]:
+        pipeline = CMlatPipeline( S, chunk_size = 64, max_pending = 100 )
+        out = list( pipeline.run( stream ) )
+        ids = np.concatenate( [ o[ 0 ] for o in out ] )
+        assert ids.dtype == np.int64 and sorted( ( ids - base ).tolist() ) == list( range( 500 ) )
+        for o in out:
+            assert np.allclose( o[ 1 ].gform[ :, 0 : 2 ], X[ o[ 0 ] - base ], atol = 1e-6 )
+        assert pipeline.dropped == 0
+        assert all( o[ 4 ] is None for o in out ) and pipeline.stats[ 'build' ][ 'items' ] == 0
+
+    # Bad input.
+    for kwargs in [ { 'chunk_size': 0 }, { 'max_pending': -1 }, { 'max_done': -1 } ]:
+        try:
+            CMlatPipeline( S, **kwargs )
+            assert False
+        except CValueError:
+            pass
+    try:
+        list( CMlatPipeline( S ).run( [ records[ :, 0 : 2 ] ] ) )
+        assert False
+    except CValueError:
+        pass
+
+def test_CMlatPool():
+    import os
+    from pyConics import CPointArray, CMlatPool, solve_tdoa
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 7 )
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ], [ 5.0, -3.0 ] ] )
+    X = rng.uniform( -5.0, 15.0, ( 1000, 2 ) )
+    rho = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 ) + rng.normal( 0.0, 0.01, ( 1000, 5 ) )
+    rho[ 0 : 10, 0 ] = np.nan
+    rho[ 10, 0 : 3 ] = np.nan
+    sigma = rng.uniform( 0.005, 0.02, rho.shape )
+
+    # The shards give the same results as the serial solver.
+    P0, cov0, valid0 = solve_tdoa( S, rho, sigma = sigma )
+    with CMlatPool( CPointArray( S ), workers = 2 ) as pool:
+        assert pool.workers == 2
+        for shard_size in [ 64, 333, None ]:
+            P, cov, valid = pool.solve_tdoa( rho, sigma = sigma, shard_size = shard_size )
+            assert ( valid == valid0 ).all() and not valid[ 10 ]
+            assert np.allclose( P.gform, P0.gform )
+            assert np.allclose( cov[ valid ], cov0[ valid ] ) and np.isnan( cov[ 10 ] ).all()
+
+        # The workers do not keep the shared memory of a batch mapped
+        # after it ( on Linux, where their maps can be read ).
+        for pid in pool._executor._processes:
+            if ( os.path.exists( f'/proc/{pid}/maps' ) ):
+                with open( f'/proc/{pid}/maps' ) as f:
+                    assert '/dev/shm/psm_' not in f.read()
+    try:
+        pool.solve_tdoa( rho )
+        assert False
+    except CValueError:
+        pass
+
+    # Pools leave nothing on stderr, e.g. warnings of resource trackers
+    # about leaked shared memory, whatever the start method is.
+    import sys
+    import multiprocessing as mp
+    code = ( 'import sys, numpy as np, multiprocessing as mp\n'
+             'from pyConics import CMlatPool\n'
+             'if __name__ == "__main__":\n'
+             '    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ] ] )\n'
+             '    rho = np.random.default_rng( 0 ).uniform( 0.0, 20.0, ( 2000, 4 ) )\n'
+             '    for _ in range( 2 ):\n'
+             '        with CMlatPool( S, 2, mp.get_context( sys.argv[ 1 ] ) ) as pool:\n'
+             '            pool.solve_tdoa( rho, shard_size = 500 )\n'
+             '            pool.solve_tdoa( rho, shard_size = 500 )\n' )
+    for method in mp.get_all_start_methods():
+        r = sp.run( [ sys.executable, '-c', code, method ], capture_output = True, text = True )
+        assert ( r.returncode == 0 ) and ( r.stderr == '' ), r.stderr
+
+    # Bad input.
+    try:
+        CMlatPool( S, workers = 0 )
+        assert False
+    except CValueError:
+        pass
+
+def test_CStations():
+    from pyConics import CConic, CPointArray, CStations, tdoa_hyperbolae, solve_tdoa, CMlatPipeline
+    from pyConics.errors import CValueError
+
+    rng = np.random.default_rng( 8 )
+    S = np.array( [ [ 0.0, 0.0 ], [ 10.0, 0.0 ], [ 10.0, 10.0 ], [ 0.0, 10.0 ], [ 5.0, -3.0 ] ] )
+    stations = CStations( CPointArray( S ), name = 'S' )
+    assert len( stations ) == 5 and stations.pairs.shape == ( 10, 2 )
+    i, j = stations.pairs[ :, 0 ], stations.pairs[ :, 1 ]
+    assert np.allclose( stations.baselines, np.linalg.norm( S[ j ] - S[ i ], axis = 1 ) )
+    assert np.allclose( stations.centers, ( S[ i ] + S[ j ] ) / 2 )
+    d = S[ j ] - S[ i ]
+    assert np.allclose( stations.angles, np.arctan2( d[ :, 1 ], d[ :, 0 ] ) )
+    R = stations.rotations
+    assert np.allclose( R @ np.swapaxes( R, 1, 2 ), np.eye( 2 ) )
+
+    # The transforms take the stations of each pair to ( -c, 0 ) and ( c, 0 ).
+    c = stations.baselines / 2
+    T = stations.transforms
+    assert np.allclose( np.einsum( 'pij,pj->pi', T, np.block( [ S[ i ], np.ones( ( 10, 1 ) ) ] ) )[ :, 0 ], -c )
+    assert np.allclose( np.einsum( 'pij,pj->pi', T, np.block( [ S[ j ], np.ones( ( 10, 1 ) ) ] ) )[ :, 0 : 2 ],
+                        np.stack( [ c, np.zeros( 10 ) ], axis = 1 ) )
+
+    # The hyperbolae are the ones of the foci constructor and the ones of
+    # tdoa_hyperbolae from the coords.
+    X = rng.uniform( -5.0, 15.0, ( 20, 2 ) )
+    D = np.linalg.norm( X[ :, np.newaxis ] - S, axis = 2 )
+    rdiff = D[ :, i ] - D[ :, j ]
+    for p in range( 10 ):
+        H = stations.hyperbola( p, rdiff[ 0, p ], 'H' )
+        C = CConic( abs( rdiff[ 0, p ] ) / 2, foci = ( CPoint( tuple( S[ i[ p ] ] ) ), CPoint( tuple( S[ j[ p ] ] ) ) ) )
+        assert np.allclose( H.gform, C.gform, atol = 1e-4 * np.linalg.norm( C.gform ) )
+    CC1, branch1, valid1 = tdoa_hyperbolae( stations, rdiff )
+    CC2, branch2, valid2 = tdoa_hyperbolae( S, rdiff )
+    assert np.allclose( CC1.gform, CC2.gform ) and ( branch1 == branch2 ).all() and ( valid1 == valid2 ).all()
+    assert stations.hyperbola( 0, 0.0 ).classify() == 'double line'
+
+    # Other pairs than the ones of the geometry.
+    CC, _, _ = tdoa_hyperbolae( stations, rdiff[ :, 0 : 2 ], stations.pairs[ 0 : 2 ] )
+    assert np.allclose( CC.gform.reshape( 20, 2, 3, 3 ), CC1.gform.reshape( 20, 10, 3, 3 )[ :, 0 : 2 ] )
+
+    # The solver and the pipeline take the stations as well.
+    rho = D + 3.0
+    P, _, valid = solve_tdoa( stations, rho )
+    assert valid.all() and np.allclose( P.gform[ :, 0 : 2 ], X, atol = 1e-6 )
+    pipeline = CMlatPipeline( CStations( S, [ ( 0, 1 ), ( 2, 3 ) ] ), hyperbolae = True )
+    records = np.stack( [ np.repeat( np.arange( 20 ), 5 ), np.tile( np.arange( 5 ), 20 ), rho.reshape( -1 ) ], axis = 1 )
+    ( ids, P, _, valid, CC ), = list( pipeline.run( [ records ] ) )
+    assert len( CC ) == 40 and np.allclose( P.gform[ :, 0 : 2 ], X[ ids ], atol = 1e-6 )
+
+    # Bad input.
+    for args in [ ( S, [ ( 0, 5 ) ] ), ( S, [ 0, 1 ] ), ( S[ :, 0 ], ) ]:
+        try:
+            CStations( *args )
+            assert False
+        except CValueError:
+            pass
+    try:
+        stations.hyperbola( 0, 10.0 )
+        assert False
+    except CValueError:
+        pass
+
+def test_CConic_intersect_large_scale():
+    from pyConics import CConic
+    from pyConics.conics.utils import intersect_conics_many
+
+    def circle( cx: float, cy: float, r: float ) -> np.ndarray:
+        return np.array( [ [ 1.0, 0.0, -cx ], [ 0.0, 1.0, -cy ], [ -cx, -cy, cx * cx + cy * cy - r * r ] ] )
+
+    def expected( o: float, s: float ) -> np.ndarray:
+        h = s * np.sqrt( 3 ) / 2
+        return np.array( [ [ o + s / 2, o - h ], [ o + s / 2, o + h ] ] )
+
+    # A circle of radius s and the same circle shifted by s meet at
+    # ( s / 2, +-s * sqrt( 3 ) / 2 ), at any scale.
+    for s, o in [ ( 1.0, 0.0 ), ( 1e3, 0.0 ), ( 1e4, 0.0 ), ( 1.0, 5.0 ), ( 1e3, 2e3 ) ]:
+        C1 = CConic.from_matrix( circle( o, o, s ), 'C1' )
+        C2 = CConic.from_matrix( circle( o + s, o, s ), 'C2' )
+        P = C1.intersect( C2 )
+        assert len( P ) == 2
+        xy = np.array( [ P[ k ].gform[ 0 : 2 ] / P[ k ].gform[ 2 ] for k in range( 2 ) ] )
+        xy = xy[ np.argsort( xy[ :, 1 ] ) ]
+        assert np.allclose( xy, expected( o, s ), rtol = 0.0, atol = 1e-6 * s )
+
+    # The same for the batched kernel, far from the origin.
+    S = np.array( [ 1.0, 1e3, 1e4, 1e6 ] )
+    O = 5.0 * S
+    C1 = np.stack( [ circle( o, o, s ) for s, o in zip( S, O ) ] )
+    C2 = np.stack( [ circle( o + s, o, s ) for s, o in zip( S, O ) ] )
+    P, valid = intersect_conics_many( C1, C2 )
+    assert list( valid.sum( axis = 1 ) ) == [ 2, 2, 2, 2 ]
+    for k in range( 4 ):
+        xy = P[ k, valid[ k ], 0 : 2 ] / P[ k, valid[ k ], 2 : 3 ]
+        xy = xy[ np.argsort( xy[ :, 1 ] ) ]
+        assert np.allclose( xy, expected( O[ k ], S[ k ] ), rtol = 0.0, atol = 1e-6 * S[ k ] )
+
+def test_CConic_update_origin():
+    from pyConics import CConic, corigin
+    from pyConics.conics.utils import rank
+
+    # A parabola y = x^2 and the crossing lines x^2 - y^2 = 0, which are
+    # not built by the constructor.
+    M1 = np.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, 0.0, -0.5 ], [ 0.0, -0.5, 0.0 ] ] )
+    M2 = np.array( [ [ 1.0, 0.0, 0.0 ], [ 0.0, -1.0, 0.0 ], [ 0.0, 0.0, 0.0 ] ] )
+    C1 = CConic.from_matrix( M1, 'C1' )
+    C2 = CConic.from_matrix( M2, 'C2' )
+    C3 = CConic.from_points( np.array( [ [ x, x * x, 1.0 ] for x in range( -2, 3 ) ] ), 'C3' )
+    C4 = CConic( 2.0, 1.0, 0.5, CPoint( ( 0.5, -0.5 ) ), 'C4' )
+    C5 = C4.copy()
+    p1 = CPoint( ( 2.0, 4.0 ) )
+    p2 = CPoint( ( 3.0, -3.0 ) )
+    p4 = CPoint( ( 0.5 + 2.0 * np.cos( 0.5 ), -0.5 + 2.0 * np.sin( 0.5 ) ) )  # a vertex of C4.
+
+    # The points of the conics are still on them in the new origin.
+    corigin.x = 1.0
+    corigin.y = -2.0
+    try:
+        for C in [ C1, C2, C3, C4, C5 ]:
+            rk = C.rank
+            C.update_origin()
+            assert C.rank == rk == rank( C.gform )
+        for p in [ p1, p2, p4 ]:
+            p.update_origin()
+        assert ( p1 in C1 ) and ( p1 in C3 ) and ( p2 in C2 )
+        assert ( p4 in C4 ) and ( p4 in C5 )
+        S = np.array( [ [ 1.0, 0.0, 1.0 ], [ 0.0, 1.0, -2.0 ], [ 0.0, 0.0, 1.0 ] ] )
+        assert np.allclose( C2.gform, S.T @ M2 @ S )
+        assert np.allclose( C4.center().gform, ( -0.5, 1.5, 1.0 ) )
+
+        # Moving to the same origin again does not change anything.
+        G = C1.gform.copy()
+        C1.update_origin()
+        assert np.allclose( C1.gform, G )
+    finally:
+        corigin.reset()
+    for C in [ C1, C2, C3, C4 ]:
+        C.update_origin()
+    assert np.allclose( C1.gform, M1 ) and np.allclose( C2.gform, M2 )
+
 #------------------------------------------------------------------
 # For development and test.
 #  
@@ -104,3 +1250,107 @@ if __name__ == '__main__':
     # Test to check if he shift of origin is working well.
     test_origin()
     print()
+
+    # Test to check if CPointArray has the same semantics of CPoint.
+    test_CPointArray()
+    print()
+
+    # Test to check if CLineArray has the same semantics of CLine.
+    test_CLineArray()
+    print()
+
+    # Test to check if the broadcasting cross product works well.
+    test_cross()
+    print()
+
+    # Test to check if the matrices of distances are ok.
+    test_distance_matrix()
+    print()
+
+    # Test to check if CConic.contains_many() is ok.
+    test_CConic_contains_many()
+    print()
+
+    # Test to check if CConicArray has the same semantics of CConic.
+    test_CConicArray()
+    print()
+
+    # Test to check if the trusted constructors are ok.
+    test_trusted_constructors()
+    print()
+
+    # Test to check if the geometric objects have no __dict__.
+    test_slots()
+    print()
+
+    # Test to check if pyConics is imported without the plotting stack.
+    test_headless_import()
+    print()
+
+    # Test to check if CConic.sequence() samples the conics analytically.
+    test_CConic_sequence()
+    print()
+
+    # Test to check if the marching squares extractor is ok.
+    test_contour_conic()
+    print()
+
+    # Test to check if CConic.intersect_lines() is ok.
+    test_CConic_intersect_lines()
+    print()
+
+    # Test to check if the intersection between conics is ok.
+    test_CConic_intersect()
+    print()
+
+    # Test to check if CConic caches its derived quantities.
+    test_CConic_cache()
+    print()
+
+    # Test to check if the canonical parameters of conics are recovered.
+    test_CConic_canonical()
+    print()
+
+    # Test to check if conics are fitted to point sets.
+    test_fit_conic()
+    print()
+
+    # Test to check if conics are fitted to streams of points.
+    test_CConicFitter()
+    print()
+
+    # Test to check if conics are built through five points.
+    test_CConic_from_points()
+    print()
+
+    # Test to check if tangent lines are got from points.
+    test_CConic_tangents_from()
+    print()
+
+    # Test to check if TDOA hyperbolae are built.
+    test_tdoa_hyperbolae()
+    print()
+
+    # Test to check if emitters are located by multilateration.
+    test_solve_tdoa()
+    print()
+
+    # Test to check if streams of arrival times are located.
+    test_CMlatPipeline()
+    print()
+
+    # Test to check if emitters are located by a pool of processes.
+    test_CMlatPool()
+    print()
+
+    # Test to check if the station geometry is precomputed.
+    test_CStations()
+    print()
+
+    # Test to check if intersect works for large conics.
+    test_CConic_intersect_large_scale()
+    print()
+
+    # Test to check if update_origin moves conics of any kind.
+    test_CConic_update_origin()
+    print()